@@ -3,14 +3,17 @@
 Main game entry point with scene management and keyboard shortcuts.
 """
 
+import argparse
 import pygame
 import sys
 import os
+import time
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from src.core import Scene, SceneManager, Player, load_assets
+from src.core import alloc_tracker, frame_pacer, gc_policy, hitch, memstats, profiler, render_backend
 from src.scenes import (
     BumbleSplashScene, BumbleScene, DriveScene,
     ApartmentScene, DisneyScene, MovingScene,
@@ -31,6 +34,10 @@ class GameConfig:
         self.screen_height = SCREEN_HEIGHT
         self.fps = FPS
         self.title = GAME_TITLE
+        self.renderer = render_backend.SURFACE  # or render_backend.SDL2
+        self.hitch_budget_ms = hitch.DEFAULT_BUDGET_MS  # log frames slower than this (0: off)
+        self.gc_policy = False  # schedule garbage collections between frames (see gc_policy)
+        self.idle_throttle = True  # wait for input on static screens, slow down in the background (see frame_pacer)
         
         # Scene shortcuts: Key number -> (Scene class, Display name)
         self.scene_shortcuts = {
@@ -49,15 +56,19 @@ class Game:
     def __init__(self, config: GameConfig):
         self.config = config
         self.screen = None
-        self.clock = None
+        self.backend = None
+        self.pacer = None
         self.manager = None
+        self.hitches = None  # hitch.HitchDetector while run() is going
+        self.gc = None  # gc_policy.GCPolicy while run() is going, with config.gc_policy
         self.running = False
         
     def initialize(self):
         """Initialize Pygame and game systems."""
         pygame.init()
         
-        # Initialize mixer for music support
+        # Initialize mixer for music support (each scene's track is read into
+        # memory in the background by SceneManager before the scene starts)
         pygame.mixer.init()
         
         # Load assets
@@ -69,14 +80,16 @@ class Game:
         # Center window on screen
         os.environ['SDL_VIDEO_CENTERED'] = '1'
         
-        # Create window
-        self.screen = pygame.display.set_mode(
-            (self.config.screen_width, self.config.screen_height)
+        # Create window (display Surface, or an SDL2 renderer with --renderer sdl2)
+        self.backend = render_backend.create_backend(
+            self.config.renderer,
+            (self.config.screen_width, self.config.screen_height),
+            self.config.title
         )
-        pygame.display.set_caption(self.config.title)
+        self.screen = getattr(self.backend, 'screen', None)
         
-        # Create clock and scene manager
-        self.clock = pygame.time.Clock()
+        # Create frame pacer and scene manager
+        self.pacer = frame_pacer.FramePacer(self.config.fps, adaptive=self.config.idle_throttle)
         self.manager = SceneManager()
         
         # Start with splash screen
@@ -95,6 +108,21 @@ class Game:
             # M for menu
             elif event.key == pygame.K_M:
                 self.manager.go_to(MenuScene(self.manager))
+            
+            # F9 prints surface memory by owner
+            elif event.key == pygame.K_F9:
+                print(memstats.format_report(memstats.report(self.manager)))
+                memstats.check_finished(force=True)
+            
+            # F10 writes a Chrome trace of the next frames, F11 toggles per-scene cProfile captures
+            elif event.key == pygame.K_F10:
+                profiler.start_trace()
+            elif event.key == pygame.K_F11:
+                profiler.toggle_profile(self.manager.scene)
+            
+            # F12 toggles the allocation tracker (prints its report when switched off)
+            elif event.key == pygame.K_F12:
+                alloc_tracker.toggle()
                 
             # Number keys for scene shortcuts
             elif event.key in self.config.scene_shortcuts:
@@ -117,33 +145,106 @@ class Game:
     
     def draw(self):
         """Render the current frame."""
-        self.manager.draw(self.screen)
-        pygame.display.flip()
+        canvas = self.backend.begin_frame()
+        self.manager.draw_canvas(canvas)
+        self.backend.present()
     
     def run(self):
         """Main game loop."""
         self.running = True
+        if self.config.hitch_budget_ms > 0:
+            self.hitches = hitch.HitchDetector(self.config.hitch_budget_ms)
+        if self.config.gc_policy:
+            self.gc = gc_policy.GCPolicy()
+            self.gc.install(self.manager.scene)
         
         while self.running:
-            # Calculate delta time
-            dt = self.clock.tick(self.config.fps) / 1000.0
-            
-            # Handle events
-            for event in pygame.event.get():
-                self.handle_input(event)
+            # Wait for the next frame (or for input on a static screen) and get the delta time
+            dt = self.pacer.tick(self.manager.idle_time())
+            frame_start = time.perf_counter()
             
-            # Update and draw
-            self.update(dt)
-            self.draw()
+            if self.hitches:
+                self.hitches.begin_frame(type(self.manager.scene).__name__)
+            with profiler.frame():
+                # Handle events
+                if self.hitches:
+                    self.hitches.enter('event')
+                for event in self.pacer.events():
+                    self.handle_input(event)
+                
+                # Update and draw
+                if self.hitches:
+                    self.hitches.enter('update')
+                self.update(dt)
+                if self.hitches:
+                    self.hitches.enter('draw')
+                if self.pacer.visible:
+                    self.draw()
+            alloc_tracker.end_frame(self.manager.scene)
+            if self.hitches:
+                self.hitches.end_frame(type(self.manager.scene).__name__)
+            if self.gc:
+                idle_ms = 1000.0 / self.config.fps - (time.perf_counter() - frame_start) * 1000
+                self.gc.end_frame(self.manager.scene, self.manager.loading, idle_ms)
     
     def shutdown(self):
         """Clean up and exit."""
+        profiler.stop_trace()
+        profiler.stop_profile()
+        if alloc_tracker.ENABLED:
+            alloc_tracker.disable()
+            print(alloc_tracker.format_report())
+        if self.hitches:
+            self.hitches.close()
+            self.hitches = None
+        if self.gc:
+            self.gc.uninstall()
+            print(self.gc.summary())
+            self.gc = None
+        if self.backend:
+            self.backend.close()
         pygame.quit()
 
 
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=GAME_TITLE)
+    parser.add_argument('--renderer', choices=render_backend.BACKENDS, default=render_backend.SURFACE,
+                        help='surface: software blits (default); sdl2: SDL Renderer and Textures '
+                             '(experimental: only the intro scene draws through textures, the other '
+                             'scenes upload a full-screen frame every frame and run slower)')
+    parser.add_argument('--memstats', action='store_true',
+                        help='track allocations per scene switch and warn about leaked scenes')
+    parser.add_argument('--trace', type=int, metavar='FRAMES',
+                        help='write a Chrome trace of the first FRAMES frames to profiles/')
+    parser.add_argument('--profile', action='store_true',
+                        help='run cProfile and write a .prof and collapsed stacks per scene to profiles/')
+    parser.add_argument('--hitch-budget', type=float, default=hitch.DEFAULT_BUDGET_MS, metavar='MS',
+                        help='log frames slower than MS to profiles/hitches.log (default 20, 0 turns it off)')
+    parser.add_argument('--no-idle-throttle', action='store_true',
+                        help='always run at full frame rate, even on static screens and in the background')
+    parser.add_argument('--gc-policy', action='store_true',
+                        help='freeze startup objects and run garbage collections between frames and on scene switches')
+    parser.add_argument('--alloc-tracker', action='store_true',
+                        help='count pygame allocations and draw calls per call site and print the top ones per scene on exit')
+    return parser.parse_args(argv)
+
+
 def main():
     """Main entry point."""
+    args = parse_args()
     config = GameConfig()
+    config.renderer = args.renderer
+    config.hitch_budget_ms = args.hitch_budget
+    config.gc_policy = args.gc_policy
+    config.idle_throttle = not args.no_idle_throttle
+    if args.memstats:
+        memstats.enable()
+    if args.trace:
+        profiler.start_trace(args.trace)
+    if args.profile:
+        profiler.start_profile()
+    if args.alloc_tracker:
+        alloc_tracker.enable()
     game = Game(config)
     
     try:
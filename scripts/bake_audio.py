@@ -0,0 +1,70 @@
+"""Transcode the game's MP3s to OGG Vorbis for cheaper decoding at runtime.
+
+Writes .cache/audio/<path>.ogg for every MP3 under art/music (skipping the
+ones that are already up to date). src/core/audio.py picks the baked file
+automatically when it is newer than the MP3. Needs ffmpeg on the PATH.
+
+Run from the project root:
+
+    python scripts/bake_audio.py            # bake what changed
+    python scripts/bake_audio.py --force    # re-bake everything
+"""
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from src.core.audio import baked_path  # noqa: E402
+
+MUSIC_DIR = os.path.join('art', 'music')
+QUALITY = '5'  # libvorbis -q:a, about 160 kbps
+
+
+def find_sources(folder: str):
+    for root, _, files in os.walk(folder):
+        for name in sorted(files):
+            if name.lower().endswith('.mp3'):
+                yield os.path.join(root, name)
+
+
+def bake(src: str, force: bool = False) -> bool:
+    """Transcode src to its baked path; returns True if a file was written."""
+    dst = baked_path(src)
+    if not force and os.path.exists(dst) and os.path.getmtime(dst) >= os.path.getmtime(src):
+        return False
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    cmd = ['ffmpeg', '-y', '-loglevel', 'error', '-i', src, '-vn',
+           '-c:a', 'libvorbis', '-q:a', QUALITY, dst]
+    subprocess.run(cmd, check=True)
+    return True
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--force', action='store_true', help='re-bake files that are up to date')
+    parser.add_argument('folder', nargs='?', default=MUSIC_DIR, help='folder to scan (default art/music)')
+    args = parser.parse_args()
+
+    os.chdir(PROJECT_ROOT)
+    if shutil.which('ffmpeg') is None:
+        print('ffmpeg not found on PATH; install it to bake audio')
+        return 1
+
+    baked = 0
+    for src in find_sources(args.folder):
+        try:
+            if bake(src, args.force):
+                print('Baked', src, '->', baked_path(src))
+                baked += 1
+        except subprocess.CalledProcessError as e:
+            print('Failed to bake', src, e)
+    print(f'Done ({baked} baked)')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
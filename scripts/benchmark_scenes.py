@@ -0,0 +1,121 @@
+"""Run every scene for a fixed number of frames and report ms per frame.
+
+Each scene is entered through SceneManager.go_to like in the game, fed a
+few key presses so scenes that wait for input move on, and stepped at a
+fixed 1/60 s. With --memory the surface memory report (src/core/memstats.py)
+is printed after each scene and finished scenes are checked for leaks;
+with --alloc the pygame allocations and draw calls per frame are counted
+by call site (src/core/alloc_tracker.py), which makes the timings useless.
+
+Run from the project root:
+
+    python scripts/benchmark_scenes.py                    # all scenes, 120 frames each
+    python scripts/benchmark_scenes.py --frames 600 Drive Dinner
+    python scripts/benchmark_scenes.py --memory --headless
+    python scripts/benchmark_scenes.py --alloc --frames 300 Disney
+"""
+import argparse
+import os
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+DT = 1.0 / 60
+# keys posted once per scene so intros, dialogues and menus advance
+NUDGE_FRAME = 10
+
+
+def scene_factories():
+    from src.scenes import (
+        BumbleSplashScene, BumbleScene, DriveScene, ApartmentScene,
+        DisneyScene, MovingScene, DinnerScene, MenuScene
+    )
+    from src.scenes.intro_scene import IntroScene
+    return [
+        ('Intro', IntroScene),
+        ('Splash', BumbleSplashScene),
+        ('Bumble', BumbleScene),
+        ('Drive', DriveScene),
+        ('Apartment', ApartmentScene),
+        ('Disney', DisneyScene),
+        ('Moving', MovingScene),
+        ('Dinner', DinnerScene),
+        ('Menu', MenuScene),
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('scenes', nargs='*', help='scene names to run (default all)')
+    parser.add_argument('--frames', type=int, default=120, help='frames per scene (default 120)')
+    parser.add_argument('--renderer', choices=('surface', 'sdl2'), default='surface',
+                        help='render backend (sdl2 is experimental, see src/core/render_backend.py)')
+    parser.add_argument('--memory', action='store_true', help='print surface memory after each scene')
+    parser.add_argument('--alloc', action='store_true',
+                        help='print the top pygame allocators per frame after each scene (slow)')
+    parser.add_argument('--headless', action='store_true', help='use the dummy video and audio drivers')
+    args = parser.parse_args()
+
+    os.chdir(PROJECT_ROOT)
+    if args.headless:
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+    import pygame
+    import game
+    from src.core import alloc_tracker, memstats
+
+    if args.memory:
+        memstats.enable()
+    if args.alloc:
+        alloc_tracker.enable()
+    config = game.GameConfig()
+    config.renderer = args.renderer
+    g = game.Game(config)
+    g.initialize()
+
+    wanted = {name.lower() for name in args.scenes}
+    for name, scene_class in scene_factories():
+        if wanted and name.lower() not in wanted:
+            continue
+        start = time.perf_counter()
+        g.manager.go_to(scene_class(g.manager))
+        # scenes with a generator start() load over several frames
+        load_frames = 0
+        while g.manager.loading:
+            g.update(DT)
+            g.draw()
+            alloc_tracker.end_frame(g.manager.scene)
+            load_frames += 1
+        setup = time.perf_counter() - start
+        start = time.perf_counter()
+        for i in range(args.frames):
+            if i == NUDGE_FRAME:
+                for key in (pygame.K_SPACE, pygame.K_RETURN):
+                    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode=' '))
+            for event in pygame.event.get():
+                if event.type == pygame.KEYDOWN:
+                    g.manager.handle_event(event)
+            g.update(DT)
+            g.draw()
+            alloc_tracker.end_frame(g.manager.scene)
+        per_frame = (time.perf_counter() - start) * 1000 / max(1, args.frames)
+        print(f"{name:12s} start {setup * 1000:7.1f} ms ({load_frames:3d} frames)   {per_frame:6.2f} ms/frame")
+        if args.memory:
+            print(memstats.format_report(memstats.report(g.manager)))
+            print()
+        if args.alloc:
+            print(alloc_tracker.format_report([type(g.manager.scene).__name__]))
+            print()
+
+    alloc_tracker.disable()
+    if args.memory:
+        memstats.check_finished(force=True)
+    g.shutdown()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,297 @@
+"""Opt-in per-frame allocation and draw-call tracking for pygame APIs.
+
+Surfaces, fonts and text created every frame (a Surface per firework
+particle, a SysFont per draw, temporary overlays) don't show up as slow
+frames, they just keep the allocator busy. While enabled, this module
+wraps the pygame calls that allocate or draw and counts, per call site
+(file:line) and per scene, calls, pixels allocated and time:
+
+- pygame.Surface(...)             pygame.Surface is swapped for a subclass
+- pygame.font.Font / SysFont      (fonts created while enabled)
+- Font.render                     (on those fonts)
+- pygame.transform.*              (counted as transform.<name>(dest), not
+                                  as allocations, when given a dest surface)
+- Surface.blit / blits / fill     through a profile hook (sys.setprofile),
+                                  which slows every Python call down
+
+Frames are counted by end_frame(); the first WARMUP_FRAMES after a scene
+switch are left out, so the report shows what a scene allocates in its
+steady state, per frame. The goal is zero Surface/Font/render/transform
+allocations per frame there.
+
+F12 in the game toggles tracking and prints the report when switched off;
+`python game.py --alloc-tracker` tracks from the start and reports on
+exit, and scripts/benchmark_scenes.py --alloc prints it after each scene.
+"""
+
+import os
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+# frames after a scene switch not counted in the steady state
+WARMUP_FRAMES = 30
+# call sites listed per scene
+TOP_SITES = 12
+# Surface methods timed through the profile hook
+DRAW_METHODS = frozenset(('blit', 'blits', 'fill'))
+TRANSFORMS = ('scale', 'smoothscale', 'scale_by', 'smoothscale_by', 'rotate', 'rotozoom', 'flip',
+              'scale2x', 'chop', 'laplacian', 'grayscale', 'box_blur', 'gaussian_blur', 'invert')
+
+ENABLED = False
+
+_Surface = pygame.Surface
+_Font = pygame.font.Font
+_SysFont = pygame.font.SysFont
+_transforms: Dict[str, object] = {}
+
+# (kind, site) -> [calls, pixels, seconds] for the frame being drawn
+_frame: Dict[Tuple[str, str], list] = {}
+# scene -> {'frames': steady frames, 'sites': {(kind, site): [calls, pixels, seconds]}}
+_scenes: Dict[str, dict] = {}
+_scene: Optional[str] = None
+_scene_frames = 0
+_draw_stack: List[tuple] = []
+_in_sysfont = 0
+_site_names: Dict[str, str] = {}
+_PYGAME_DIR = os.path.dirname(os.path.abspath(pygame.__file__))
+
+
+def _file_label(filename: str) -> str:
+    label = _site_names.get(filename)
+    if label is None:
+        try:
+            label = os.path.relpath(filename)
+        except ValueError:
+            label = filename
+        _site_names[filename] = label
+    return label
+
+
+def _site(frame) -> str:
+    """file:line of the first frame outside this module and pygame."""
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if not (filename == __file__ or filename.startswith(_PYGAME_DIR)):
+            return f'{_file_label(filename)}:{frame.f_lineno}'
+        frame = frame.f_back
+    return '?'
+
+
+def _record(kind: str, site: str, pixels: int, seconds: float) -> None:
+    entry = _frame.get((kind, site))
+    if entry is None:
+        _frame[(kind, site)] = [1, pixels, seconds]
+    else:
+        entry[0] += 1
+        entry[1] += pixels
+        entry[2] += seconds
+
+
+def _pixels(result) -> int:
+    if isinstance(result, _Surface):
+        w, h = result.get_size()
+        return w * h
+    return 0
+
+
+# --- wrapped APIs ---
+
+class _SurfaceType(type):
+    # surfaces made by pygame itself (image.load, transforms, the display) stay instances
+    def __instancecheck__(cls, obj):
+        return isinstance(obj, _Surface)
+
+    def __subclasscheck__(cls, sub):
+        return issubclass(sub, _Surface)
+
+
+class _TrackedSurface(_Surface, metaclass=_SurfaceType):
+    def __init__(self, *args, **kwargs):
+        start = time.perf_counter()
+        super().__init__(*args, **kwargs)
+        _record('Surface', _site(sys._getframe(1)), _pixels(self), time.perf_counter() - start)
+
+
+class _FontType(type):
+    def __instancecheck__(cls, obj):
+        return isinstance(obj, _Font)
+
+    def __subclasscheck__(cls, sub):
+        return issubclass(sub, _Font)
+
+
+class _TrackedFont(_Font, metaclass=_FontType):
+    def __init__(self, *args, **kwargs):
+        start = time.perf_counter()
+        super().__init__(*args, **kwargs)
+        if not _in_sysfont:
+            _record('Font', _site(sys._getframe(1)), 0, time.perf_counter() - start)
+
+    def render(self, *args, **kwargs):
+        start = time.perf_counter()
+        text = super().render(*args, **kwargs)
+        _record('Font.render', _site(sys._getframe(1)), _pixels(text), time.perf_counter() - start)
+        return text
+
+
+def _font_constructor(fontpath, size, bold, italic):
+    font = _TrackedFont(fontpath, size)
+    if bold:
+        font.set_bold(True)
+    if italic:
+        font.set_italic(True)
+    return font
+
+
+def _sys_font(name, size, bold=False, italic=False, constructor=None):
+    global _in_sysfont
+    start = time.perf_counter()
+    _in_sysfont += 1
+    try:
+        return _SysFont(name, size, bold, italic, constructor or _font_constructor)
+    finally:
+        _in_sysfont -= 1
+        _record('SysFont', _site(sys._getframe(1)), 0, time.perf_counter() - start)
+
+
+def _wrap_transform(name: str, func):
+    kind = f'transform.{name}'
+
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        seconds = time.perf_counter() - start
+        if any(result is arg for arg in args) or any(result is arg for arg in kwargs.values()):
+            # drawn into a destination surface the caller passed: nothing allocated
+            _record(kind + '(dest)', _site(sys._getframe(1)), 0, seconds)
+        else:
+            _record(kind, _site(sys._getframe(1)), _pixels(result), seconds)
+        return result
+    wrapper.__name__ = name
+    wrapper.__doc__ = func.__doc__
+    return wrapper
+
+
+def _profile_hook(frame, event, arg):
+    # c_call/c_return carry the builtin being called; only Surface draws are timed
+    if event == 'c_call':
+        if getattr(arg, '__name__', None) in DRAW_METHODS and isinstance(getattr(arg, '__self__', None), _Surface):
+            _draw_stack.append((arg, frame, time.perf_counter()))
+    elif event in ('c_return', 'c_exception'):
+        if _draw_stack and _draw_stack[-1][0] is arg:
+            _, caller, start = _draw_stack.pop()
+            _record(f'Surface.{arg.__name__}', _site(caller), 0, time.perf_counter() - start)
+
+
+# --- control ---
+
+def enable() -> None:
+    """Swap in the tracking wrappers (fonts made before this aren't tracked)."""
+    global ENABLED
+    if ENABLED:
+        return
+    pygame.Surface = _TrackedSurface
+    pygame.font.Font = _TrackedFont
+    pygame.font.SysFont = _sys_font
+    for name in TRANSFORMS:
+        func = getattr(pygame.transform, name, None)
+        if func is not None:
+            _transforms[name] = func
+            setattr(pygame.transform, name, _wrap_transform(name, func))
+    _frame.clear()
+    _draw_stack.clear()
+    sys.setprofile(_profile_hook)
+    ENABLED = True
+
+
+def disable() -> None:
+    """Restore the pygame functions."""
+    global ENABLED
+    if not ENABLED:
+        return
+    sys.setprofile(None)
+    pygame.Surface = _Surface
+    pygame.font.Font = _Font
+    pygame.font.SysFont = _SysFont
+    for name, func in _transforms.items():
+        setattr(pygame.transform, name, func)
+    _transforms.clear()
+    ENABLED = False
+
+
+def toggle() -> None:
+    """Switch tracking on, or off and print the report."""
+    if ENABLED:
+        disable()
+        print(format_report())
+    else:
+        enable()
+        print("alloc_tracker: on")
+
+
+def end_frame(scene=None) -> None:
+    """Close the current frame's counts and add them to the scene's totals."""
+    global _scene, _scene_frames
+    if not ENABLED:
+        return
+    name = type(scene).__name__ if scene is not None else '-'
+    if name != _scene:
+        _scene = name
+        _scene_frames = 0
+    _scene_frames += 1
+    if _scene_frames > WARMUP_FRAMES:
+        stats = _scenes.setdefault(name, {'frames': 0, 'sites': {}})
+        stats['frames'] += 1
+        sites = stats['sites']
+        for key, (calls, pixels, seconds) in _frame.items():
+            entry = sites.get(key)
+            if entry is None:
+                sites[key] = [calls, pixels, seconds]
+            else:
+                entry[0] += calls
+                entry[1] += pixels
+                entry[2] += seconds
+    _frame.clear()
+
+
+def reset() -> None:
+    """Forget the collected counts."""
+    global _scene, _scene_frames
+    _frame.clear()
+    _scenes.clear()
+    _scene = None
+    _scene_frames = 0
+
+
+def report(scene: str) -> List[Tuple[str, str, float, float, float]]:
+    """(kind, site, calls, pixels, ms) per steady-state frame of scene, biggest allocators first."""
+    stats = _scenes.get(scene)
+    if not stats or not stats['frames']:
+        return []
+    frames = stats['frames']
+    rows = [(kind, site, calls / frames, pixels / frames, seconds * 1000 / frames)
+            for (kind, site), (calls, pixels, seconds) in stats['sites'].items()]
+    # allocations (pixels) first, then draw time
+    rows.sort(key=lambda row: (-row[3], -row[4]))
+    return rows
+
+
+def format_report(scenes=None) -> str:
+    """Top call sites per scene as a table."""
+    lines = []
+    for scene in scenes or list(_scenes):
+        stats = _scenes.get(scene)
+        if not stats:
+            continue
+        rows = report(scene)
+        allocs = sum(calls for kind, _, calls, _, _ in rows
+                     if not (kind.startswith('Surface.') or kind.endswith('(dest)')))
+        lines.append(f"alloc_tracker: {scene}, {stats['frames']} frames after {WARMUP_FRAMES} warm-up: "
+                     f"{allocs:.1f} allocations/frame")
+        lines.append(f"  {'kind':24s} {'site':44s} {'calls/f':>8s} {'Kpx/f':>8s} {'ms/f':>7s}")
+        for kind, site, calls, pixels, ms in rows[:TOP_SITES]:
+            lines.append(f"  {kind:24s} {site:44s} {calls:8.2f} {pixels / 1000:8.1f} {ms:7.3f}")
+    return '\n'.join(lines) if lines else 'alloc_tracker: no frames recorded'
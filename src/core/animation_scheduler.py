@@ -0,0 +1,118 @@
+"""Update character animations by what is actually moving.
+
+Scenes used to call update() on every AnimationManager every frame:
+DinnerScene advances eight of them although the guests mostly hold a
+single idle pose, and IntroScene animates characters still waiting
+off-screen. An AnimationScheduler owns that loop instead:
+
+    self.animations = AnimationScheduler(view=(0, 0, 1024, 768))
+    self.animations.add(self.maria_anim, rect=lambda: pygame.Rect(x, y, 128, 128))
+    self.animations.add(npc_anim, tick_ms=BACKGROUND_TICK_MS)   # background character
+    ...
+    self.animations.update(dt * 1000)
+
+Each frame a manager is
+
+- asleep while it holds the final frame of a non-looping animation (see
+  AnimationManager.sleeping); play() of another animation wakes it
+- skipped while its rect is off the view, or the rect callable returns
+  None (hidden or occluded); it resumes where it was once it is back
+- updated every tick_ms (with the time that built up meanwhile) rather
+  than every frame when given a tick_ms, for distant or background
+  characters whose frames change far less often than the game ticks
+"""
+
+import pygame
+from typing import Callable, Dict, Optional
+
+# tick for background characters: idle/emote frames last 100-400 ms
+BACKGROUND_TICK_MS = 50
+
+# entry states (see AnimationScheduler.counts)
+AWAKE = 'awake'
+ASLEEP = 'asleep'
+OFFSCREEN = 'offscreen'
+
+
+class _Entry:
+    __slots__ = ('manager', 'rect', 'tick_ms', 'pending', 'state')
+
+    def __init__(self, manager, rect, tick_ms):
+        self.manager = manager
+        self.rect = rect
+        self.tick_ms = tick_ms
+        self.pending = 0.0
+        self.state = AWAKE
+
+
+class AnimationScheduler:
+    """Advances registered AnimationManagers, skipping the ones that can't change on screen."""
+
+    def __init__(self, view: Optional[pygame.Rect] = None):
+        """
+        Args:
+            view: area a character has to overlap to be animated (None: no
+                off-screen check)
+        """
+        self.view = pygame.Rect(view) if view is not None else None
+        self._entries: Dict[int, _Entry] = {}
+        self.updates = 0  # manager updates done by the last update()
+
+    def add(self, manager, rect: Optional[Callable[[], Optional[pygame.Rect]]] = None,
+            tick_ms: float = 0) -> None:
+        """Schedule manager (None is ignored, like a character that failed to load).
+
+        Args:
+            manager: an AnimationManager
+            rect: returns where the character is drawn now (view coordinates),
+                or None while it isn't drawn; without it the character
+                always counts as visible
+            tick_ms: update at most this often (0: every frame)
+        """
+        if manager is not None:
+            self._entries[id(manager)] = _Entry(manager, rect, tick_ms)
+
+    def remove(self, manager) -> None:
+        self._entries.pop(id(manager), None)
+
+    def set_tick(self, manager, tick_ms: float) -> None:
+        """Change how often manager updates (e.g. when a character walks into focus)."""
+        entry = self._entries.get(id(manager))
+        if entry is not None:
+            entry.tick_ms = tick_ms
+
+    def _on_screen(self, entry: _Entry) -> bool:
+        if entry.rect is None:
+            return True
+        rect = entry.rect()
+        if rect is None:
+            return False
+        return self.view is None or self.view.colliderect(rect)
+
+    def update(self, dt_ms: float) -> None:
+        """Advance every awake, visible manager whose tick is due."""
+        updates = 0
+        for entry in self._entries.values():
+            if entry.manager.sleeping:
+                entry.state = ASLEEP
+                entry.pending = 0.0
+                continue
+            if not self._on_screen(entry):
+                # frozen where it was, not caught up later
+                entry.state = OFFSCREEN
+                entry.pending = 0.0
+                continue
+            entry.state = AWAKE
+            entry.pending += dt_ms
+            if entry.pending >= entry.tick_ms:
+                entry.manager.update(entry.pending)
+                entry.pending = 0.0
+                updates += 1
+        self.updates = updates
+
+    def counts(self) -> Dict[str, int]:
+        """Managers per state as of the last update()."""
+        result = {AWAKE: 0, ASLEEP: 0, OFFSCREEN: 0}
+        for entry in self._entries.values():
+            result[entry.state] += 1
+        return result
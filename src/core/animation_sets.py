@@ -0,0 +1,147 @@
+"""Shared animation sets, scoped to the scenes that use them.
+
+Several scenes load the same characters: each used to slice, filter and
+scale its own copy of the frames, mask every frame again to find visible
+ones, and rescale the current frame on every draw. An AnimationSet holds
+one frame list per (character, animation, size, filter) together with its
+per-frame visibility flags and any scaled variants, and every scene that
+asks for the same key gets the same object.
+
+Scenes acquire sets with themselves as the owner; SceneManager releases
+the previous scene's sets after the next scene has started, so sets both
+scenes use survive the switch and the rest are evicted.
+"""
+
+import pygame
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from . import assets
+
+# frame filters
+VISIBLE = 'visible'  # drop fully transparent frames (walk cycles)
+
+
+def frame_visible(frame: pygame.Surface) -> bool:
+    """True if the frame has at least one non-transparent pixel."""
+    try:
+        return pygame.mask.from_surface(frame).count() > 0
+    except Exception:
+        # if mask fails, assume the frame is visible
+        return True
+
+
+class AnimationSet:
+    """Frames of one animation plus metadata shared by everything playing it.
+
+    Attributes:
+        frames: the frames at their loaded size
+        visible: per-frame flag, True if the frame has visible pixels
+        variants: scale -> list of scaled frames (filled in lazily)
+    """
+
+    def __init__(self, frames: List[pygame.Surface]):
+        self.frames = frames
+        self.visible = [frame_visible(f) for f in frames]
+        self.variants: Dict[float, List[Optional[pygame.Surface]]] = {}
+
+    def scaled_frame(self, index: int, scale: float) -> pygame.Surface:
+        """Return frame index scaled by scale (nearest neighbour), cached."""
+        if scale == 1.0:
+            return self.frames[index]
+        variant = self.variants.get(scale)
+        if variant is None:
+            variant = self.variants[scale] = [None] * len(self.frames)
+        frame = variant[index]
+        if frame is None:
+            src = self.frames[index]
+            size = (int(src.get_width() * scale), int(src.get_height() * scale))
+            frame = variant[index] = pygame.transform.scale(src, size)
+        return frame
+
+    def scaled(self, scale: float) -> List[pygame.Surface]:
+        """Return every frame scaled by scale."""
+        return [self.scaled_frame(i, scale) for i in range(len(self.frames))]
+
+
+# containers
+SETS: Dict[tuple, AnimationSet] = {}
+# set key -> ids of the scenes holding it; keys acquired without an owner
+# have no entry here and are never evicted
+_OWNERS: Dict[tuple, Set[int]] = {}
+
+
+def _register(key: tuple, owner) -> None:
+    if owner is not None:
+        _OWNERS.setdefault(key, set()).add(id(owner))
+
+
+def acquire(owner, character: str, animation: str, size: Tuple[int, int] = None,
+            filter: str = None) -> Optional[AnimationSet]:
+    """Return the shared set for one character animation, loading it if needed.
+
+    Args:
+        owner: the scene using the set (None keeps it for the whole run)
+        character: folder name under art/characters/
+        animation: animation key as returned by assets.get_animations (e.g. 'walk_left')
+        size: frame size passed to assets.get_animations
+        filter: None, or VISIBLE to drop fully transparent frames
+
+    Returns:
+        AnimationSet, or None if the animation has no frames
+    """
+    key = (character, animation, size, filter)
+    anim_set = SETS.get(key)
+    if anim_set is None:
+        # through the full mapping: loading one key fills its siblings
+        # (walk_up ... walk_right) from the same sheet load
+        frames = assets.get_animations(character, size=size).get(animation)
+        if not frames:
+            return None
+        if filter == VISIBLE:
+            frames = [f for f in frames if frame_visible(f)] or frames
+        anim_set = SETS[key] = AnimationSet(frames)
+    _register(key, owner)
+    return anim_set
+
+
+def acquire_region(owner, image_key: str, rects: Iterable[Tuple[int, int, int, int]]) -> Optional[AnimationSet]:
+    """Return a shared set made of regions of one image (e.g. hand-picked sheet frames)."""
+    rects = tuple(tuple(r) for r in rects)
+    key = ('region', image_key, rects)
+    anim_set = SETS.get(key)
+    if anim_set is None:
+        frames = [assets.get_region(image_key, r) for r in rects]
+        if not frames or any(f is None for f in frames):
+            return None
+        anim_set = SETS[key] = AnimationSet(frames)
+    _register(key, owner)
+    return anim_set
+
+
+def release(owner) -> int:
+    """Drop owner's claim on its sets and evict the ones nobody holds any more.
+
+    Returns the number of sets evicted.
+    """
+    evicted = 0
+    owner_id = id(owner)
+    sheets = set()  # (character, size, animation) of the evicted sets
+    for key in list(_OWNERS):
+        holders = _OWNERS[key]
+        holders.discard(owner_id)
+        if holders:
+            continue
+        del _OWNERS[key]
+        SETS.pop(key, None)
+        evicted += 1
+        if key[0] != 'region':
+            sheets.add((key[0], key[2], key[1]))
+    # let the loader drop a sheet's frames once no set uses any key cut from
+    # it; they reload on next use
+    for character, size, animation in sheets:
+        animations = assets.get_animations(character, size=size)
+        base = animations.base_of(animation)
+        still_used = any(k[0] == character and k[2] == size and animations.base_of(k[1]) == base
+                         for k in SETS if k[0] != 'region')
+        if not still_used:
+            assets.unload_animation(character, animation, size)
+    return evicted
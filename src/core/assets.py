@@ -1,224 +1,658 @@
 import os
+import struct
 import pygame
-from typing import Dict, Tuple
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+from . import audio, hitch, pixel_cache, profiler
 
 # Get the project root (two levels up from src/core/)
 ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
 ART_DIR = os.path.join(ROOT, 'art')
 
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+# upper bound for parallel decodes in preload()
+MAX_LOAD_WORKERS = 4
+# pixel budget for surfaces no scene holds any more (see release())
+COLD_MAX_BYTES = 64 * 1024 * 1024
+
+
+class AssetInfo(NamedTuple):
+    """Cheap metadata for one image under art/ (nothing decoded)."""
+    path: str
+    file_size: int
+    mtime: float
+    width: int
+    height: int
+
+
 # containers
+MANIFEST: Dict[str, AssetInfo] = {}
 SURFACES: Dict[str, pygame.Surface] = {}
-ANIMATIONS: Dict[tuple, Dict[str, list]] = {}
+ANIMATIONS: Dict[tuple, 'LazyAnimations'] = {}
+# keys whose SURFACES entry has already been converted to the display format
+_CONVERTED = set()
+# (opaque, alpha) surfaces whose pixel formats stand in for the display's
+# when the window has no display Surface (the SDL2 renderer backend)
+_FORMAT_REFERENCE: Optional[Tuple[pygame.Surface, pygame.Surface]] = None
+# key -> ids of the scenes holding it (see AssetScope); keys loaded without
+# an owner have no entry here and stay in SURFACES for the whole run
+_OWNERS: Dict[str, Set[int]] = {}
+# released surfaces, least recently used first; get() moves them back to
+# SURFACES, so returning to a scene doesn't decode again
+COLD: 'OrderedDict[str, pygame.Surface]' = OrderedDict()
+_cold_bytes = 0
 
 
-def _load_folder(folder: str):
-    path = os.path.join(ART_DIR, folder)
-    if not os.path.isdir(path):
-        return
-    for fn in os.listdir(path):
-        if not fn.lower().endswith('.png'):
-            continue
-        key = f"{folder}/{fn}"
-        full = os.path.join(path, fn)
-        try:
-            # pygame requires a video mode to be set before calling convert()/convert_alpha()
-            # To stay safe during headless or early-load contexts, load without converting
-            # and only convert when blitting if needed.
-            surf = pygame.image.load(full)
-            # store the raw surface; callers can call convert_alpha() after display is set
-            SURFACES[key] = surf
-        except Exception as e:
-            print('Failed to load', full, e)
+def _read_image_size(path: str) -> Tuple[int, int]:
+    """Read (width, height) from a PNG/JPEG header without decoding pixels.
+
+    Returns (0, 0) when the header can't be parsed.
+    """
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(26)
+            if head[:8] == b'\x89PNG\r\n\x1a\n':
+                w, h = struct.unpack('>II', head[16:24])
+                return w, h
+            if head[:2] == b'\xff\xd8':
+                # walk JPEG markers until a start-of-frame segment
+                f.seek(2)
+                while True:
+                    marker = f.read(2)
+                    if len(marker) < 2 or marker[0] != 0xFF:
+                        break
+                    length = struct.unpack('>H', f.read(2))[0]
+                    if marker[1] in (0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7,
+                                     0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF):
+                        h, w = struct.unpack('>xHH', f.read(5))
+                        return w, h
+                    f.seek(length - 2, os.SEEK_CUR)
+    except (OSError, struct.error):
+        pass
+    return 0, 0
+
+
+def build_manifest(folder: str = '') -> Dict[str, AssetInfo]:
+    """Index every image under art/<folder> into MANIFEST.
+
+    Only stats the files and reads their headers, so this is cheap enough to
+    run at startup. Keys are paths relative to art/ with forward slashes,
+    e.g. 'characters/maria/idle.png' or 'scenes/disney/castle.png'.
+    """
+    top = os.path.join(ART_DIR, folder)
+    if not os.path.isdir(top):
+        return MANIFEST
+    for dirpath, _, filenames in os.walk(top):
+        for fn in filenames:
+            if not fn.lower().endswith(IMAGE_EXTENSIONS):
+                continue
+            full = os.path.join(dirpath, fn)
+            try:
+                st = os.stat(full)
+            except OSError:
+                continue
+            key = os.path.relpath(full, ART_DIR).replace(os.sep, '/')
+            w, h = _read_image_size(full)
+            MANIFEST[key] = AssetInfo(full, st.st_size, st.st_mtime, w, h)
+    return MANIFEST
 
 
 def load_assets():
-    """Load all PNGs under art/ and subfolders into SURFACES.
+    """Build the asset manifest for everything under art/.
 
-    Keys are returned as 'characters/maria_player.png' etc.
+    Nothing is decoded here any more; surfaces are decoded on first get()
+    (or in a batch through preload()), so startup memory only grows with
+    what the scenes actually use.
     """
     pygame.init()
-    for folder in ('characters', 'objects', 'backgrounds'):
-        _load_folder(folder)
+    build_manifest()
 
 
-def get(key: str) -> pygame.Surface:
-    """Return a surface by key, or None if missing."""
-    s = SURFACES.get(key)
-    # lazy convert if display set
-    if s is not None and hasattr(pygame, 'display') and pygame.display.get_init():
+def key_for(path: str) -> str:
+    """Normalise a manifest key or a filesystem path (e.g. 'art/photos/a.jpg') to a key."""
+    if path in SURFACES or path in MANIFEST:
+        return path
+    if os.path.isabs(path) or os.path.exists(path):
+        rel = os.path.relpath(os.path.abspath(path), ART_DIR)
+        if not rel.startswith('..'):
+            return rel.replace(os.sep, '/')
+    key = path.replace(os.sep, '/')
+    if key.startswith('art/'):
+        key = key[4:]
+    return key
+
+
+def keys_under(folder: str, extensions: Tuple[str, ...] = IMAGE_EXTENSIONS) -> List[str]:
+    """Return sorted manifest keys inside art/<folder> (recursively)."""
+    if not MANIFEST:
+        build_manifest()
+    prefix = folder.rstrip('/') + '/'
+    return sorted(k for k in MANIFEST if k.startswith(prefix) and k.lower().endswith(extensions))
+
+
+def _path_for(key: str) -> str:
+    info = MANIFEST.get(key)
+    if info is not None:
+        return info.path
+    return os.path.join(ART_DIR, *key.split('/'))
+
+
+@profiler.traced('assets.decode', 'assets')
+def _decode(key: str) -> Optional[pygame.Surface]:
+    """Decode the image for key without touching SURFACES (safe off the main thread).
+
+    Goes through the on-disk pixel cache, so only the first run pays for
+    the PNG/JPEG decoder.
+    """
+    full = _path_for(key)
+    hitch.note_load('image', key)
+    try:
+        return pixel_cache.cached(full, 'raw', lambda: pygame.image.load(full))
+    except Exception as e:
+        print('Failed to load', full, e)
+        return None
+
+
+def set_pixel_format(opaque: pygame.Surface, alpha: pygame.Surface) -> None:
+    """Convert to these surfaces' formats when no video mode is set.
+
+    The SDL2 render backend has a window but no display Surface, so
+    convert()/convert_alpha() aren't available; it registers 32-bit
+    reference surfaces here so assets still blit (and upload) without
+    per-pixel format conversion.
+    """
+    global _FORMAT_REFERENCE
+    _FORMAT_REFERENCE = (opaque, alpha)
+
+
+def _display_ready() -> bool:
+    # convert()/convert_alpha() need a video mode to be set (or a reference format)
+    if pygame.display.get_init() and pygame.display.get_surface() is not None:
+        return True
+    return _FORMAT_REFERENCE is not None
+
+
+def display_format(surf: pygame.Surface, alpha: Optional[bool] = None) -> pygame.Surface:
+    """Return surf converted to the display's pixel format (or surf unchanged without one).
+
+    alpha defaults to whether surf has per-pixel alpha.
+    """
+    if alpha is None:
+        alpha = bool(surf.get_flags() & pygame.SRCALPHA)
+    if pygame.display.get_init() and pygame.display.get_surface() is not None:
+        return surf.convert_alpha() if alpha else surf.convert()
+    if _FORMAT_REFERENCE is not None:
+        return surf.convert(_FORMAT_REFERENCE[1 if alpha else 0])
+    return surf
+
+
+def _store(key: str, surf: pygame.Surface) -> pygame.Surface:
+    """Cache a decoded surface, converting it to the display format when possible."""
+    if _display_ready():
         try:
-            # convert_alpha may fail if surface already converted; ignore
-            return s.convert_alpha()
+            surf = display_format(surf)
+            _CONVERTED.add(key)
         except Exception:
-            return s
-    return s
+            pass
+    SURFACES[key] = surf
+    return surf
+
+
+# --- ownership ---
+
+def _surface_bytes(surf: pygame.Surface) -> int:
+    if surf.get_parent() is not None:
+        return 0
+    return surf.get_width() * surf.get_height() * surf.get_bytesize()
+
+
+def _owner_id(owner) -> int:
+    return owner if isinstance(owner, int) else id(owner)
+
+
+def claim(owner, key: str) -> None:
+    """Record that owner (a scene, or its id) holds key until release(owner)."""
+    if owner is not None:
+        _OWNERS.setdefault(key, set()).add(_owner_id(owner))
 
 
-def get_scaled(key: str, size: Tuple[int, int]) -> pygame.Surface:
-    s = get(key)
+def _revive(key: str) -> Optional[pygame.Surface]:
+    """Move key back from COLD to SURFACES (None if it isn't there)."""
+    global _cold_bytes
+    surf = COLD.pop(key, None)
+    if surf is not None:
+        _cold_bytes -= _surface_bytes(surf)
+        SURFACES[key] = surf
+    return surf
+
+
+def _retire(key: str) -> None:
+    """Move key from SURFACES to COLD, dropping the oldest cold surfaces over budget."""
+    global _cold_bytes
+    surf = SURFACES.pop(key, None)
+    if surf is None:
+        return
+    COLD[key] = surf
+    _cold_bytes += _surface_bytes(surf)
+    while _cold_bytes > COLD_MAX_BYTES and COLD:
+        old_key, old = COLD.popitem(last=False)
+        _cold_bytes -= _surface_bytes(old)
+        _CONVERTED.discard(old_key)
+
+
+def release(owner) -> int:
+    """Drop owner's claims; surfaces nobody holds any more move to the cold cache.
+
+    SceneManager calls this for the previous scene after the next one has
+    started, so images both scenes claim stay put. Returns the number of
+    surfaces retired.
+    """
+    retired = 0
+    owner_id = _owner_id(owner)
+    for key in list(_OWNERS):
+        holders = _OWNERS[key]
+        holders.discard(owner_id)
+        if holders:
+            continue
+        del _OWNERS[key]
+        if key in SURFACES:
+            _retire(key)
+            retired += 1
+    return retired
+
+
+class AssetScope:
+    """Handle through which a scene loads the images it holds.
+
+    Everything fetched through the scope is claimed for its scene, and
+    released together when SceneManager leaves the scene, after the next
+    scene has started so images both use stay loaded (the same hand-over
+    as animation_sets). Sounds are claimed in the audio bank the same way.
+    The scope keeps the owner's id, not the scene, so it adds no cycle.
+    """
+
+    def __init__(self, owner):
+        self.owner_id = id(owner)
+
+    def get(self, key: str) -> Optional[pygame.Surface]:
+        return get(key, owner=self.owner_id)
+
+    def get_scaled(self, key: str, size: Tuple[int, int]) -> Optional[pygame.Surface]:
+        return get_scaled(key, size, owner=self.owner_id)
+
+    def get_fitted(self, key: str, max_size: Tuple[int, int], smooth: bool = False) -> Optional[pygame.Surface]:
+        return get_fitted(key, max_size, smooth, owner=self.owner_id)
+
+    def get_region(self, key: str, rect) -> Optional[pygame.Surface]:
+        return get_region(key, rect, owner=self.owner_id)
+
+    def sound(self, path: str, volume: Optional[float] = None) -> Optional[pygame.mixer.Sound]:
+        return audio.get_sound(path, volume, owner=self.owner_id)
+
+    def release(self) -> int:
+        audio.release(self.owner_id)
+        return release(self.owner_id)
+
+
+# --- loading ---
+
+def get(key: str, owner=None) -> pygame.Surface:
+    """Return the surface for a key (or art path), decoding it on first use.
+
+    The decoded surface is converted to the display format once a video mode
+    exists and shared by every caller, so treat it as read-only: copy it
+    before drawing onto it. Returns None if the image is missing.
+    Passing owner claims the key for it (see AssetScope).
+    """
+    key = key_for(key)
+    claim(owner, key)
+    s = SURFACES.get(key)
+    if s is None:
+        s = _revive(key)
     if s is None:
+        s = _decode(key)
+        if s is None:
+            return None
+        return _store(key, s)
+    if key not in _CONVERTED and _display_ready():
+        return _store(key, s)
+    return s
+
+
+@profiler.traced('assets.preload', 'assets')
+def preload(keys: Iterable[str], max_workers: int = MAX_LOAD_WORKERS,
+            owner=None) -> Dict[str, pygame.Surface]:
+    """Decode a batch of keys in parallel and cache them.
+
+    Decoding runs on a small thread pool (SDL_image releases the GIL while
+    decoding); the display conversion happens on the calling thread.
+    Returns a dict of key -> surface for the keys that loaded.
+    """
+    wanted = []
+    for k in keys:
+        k = key_for(k)
+        if k not in wanted:
+            wanted.append(k)
+            claim(owner, k)
+    missing = [k for k in wanted if k not in SURFACES and _revive(k) is None]
+    if len(missing) > 1 and max_workers > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as pool:
+            decoded = list(pool.map(_decode, missing))
+    else:
+        decoded = [_decode(k) for k in missing]
+    for k, surf in zip(missing, decoded):
+        if surf is not None:
+            _store(k, surf)
+    return {k: get(k) for k in wanted if k in SURFACES}
+
+
+def get_region(key: str, rect, owner=None) -> Optional[pygame.Surface]:
+    """Return a subsurface view of part of a shared image (e.g. one sprite sheet frame).
+
+    The view shares pixels with the cached sheet, so nothing is copied;
+    copy() it before drawing onto it.
+    """
+    sheet = get(key, owner)
+    if sheet is None:
         return None
-    return pygame.transform.smoothscale(s, size)
+    return sheet.subsurface(pygame.Rect(rect))
 
 
-def _slice_horizontal_strip(surf: pygame.Surface, frame_size: Tuple[int, int] = None) -> list:
-    """If the surface is a horizontal strip of same-size frames, return list of frames.
+@profiler.traced('assets.get_transformed', 'assets')
+def _get_transformed(key: str, transform: str,
+                     build: Callable[[pygame.Surface], pygame.Surface],
+                     owner=None) -> Optional[pygame.Surface]:
+    """Return build(source) for key, cached in memory and in the pixel cache.
 
-    If frame_size is provided (w,h), slice the strip into frames of that size.
-    Otherwise fall back to the square-frame heuristic (width divisible by height).
+    The result is stored in SURFACES under '<key>@<transform>'.
     """
-    w, h = surf.get_size()
-    frames = []
+    key = key_for(key)
+    cache_key = f"{key}@{transform}"
+    claim(owner, cache_key)
+    s = SURFACES.get(cache_key)
+    if s is None:
+        s = _revive(cache_key)
+    if s is not None:
+        if cache_key not in _CONVERTED and _display_ready():
+            return _store(cache_key, s)
+        return s
 
+    def build_from_source():
+        hitch.note_load('transform', cache_key)
+        src = SURFACES.get(key)
+        if src is None:
+            # decode straight from the file; the full-size image isn't kept
+            src = pygame.image.load(_path_for(key))
+        return build(src)
+
+    try:
+        s = pixel_cache.cached(_path_for(key), transform, build_from_source)
+    except Exception as e:
+        print('Failed to load', key, e)
+        return None
+    if s is None:
+        return None
+    return _store(cache_key, s)
+
+
+def get_scaled(key: str, size: Tuple[int, int], owner=None) -> pygame.Surface:
+    w, h = size
+    return _get_transformed(key, f"smooth:{w}x{h}",
+                            lambda s: pygame.transform.smoothscale(s, (w, h)), owner)
+
+
+def get_fitted(key: str, max_size: Tuple[int, int], smooth: bool = False, owner=None) -> pygame.Surface:
+    """Return the image scaled to fit inside max_size, keeping its aspect ratio."""
+    max_w, max_h = max_size
+
+    def fit(s):
+        w, h = s.get_size()
+        scale_factor = min(max_w / w, max_h / h)
+        new_size = (int(w * scale_factor), int(h * scale_factor))
+        if smooth:
+            return pygame.transform.smoothscale(s, new_size)
+        return pygame.transform.scale(s, new_size)
+
+    mode = 'smooth' if smooth else 'nearest'
+    return _get_transformed(key, f"fit:{max_w}x{max_h}:{mode}", fit, owner)
+
+
+# LPC sheets store one row per facing direction, in this order
+DIRECTION_ROWS = ('up', 'left', 'down', 'right')
+
+
+def _strip_grid(w: int, h: int, frame_size: Tuple[int, int] = None) -> Optional[Tuple[int, int, int, int]]:
+    """Work out how a (w, h) sheet splits into frames.
+
+    Returns (frame_w, frame_h, rows, cols), or None if the sheet doesn't look
+    like a strip/grid (treat it as a single frame). Only needs the sheet size,
+    so it can run on manifest metadata before anything is decoded.
+    """
     # If caller provided the expected frame size, use it when it matches the sheet layout
     if frame_size is not None:
         fw, fh = frame_size
         if fw > 0 and fh > 0:
             # If the sheet is a single row matching the requested height
             if h == fh and w > fw and (w % fw) == 0:
-                count = w // fw
-                for i in range(count):
-                    rect = pygame.Rect(i * fw, 0, fw, fh)
-                    frame = surf.subsurface(rect).copy()
-                    frames.append(frame)
-                return frames
+                return fw, fh, 1, w // fw
             # If the sheet contains multiple rows/columns of the requested frame size,
             # slice into row-major frames (rows x cols).
             if (h % fh) == 0 and (w % fw) == 0 and h >= fh and w >= fw:
-                rows = h // fh
-                cols = w // fw
-                for r in range(rows):
-                    for c in range(cols):
-                        rect = pygame.Rect(c * fw, r * fh, fw, fh)
-                        frame = surf.subsurface(rect).copy()
-                        frames.append(frame)
-                return frames
+                return fw, fh, h // fh, w // fw
 
     # fallback: square-frame heuristic (legacy behavior)
     if h > 0 and w > h and (w % h) == 0:
-        count = w // h
-        for i in range(count):
-            rect = pygame.Rect(i * h, 0, h, h)
-            frame = surf.subsurface(rect).copy()
-            frames.append(frame)
-    # If we still didn't find frames and a frame_size was provided, try some
-    # common LPC frame sizes as a fallback (64x64, 48x64, 32x32).
-    if not frames and frame_size is not None:
+        return h, h, 1, w // h
+    # If a frame_size was provided, try some common LPC frame sizes as a
+    # fallback (64x64, 48x64, 32x32).
+    if frame_size is not None:
         common = [(64, 64), (48, 64), (32, 32)]
         for cw, ch in common:
             if cw > 0 and ch > 0 and (w % cw) == 0 and (h % ch) == 0:
-                cols = w // cw
-                rows = h // ch
-                for r in range(rows):
-                    for c in range(cols):
-                        rect = pygame.Rect(c * cw, r * ch, cw, ch)
-                        frames.append(surf.subsurface(rect).copy())
-                if frames:
-                    return frames
+                return cw, ch, h // ch, w // cw
+    return None
+
+
+def _slice_horizontal_strip(surf: pygame.Surface, frame_size: Tuple[int, int] = None,
+                            copy: bool = False) -> list:
+    """If the surface is a horizontal strip of same-size frames, return list of frames.
+
+    If frame_size is provided (w,h), slice the strip into frames of that size.
+    Otherwise fall back to the square-frame heuristic (width divisible by height).
+    Frames are subsurface views sharing the sheet's pixels unless copy is True;
+    don't draw onto them.
+    """
+    grid = _strip_grid(*surf.get_size(), frame_size=frame_size)
+    if grid is None:
+        return []
+    fw, fh, rows, cols = grid
+    frames = []
+    for r in range(rows):
+        for c in range(cols):
+            rect = pygame.Rect(c * fw, r * fh, fw, fh)
+            frame = surf.subsurface(rect)
+            frames.append(frame.copy() if copy else frame)
     return frames
 
 
-def get_animations(character_name: str, size: Tuple[int, int] = None) -> Dict[str, list]:
-    """Return a dict of animations for character folders under art/characters/<name>/.
+def _animation_keys(base: str, sheet_size: Tuple[int, int], frame_size: Tuple[int, int] = None) -> List[str]:
+    """Keys get_animations produces for one sheet: the base plus a key per direction row."""
+    grid = _strip_grid(*sheet_size, frame_size=frame_size)
+    if grid is None:
+        return [base]
+    rows = grid[2]
+    return [f"{base}_{d}" for d in DIRECTION_ROWS[:rows]] + [base]
 
-    Behavior:
-    - If a file named <anim>.png exists and is a horizontal strip, slice it into frames.
-    - Else, collect files like <anim>_0.png, <anim>_1.png, ... sorted numerically.
-    Results cached in ANIMATIONS.
+
+class LazyAnimations(Mapping):
+    """Read-only {animation name: frames} mapping that loads on first access.
+
+    The key set comes from the manifest (file names and header sizes), so
+    listing or testing keys is free; a sheet is only decoded, sliced and
+    scaled when one of its animations is looked up. Views made with
+    subset() share the loaded frames with the mapping they came from.
     """
-    cache_key = (character_name, size)
-    if cache_key in ANIMATIONS:
-        return ANIMATIONS[cache_key]
-
-    animations: Dict[str, list] = {}
-    folder = os.path.join(ART_DIR, 'characters', character_name)
-    if not os.path.isdir(folder):
-        ANIMATIONS[character_name] = animations
-        return animations
-
-    # list png files
-    files = [f for f in os.listdir(folder) if f.lower().endswith('.png')]
-    # map base names
-    by_base = {}
-    for fn in files:
-        name = os.path.splitext(fn)[0]
-        by_base.setdefault(name, []).append(fn)
-
-    for base, fns in by_base.items():
-        # try direct strip file first (single file with that base)
+
+    def __init__(self, character_name: str, size: Tuple[int, int] = None):
+        self.character_name = character_name
+        self.size = size
+        # base name -> sheet files, and animation key -> base name
+        self._files: Dict[str, List[str]] = {}
+        self._keys: Dict[str, str] = {}
+        # animation key -> frames, filled in as sheets are loaded
+        self._frames: Dict[str, list] = {}
+
+    def _index(self, folder: str) -> None:
+        by_base: Dict[str, List[str]] = {}
+        for fn in sorted(os.listdir(folder)):
+            if fn.lower().endswith('.png'):
+                by_base.setdefault(os.path.splitext(fn)[0], []).append(fn)
+        for base, fns in by_base.items():
+            self._files[base] = fns
+            if len(fns) == 1:
+                for key in _animation_keys(base, self._sheet_size(fns[0]), self.size):
+                    self._keys[key] = base
+            else:
+                self._keys[base] = base
+
+    def _sheet_size(self, fn: str) -> Tuple[int, int]:
+        info = MANIFEST.get(f'characters/{self.character_name}/{fn}')
+        if info is not None and info.width and info.height:
+            return info.width, info.height
+        # not in the manifest (or unreadable header): decode to find out
+        surf = get(f'characters/{self.character_name}/{fn}')
+        return surf.get_size() if surf is not None else (0, 0)
+
+    def subset(self, names: Iterable[str]) -> 'LazyAnimations':
+        """Return a view limited to the given animations.
+
+        A name matches an animation key exactly or as its base, so 'walk'
+        selects walk, walk_up, walk_left, walk_down and walk_right.
+        """
+        names = set(names)
+        view = LazyAnimations(self.character_name, self.size)
+        view._files = self._files
+        view._frames = self._frames
+        view._keys = {k: b for k, b in self._keys.items() if k in names or b in names}
+        return view
+
+    @profiler.traced('assets.load_animation', 'assets')
+    def _load(self, base: str) -> None:
+        fns = self._files[base]
+        hitch.note_load('animation', f'{self.character_name}/{base}')
+        frames: list = []
+        cols = 0  # frames per direction row, for single-sheet strips
         if len(fns) == 1:
-            full = os.path.join(folder, fns[0])
+            full = os.path.join(ART_DIR, 'characters', self.character_name, fns[0])
             try:
-                surf = pygame.image.load(full)
+                surf = get(f'characters/{self.character_name}/{fns[0]}')
+                if surf is None:
+                    raise FileNotFoundError(full)
                 # strip-slicing heuristic - pass requested frame size (if any)
-                frames = _slice_horizontal_strip(surf, frame_size=size)
+                frames = _slice_horizontal_strip(surf, frame_size=self.size)
                 if frames:
-                    # Determine actual frame size from extracted frames (some sheets
-                    # may not match the requested `size`). Use that to compute rows/cols
-                    # and create per-row direction animations (up,left,down,right).
-                    try:
-                        sw, sh = surf.get_size()
-                        fw_actual = frames[0].get_width()
-                        fh_actual = frames[0].get_height()
-                        if fw_actual > 0 and fh_actual > 0 and (sw % fw_actual) == 0 and (sh % fh_actual) == 0:
-                            cols = sw // fw_actual
-                            rows = sh // fh_actual
-                            if rows >= 1 and cols > 0:
-                                dir_names = ['up', 'left', 'down', 'right']
-                                for r in range(min(rows, 4)):
-                                    start = r * cols
-                                    row_frames = frames[start:start+cols]
-                                    animations[f"{base}_{dir_names[r]}"] = row_frames
-                                # keep the flattened frames as the base key too
-                                animations[base] = frames
-                                SURFACES[f'characters/{character_name}/{fns[0]}'] = surf
-                                continue
-                    except Exception:
-                        pass
-                    # default: store flat frames under base
-                    animations[base] = frames
-                    # also register raw surface under SURFACES for backwards compatibility
-                    SURFACES[f'characters/{character_name}/{fns[0]}'] = surf
-                    continue
+                    cols = surf.get_width() // frames[0].get_width()
                 else:
                     # single-frame image
-                    animations[base] = [surf]
-                    SURFACES[f'characters/{character_name}/{fns[0]}'] = surf
-                    continue
+                    frames = [surf]
             except Exception as e:
+                # nothing cached: the next lookup tries again
                 print('Failed to load animation', full, e)
-
-        # otherwise try numbered frames like walk_0, walk_1
-        # sort by suffix if present
-            numbered = []
-        for fn in fns:
-            full = os.path.join(folder, fn)
-            try:
-                surf = pygame.image.load(full)
-                numbered.append((fn, surf))
-                SURFACES[f'characters/{character_name}/{fn}'] = surf
-            except Exception:
-                pass
-        if numbered:
-            # sort by filename (attempt numeric suffix sort)
-            def sort_key(t):
-                fn = t[0]
+                return
+        else:
+            # numbered frames like walk_0, walk_1: sort by numeric suffix if present
+            def sort_key(fn):
                 parts = fn.rsplit('_', 1)
                 if len(parts) == 2 and parts[1].split('.')[0].isdigit():
                     return int(parts[1].split('.')[0])
                 return fn
 
-            numbered.sort(key=sort_key)
-            frames = [t[1] for t in numbered]
-            animations[base] = frames
+            for fn in sorted(fns, key=sort_key):
+                surf = get(f'characters/{self.character_name}/{fn}')
+                if surf is not None:
+                    frames.append(surf)
+
+        # if size requested, scale frames (once: the direction rows are slices of them)
+        if self.size is not None:
+            frames = [pygame.transform.smoothscale(f, self.size) for f in frames]
+        # the flattened frames as the base key, and one animation per row by facing direction
+        loaded: Dict[str, list] = {base: frames}
+        if cols:
+            for r in range(min(len(frames) // cols, len(DIRECTION_ROWS))):
+                loaded[f"{base}_{DIRECTION_ROWS[r]}"] = frames[r * cols:(r + 1) * cols]
+        for key, b in self._keys.items():
+            if b == base:
+                self._frames.setdefault(key, loaded.get(key, []))
+        # the frames are cut (and scaled) now; unless a scene holds the
+        # sheets themselves, they go to the cold cache instead of staying
+        # in SURFACES for good
+        for fn in fns:
+            sheet_key = f'characters/{self.character_name}/{fn}'
+            if sheet_key not in _OWNERS:
+                _retire(sheet_key)
+
+    def __getitem__(self, key: str) -> list:
+        if key not in self._keys:
+            raise KeyError(key)
+        if key not in self._frames:
+            self._load(self._keys[key])
+        return self._frames.get(key, [])
+
+    def __contains__(self, key) -> bool:
+        return key in self._keys
+
+    def base_of(self, key: str) -> Optional[str]:
+        """The sheet (base name) key is cut from: 'walk' for 'walk_left'."""
+        return self._keys.get(key)
+
+    def unload(self, key: str) -> None:
+        """Forget the loaded frames of key's sheet (every key sharing its base); they reload on next access."""
+        base = self._keys.get(key)
+        for k, b in self._keys.items():
+            if b == base:
+                self._frames.pop(k, None)
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
 
-    # if size requested, scale frames
-    if size is not None:
-        scaled: Dict[str, list] = {}
-        for k, frames in animations.items():
-            scaled[k] = [pygame.transform.smoothscale(f, size) for f in frames]
-        ANIMATIONS[cache_key] = scaled
-        return scaled
+    def __repr__(self) -> str:
+        return f"LazyAnimations({self.character_name!r}, size={self.size}, {len(self._keys)} animations, {len(self._frames)} loaded)"
 
-    ANIMATIONS[cache_key] = animations
+
+def get_animations(character_name: str, size: Tuple[int, int] = None,
+                   only: Iterable[str] = None) -> Mapping:
+    """Return the animations in art/characters/<name>/ as a lazy mapping.
+
+    Behavior:
+    - If a file named <anim>.png exists and is a horizontal strip, slice it into frames
+      (one <anim>_<direction> key per row, plus <anim> with every frame).
+    - Else, collect files like <anim>_0.png, <anim>_1.png, ... sorted numerically.
+    Nothing is decoded until an animation is looked up, so pass only= (base
+    names like 'idle', 'walk' or exact keys) when iterating over items() to
+    load just the animations the caller plays. Results cached in ANIMATIONS.
+    """
+    cache_key = (character_name, size)
+    animations = ANIMATIONS.get(cache_key)
+    if animations is None:
+        animations = LazyAnimations(character_name, size)
+        folder = os.path.join(ART_DIR, 'characters', character_name)
+        if os.path.isdir(folder):
+            if not MANIFEST:
+                build_manifest()
+            animations._index(folder)
+        ANIMATIONS[cache_key] = animations
+    if only is not None:
+        return animations.subset(only)
     return animations
+
+
+def unload_animation(character_name: str, animation: str, size: Tuple[int, int] = None) -> None:
+    """Drop the cached frames of an animation's sheet loaded through get_animations."""
+    animations = ANIMATIONS.get((character_name, size))
+    if animations is not None:
+        animations.unload(animation)
@@ -0,0 +1,319 @@
+"""Sound effects bank and background music player.
+
+Sound effects are decoded once into mixer.Sound objects and shared by
+every scene (DriveScene used to decode horn.mp3 again on each start).
+
+Music files are read into memory on a background thread (prefetch_music,
+called by SceneManager with each scene's music_file before the scene
+starts), so the scene's start() doesn't open and read the file itself;
+tracks neither playing nor next are dropped again (release_music). The
+MusicPlayer is updated by SceneManager and fades between tracks: the old
+track is ramped down, then the new one starts from memory and fades in.
+A track whose file is still being read starts on the first update() after
+the read finishes, so neither play() nor a scene switch waits on the disk.
+
+mixer.music is a single stream, so two tracks can't overlap; and
+mixer.music.queue() only starts a track when the current one ends, which
+a track playing with loops=-1 never does. Fading through a short ramp with
+the next track already in memory is the closest to a gapless switch.
+
+MP3s can be transcoded to OGG Vorbis once with scripts/bake_audio.py (needs
+ffmpeg); resolve() then picks the baked file, which is cheaper to decode.
+"""
+
+import io
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional
+import pygame
+
+from . import hitch
+
+# baked OGG files live here, mirroring the source paths
+BAKED_DIR = os.path.join('.cache', 'audio')
+PREFETCH_WORKERS = 2
+# default ramp for the outgoing track when a new one starts
+FADE_OUT_MS = 500
+
+# containers
+SOUNDS: Dict[str, pygame.mixer.Sound] = {}
+MUSIC_DATA: Dict[str, bytes] = {}
+MISSING = set()  # paths that failed to load, so they're only reported once
+# path -> ids of the scenes holding the sound (see assets.AssetScope); sounds
+# loaded without an owner stay in the bank for the whole run
+_OWNERS: Dict[str, set] = {}
+
+_lock = threading.Lock()
+_pending: Dict[str, object] = {}  # path -> Future of a running prefetch
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def mixer_ready() -> bool:
+    return pygame.mixer.get_init() is not None
+
+
+def baked_path(path: str) -> str:
+    """Where scripts/bake_audio.py writes the OGG version of path."""
+    base, _ = os.path.splitext(os.path.normpath(path))
+    return os.path.join(BAKED_DIR, base + '.ogg')
+
+
+def resolve(path: str) -> str:
+    """Return the baked OGG for path if it is up to date, else path itself."""
+    if path.lower().endswith('.ogg'):
+        return path
+    baked = baked_path(path)
+    try:
+        if os.path.getmtime(baked) >= os.path.getmtime(path):
+            return baked
+    except OSError:
+        pass
+    return path
+
+
+def _report_missing(path: str, error: Exception) -> None:
+    if path not in MISSING:
+        MISSING.add(path)
+        print(f"Failed to load audio {path}: {error}")
+
+
+# --- sound effects ---
+
+def get_sound(path: str, volume: Optional[float] = None,
+              owner=None) -> Optional[pygame.mixer.Sound]:
+    """Return the shared Sound for path, decoding it on first use.
+
+    The Sound is shared between scenes: setting volume here changes it for
+    everyone, which is fine for effects that always play at one level.
+    Passing owner (a scene or its id) keeps the sound only until release(owner).
+    """
+    if owner is not None:
+        _OWNERS.setdefault(path, set()).add(owner if isinstance(owner, int) else id(owner))
+    sound = SOUNDS.get(path)
+    if sound is None:
+        if path in MISSING or not mixer_ready():
+            return None
+        hitch.note_load('sound', path)
+        try:
+            sound = pygame.mixer.Sound(resolve(path))
+        except Exception as e:
+            _report_missing(path, e)
+            return None
+        SOUNDS[path] = sound
+    if volume is not None:
+        sound.set_volume(volume)
+    return sound
+
+
+def play_sound(path: str, volume: Optional[float] = None) -> Optional[pygame.mixer.Channel]:
+    """Play a sound effect from the bank; returns its channel (None if it can't play)."""
+    sound = get_sound(path, volume)
+    if sound is None:
+        return None
+    return sound.play()
+
+
+def release(owner) -> int:
+    """Drop owner's claims and unload the sounds nobody holds any more.
+
+    Returns the number of sounds unloaded.
+    """
+    owner_id = owner if isinstance(owner, int) else id(owner)
+    unloaded = 0
+    for path in list(_OWNERS):
+        holders = _OWNERS[path]
+        holders.discard(owner_id)
+        if holders:
+            continue
+        del _OWNERS[path]
+        if SOUNDS.pop(path, None) is not None:
+            unloaded += 1
+    return unloaded
+
+
+def preload_sounds(paths: Iterable[str]) -> None:
+    """Decode sound effects now so the first play() doesn't stall."""
+    for path in paths:
+        get_sound(path)
+
+
+# --- music prefetch ---
+
+def _read_music(path: str) -> Optional[bytes]:
+    try:
+        with open(resolve(path), 'rb') as f:
+            data = f.read()
+    except OSError as e:
+        _report_missing(path, e)
+        data = None
+    with _lock:
+        if data is not None:
+            MUSIC_DATA[path] = data
+        _pending.pop(path, None)
+    return data
+
+
+def prefetch_music(path: str) -> None:
+    """Start reading a music file into memory on a background thread."""
+    global _executor
+    if not path:
+        return
+    with _lock:
+        if path in MUSIC_DATA or path in _pending or path in MISSING:
+            return
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS,
+                                           thread_name_prefix='music-prefetch')
+        _pending[path] = _executor.submit(_read_music, path)
+
+
+def release_music(keep: Iterable[Optional[str]]) -> int:
+    """Drop prefetched tracks other than keep (e.g. the playing and the next track).
+
+    Returns the number of tracks dropped; they are read again if played later.
+    """
+    keep = set(keep)
+    with _lock:
+        dropped = [path for path in MUSIC_DATA if path not in keep]
+        for path in dropped:
+            del MUSIC_DATA[path]
+    return len(dropped)
+
+
+def music_data(path: str) -> Optional[bytes]:
+    """Bytes of a music file, waiting for its prefetch or reading it now."""
+    with _lock:
+        data = MUSIC_DATA.get(path)
+        future = _pending.get(path)
+    if data is not None:
+        return data
+    if future is not None:
+        return future.result()
+    if path in MISSING:
+        return None
+    return _read_music(path)
+
+
+# --- music player ---
+
+class MusicPlayer:
+    """Background music with fades between tracks.
+
+    play() while another track is playing ramps that track down first, and
+    a track that isn't in memory yet starts once its prefetch is done;
+    update(dt) has to be called every frame (SceneManager does).
+    """
+
+    def __init__(self):
+        self.current: Optional[str] = None  # track playing (or fading out)
+        self.volume = 0.5
+        self._next = None  # (path, volume, loops, fade_ms) waiting for the fade-out
+        self._fade_total = 0.0
+        self._fade_left = 0.0
+
+    @property
+    def fading_out(self) -> bool:
+        return self._fade_left > 0
+
+    def play(self, path: str, volume: float = 0.5, loops: int = -1, fade_ms: int = 1000,
+             fade_out_ms: int = FADE_OUT_MS) -> None:
+        """Start path (fading in over fade_ms), after ramping the current track down.
+
+        Args:
+            path: music file (a baked OGG is used if there is one)
+            volume: 0.0 to 1.0
+            loops: -1 to loop forever
+            fade_ms: fade-in of the new track
+            fade_out_ms: ramp-down of the track currently playing
+        """
+        if not mixer_ready():
+            return
+        self._next = (path, volume, loops, fade_ms)
+        if self.current is not None and pygame.mixer.music.get_busy() and fade_out_ms > 0:
+            if not self.fading_out:
+                self._start_fade(fade_out_ms)
+            elif self._fade_left > fade_out_ms / 1000.0:
+                # already fading out slowly (scene end()): finish within
+                # fade_out_ms, continuing from the current volume
+                level = self._fade_left / self._fade_total
+                self._fade_left = fade_out_ms / 1000.0
+                self._fade_total = self._fade_left / level
+            return
+        self._start_next()
+
+    def fadeout(self, ms: int = 1000) -> None:
+        """Ramp the current track down and stop it."""
+        self._next = None
+        if self.current is not None and mixer_ready() and not self.fading_out:
+            self._start_fade(ms)
+
+    def stop(self) -> None:
+        self._next = None
+        self._fade_left = 0.0
+        self.current = None
+        if mixer_ready():
+            pygame.mixer.music.stop()
+
+    @property
+    def pending(self) -> bool:
+        """True while a track waits for the fade-out or for its file to be read."""
+        return self._next is not None
+
+    def update(self, dt: float) -> None:
+        if self.fading_out:
+            self._fade_left -= dt
+            if self._fade_left > 0:
+                pygame.mixer.music.set_volume(self.volume * self._fade_left / self._fade_total)
+                return
+            self._fade_left = 0.0
+            pygame.mixer.music.stop()
+            self.current = None
+        if self._next is not None:
+            self._start_next()
+
+    def _start_next(self) -> None:
+        # never read the file here: a track not in memory yet starts on a
+        # later update(), once its prefetch is done
+        path = self._next[0]
+        with _lock:
+            ready = path in MUSIC_DATA or path in MISSING
+        if not ready:
+            prefetch_music(path)
+            return
+        nxt, self._next = self._next, None
+        self._start(*nxt)
+
+    def _start_fade(self, ms: int) -> None:
+        self._fade_total = self._fade_left = max(ms, 1) / 1000.0
+
+    def _start(self, path: str, volume: float, loops: int, fade_ms: int) -> None:
+        data = music_data(path)
+        if data is None:
+            self.current = None
+            return
+        try:
+            source = resolve(path)
+            namehint = os.path.splitext(source)[1].lstrip('.')
+            hitch.note_load('music', path)
+            pygame.mixer.music.load(io.BytesIO(data), namehint)
+            pygame.mixer.music.set_volume(volume)
+            pygame.mixer.music.play(loops, fade_ms=fade_ms)
+        except Exception as e:
+            print(f"Failed to load music {path}: {e}")
+            self.current = None
+            return
+        self.current = path
+        self.volume = volume
+
+
+# the game's one music stream
+music = MusicPlayer()
+
+
+def clear() -> None:
+    """Drop cached sounds and music data (e.g. after re-baking)."""
+    with _lock:
+        SOUNDS.clear()
+        MUSIC_DATA.clear()
+        MISSING.clear()
@@ -0,0 +1,166 @@
+"""Cached procedural backgrounds.
+
+Scenes used to repaint their backdrops every frame: IntroScene drew its
+gradient one line at a time and DisneyScene re-filled the ground and
+rescaled the castle on every draw. Backgrounds here are generated once per
+size and description, converted to the display format, and then drawn
+with a single blit.
+
+- gradient(size, stops): vertical (or horizontal) colour gradient, built
+  with numpy/surfarray when numpy is available
+- backdrop(name, size, layers): static layers (fills, rects, images,
+  callables) composed once into one surface
+"""
+
+import pygame
+from typing import Dict, Sequence, Tuple, Union
+
+from . import assets
+
+try:
+    import numpy as np
+    import pygame.surfarray as surfarray
+except ImportError:  # numpy is optional; fall back to drawing lines once
+    np = None
+
+Color = Tuple[int, int, int]
+# (position, colour) with position in 0..1 from top (or left) edge
+Stop = Tuple[float, Color]
+
+# containers
+GRADIENTS: Dict[tuple, pygame.Surface] = {}
+BACKDROPS: Dict[tuple, pygame.Surface] = {}
+
+
+def _display_format(surf: pygame.Surface, alpha: bool = False) -> pygame.Surface:
+    return assets.display_format(surf, alpha)
+
+
+def _normalise_stops(stops: Sequence[Union[Stop, Color]]) -> Tuple[Stop, ...]:
+    """Accept either (position, colour) pairs or bare colours spaced evenly."""
+    stops = list(stops)
+    if stops and isinstance(stops[0][0], int) and len(stops[0]) >= 3:
+        if len(stops) == 1:
+            return ((0.0, tuple(stops[0][:3])),)
+        step = 1.0 / (len(stops) - 1)
+        return tuple((i * step, tuple(c[:3])) for i, c in enumerate(stops))
+    return tuple((float(p), tuple(c[:3])) for p, c in stops)
+
+
+def _ramp(length: int, stops: Tuple[Stop, ...]) -> list:
+    """Colour for each pixel along the gradient, truncated to ints.
+
+    Position t of pixel i is i / length, so a stop at 1.0 is the colour
+    just past the last pixel (matching the old per-line drawing code).
+    """
+    positions = [p for p, _ in stops]
+    ramp = []
+    for i in range(length):
+        t = i / length
+        if t <= positions[0]:
+            ramp.append(stops[0][1])
+            continue
+        if t >= positions[-1]:
+            ramp.append(stops[-1][1])
+            continue
+        for (p0, c0), (p1, c1) in zip(stops, stops[1:]):
+            if p0 <= t <= p1:
+                f = (t - p0) / (p1 - p0) if p1 > p0 else 0.0
+                ramp.append(tuple(int(a + (b - a) * f) for a, b in zip(c0, c1)))
+                break
+    return ramp
+
+
+def gradient(size: Tuple[int, int], stops: Sequence[Union[Stop, Color]],
+             vertical: bool = True) -> pygame.Surface:
+    """Return a cached gradient surface.
+
+    Args:
+        size: (width, height) of the surface
+        stops: (position, colour) pairs with positions in 0..1, or plain
+               colours spaced evenly from the first edge to the last
+        vertical: True for top-to-bottom, False for left-to-right
+
+    Returns:
+        Opaque surface in display format; don't draw onto it
+    """
+    stops = _normalise_stops(stops)
+    key = (tuple(size), stops, vertical)
+    surf = GRADIENTS.get(key)
+    if surf is not None:
+        return surf
+
+    w, h = size
+    length = h if vertical else w
+    surf = pygame.Surface((w, h))
+    if np is not None:
+        t = np.arange(length) / length
+        positions = [p for p, _ in stops]
+        ramp = np.stack([np.interp(t, positions, [c[ch] for _, c in stops]) for ch in range(3)], axis=-1)
+        # truncate like int() so the colours match the old per-line drawing
+        ramp = ramp.astype(np.uint8)
+        # surfarray arrays are indexed [x, y]
+        if vertical:
+            pixels = np.broadcast_to(ramp[np.newaxis, :, :], (w, h, 3))
+        else:
+            pixels = np.broadcast_to(ramp[:, np.newaxis, :], (w, h, 3))
+        surfarray.blit_array(surf, np.ascontiguousarray(pixels))
+    else:
+        for i, color in enumerate(_ramp(length, stops)):
+            if vertical:
+                pygame.draw.line(surf, color, (0, i), (w, i))
+            else:
+                pygame.draw.line(surf, color, (i, 0), (i, h))
+
+    surf = _display_format(surf)
+    GRADIENTS[key] = surf
+    return surf
+
+
+def backdrop(name: str, size: Tuple[int, int], layers: Sequence, alpha: bool = False) -> pygame.Surface:
+    """Compose static layers into one cached surface.
+
+    Layers are drawn in order; each is one of:
+    - a colour (r, g, b[, a]): fills the whole surface
+    - (colour, rect): fills rect
+    - (surface, pos): blits surface at pos
+    - a callable: called with the target surface to draw anything else
+
+    The layers are only used the first time a given (name, size) is
+    requested; later calls return the cached surface, so build any scaled
+    images inside a callable layer if they're expensive.
+
+    Args:
+        name: identifies the backdrop (e.g. 'disney-foreground')
+        size: (width, height) of the composed surface
+        layers: the layers, bottom first
+        alpha: keep per-pixel alpha (for layers drawn over dynamic content)
+
+    Returns:
+        Surface in display format; don't draw onto it
+    """
+    key = (name, tuple(size), alpha)
+    surf = BACKDROPS.get(key)
+    if surf is not None:
+        return surf
+
+    surf = pygame.Surface(size, pygame.SRCALPHA if alpha else 0)
+    for layer in layers:
+        if callable(layer):
+            layer(surf)
+        elif isinstance(layer[0], pygame.Surface):
+            surf.blit(layer[0], layer[1])
+        elif isinstance(layer[0], int):
+            surf.fill(layer)
+        else:
+            surf.fill(layer[0], pygame.Rect(layer[1]))
+
+    surf = _display_format(surf, alpha)
+    BACKDROPS[key] = surf
+    return surf
+
+
+def clear() -> None:
+    """Drop every cached gradient and backdrop (e.g. after a display mode change)."""
+    GRADIENTS.clear()
+    BACKDROPS.clear()
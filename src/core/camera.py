@@ -0,0 +1,87 @@
+"""Camera: map offset and native-resolution render target.
+
+The pixel art is 16px tiles and 64px LPC frames, but scenes upscaled every
+piece separately (backgrounds 4x, characters 2x) and shifted their maps by
+a hardcoded background_offset_y. A Camera holds both transforms:
+
+- position: which map point sits at the top-left of the view, replacing
+  the per-scene offsets (to_view/rect_to_view)
+- scale: the world is drawn into a native target scale times smaller than
+  the screen (to_native), and present() upscales it once with
+  nearest-neighbour, so backgrounds are kept and blitted at a quarter of
+  the pixels for scale 2
+
+Scene logic (positions, collision rects) stays in view coordinates, i.e.
+screen pixels; only drawing goes through to_native(). Text and UI are
+drawn on the screen after present() so they keep full resolution (which
+is why this doesn't use the pygame.SCALED display flag).
+"""
+
+import pygame
+from typing import Optional, Tuple
+
+from . import assets
+
+
+class Camera:
+    """Map-to-view offset plus an optional low-resolution world target."""
+
+    def __init__(self, view_size: Tuple[int, int] = (1024, 768), scale: int = 1,
+                 position: Tuple[int, int] = (0, 0)):
+        """
+        Args:
+            view_size: screen size in pixels
+            scale: integer upscale from the native target to the screen
+            position: map point shown at the view's top-left (map pixels at view scale)
+        """
+        self.view_size = tuple(view_size)
+        self.scale = max(1, int(scale))
+        self.x, self.y = position
+        w, h = self.view_size
+        # round up so the upscaled target always covers the view
+        self.native_size = (-(-w // self.scale), -(-h // self.scale))
+        self._target: Optional[pygame.Surface] = None
+        self._presented: Optional[pygame.Surface] = None  # upscale buffer when sizes don't match
+
+    # --- coordinates ---
+
+    def to_view(self, x: float, y: float) -> Tuple[float, float]:
+        """Map position -> view (screen) position."""
+        return x - self.x, y - self.y
+
+    def rect_to_view(self, rect: pygame.Rect) -> pygame.Rect:
+        """Move a map rect into view coordinates in place (and return it)."""
+        rect.move_ip(-self.x, -self.y)
+        return rect
+
+    def to_native(self, pos) -> Tuple[int, int]:
+        """View position -> pixel in the native target."""
+        return int(pos[0]) // self.scale, int(pos[1]) // self.scale
+
+    def native_rect(self, rect: pygame.Rect) -> pygame.Rect:
+        """View rect -> rect in the native target."""
+        s = self.scale
+        return pygame.Rect(rect.x // s, rect.y // s, rect.width // s, rect.height // s)
+
+    # --- rendering ---
+
+    def begin(self, surface: pygame.Surface) -> pygame.Surface:
+        """Return the surface to draw the world on: surface itself at scale 1, else the native target."""
+        if self.scale == 1:
+            return surface
+        if self._target is None:
+            self._target = assets.display_format(pygame.Surface(self.native_size))
+        return self._target
+
+    def present(self, surface: pygame.Surface) -> None:
+        """Upscale the native target onto surface (nearest-neighbour, no per-frame allocation)."""
+        if self.scale == 1 or self._target is None:
+            return
+        size = (self.native_size[0] * self.scale, self.native_size[1] * self.scale)
+        if surface.get_size() == size:
+            pygame.transform.scale(self._target, size, surface)
+            return
+        if self._presented is None:
+            self._presented = pygame.Surface(size, 0, self._target)
+        pygame.transform.scale(self._target, size, self._presented)
+        surface.blit(self._presented, (0, 0))
@@ -0,0 +1,136 @@
+"""Incremental photo collage.
+
+A montage that keeps adding photos used to re-check every placed photo to
+find a free spot and redraw every photo (with a fresh alpha copy and
+shadow) each frame, so its cost grew with the number of photos. Collage
+places photos through a spatial grid (only neighbouring cells are checked),
+and burns each photo into one cached surface once it has finished fading
+in. A frame then costs one blit of the collage plus the few photos still
+fading, however many photos are on screen.
+"""
+
+import random
+from typing import Dict, List, Optional, Tuple
+import pygame
+
+
+class Collage:
+    """Photos faded in one by one and accumulated into a single surface."""
+
+    def __init__(self, size: Tuple[int, int], min_distance: float = 140, margin: int = 90,
+                 fade_time: float = 0.15, shadow_offset: Tuple[int, int] = (3, 3),
+                 shadow_color=(0, 0, 0, 100)):
+        """
+        Args:
+            size: (width, height) of the area photos are placed in
+            min_distance: preferred minimum distance between photo centres
+            margin: keep photo centres this far from the edges
+            fade_time: seconds a photo takes to fade in
+            shadow_offset: drop shadow offset in pixels
+            shadow_color: drop shadow colour (with alpha)
+        """
+        self.size = size
+        self.min_distance = min_distance
+        self.margin = margin
+        self.fade_time = fade_time
+        self.shadow_offset = shadow_offset
+        self.shadow_color = shadow_color
+
+        self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        self.count = 0  # photos placed so far
+        self.fading: List[dict] = []  # photos still fading in, oldest first
+        # spatial grid of placed centres: (cell x, cell y) -> [(x, y), ...]
+        self._cell = max(1.0, float(min_distance))
+        self._grid: Dict[Tuple[int, int], List[Tuple[int, int]]] = {}
+        self._shadows: Dict[Tuple[int, int], pygame.Surface] = {}
+
+    def _cell_of(self, x: float, y: float) -> Tuple[int, int]:
+        return int(x // self._cell), int(y // self._cell)
+
+    def _nearest(self, x: float, y: float) -> float:
+        """Distance to the nearest placed centre, capped at min_distance.
+
+        Only the 3x3 neighbouring cells can hold a centre closer than
+        min_distance, so anything further away counts as min_distance.
+        """
+        cx, cy = self._cell_of(x, y)
+        best = self.min_distance
+        for gx in range(cx - 1, cx + 2):
+            for gy in range(cy - 1, cy + 2):
+                for px, py in self._grid.get((gx, gy), ()):
+                    d = ((x - px) ** 2 + (y - py) ** 2) ** 0.5
+                    if d < best:
+                        best = d
+        return best
+
+    def find_position(self, max_attempts: int = 50, rng: random.Random = None) -> Tuple[int, int]:
+        """Pick a centre at least min_distance from the others, or the best of max_attempts."""
+        rng = rng or random
+        w, h = self.size
+        best_pos, best_dist = None, -1.0
+        for _ in range(max_attempts):
+            x = rng.randint(self.margin, w - self.margin)
+            y = rng.randint(self.margin, h - self.margin)
+            dist = self._nearest(x, y)
+            if dist >= self.min_distance:
+                return x, y
+            if dist > best_dist:
+                best_pos, best_dist = (x, y), dist
+        return best_pos
+
+    def add(self, photo: pygame.Surface, pos: Optional[Tuple[int, int]] = None) -> Tuple[int, int]:
+        """Start fading a photo in centred at pos (picked with find_position if None)."""
+        if pos is None:
+            pos = self.find_position()
+        self._grid.setdefault(self._cell_of(*pos), []).append(pos)
+        self.fading.append({'photo': photo, 'x': pos[0], 'y': pos[1], 'alpha': 0, 'timer': 0.0})
+        self.count += 1
+        return pos
+
+    def update(self, dt: float) -> None:
+        """Advance the fades and burn finished photos into the collage."""
+        for item in self.fading:
+            item['timer'] += dt
+            if item['timer'] < self.fade_time:
+                item['alpha'] = int(255 * (item['timer'] / self.fade_time))
+            else:
+                item['alpha'] = 255
+        # photos fade for the same time, so the finished ones are at the front
+        while self.fading and self.fading[0]['alpha'] >= 255:
+            self._draw_photo(self.surface, self.fading.pop(0))
+
+    def draw(self, surface: pygame.Surface, pos: Tuple[int, int] = (0, 0)) -> None:
+        """Draw the collage, then the photos still fading in on top."""
+        if self.count == 0:
+            return
+        surface.blit(self.surface, pos)
+        for item in self.fading:
+            if item['alpha'] > 0:
+                self._draw_photo(surface, item, pos)
+
+    def clear(self) -> None:
+        """Remove every photo."""
+        self.surface.fill((0, 0, 0, 0))
+        self.fading.clear()
+        self._grid.clear()
+        self.count = 0
+
+    def _shadow(self, size: Tuple[int, int]) -> pygame.Surface:
+        shadow = self._shadows.get(size)
+        if shadow is None:
+            shadow = pygame.Surface(size, pygame.SRCALPHA)
+            shadow.fill(self.shadow_color)
+            self._shadows[size] = shadow
+        return shadow
+
+    def _draw_photo(self, surface: pygame.Surface, item: dict, offset: Tuple[int, int] = (0, 0)) -> None:
+        photo = item['photo']
+        x, y = int(item['x']) + offset[0], int(item['y']) + offset[1]
+        shadow = self._shadow(photo.get_size())
+        sx, sy = self.shadow_offset
+        surface.blit(shadow, shadow.get_rect(center=(x + sx, y + sy)))
+        # photos are usually shared surfaces: set the fade alpha just for this blit
+        old_alpha = photo.get_alpha()
+        photo.set_alpha(item['alpha'])
+        surface.blit(photo, photo.get_rect(center=(x, y)))
+        photo.set_alpha(old_alpha)
@@ -0,0 +1,140 @@
+"""Frame pacing for Game.run: precise when animating, idle when nothing moves.
+
+Game.run used to clock.tick(60) and redraw every frame whatever was on
+screen, which keeps a core busy on the scene menu, a finished transition
+message or a game sitting in the background. The pacer picks how to wait
+for each frame:
+
+- animating: sleep until shortly before the frame is due, then spin the
+  last SPIN_MS (sleep alone wakes up to a millisecond or two late, which
+  shows as uneven motion); frames are scheduled on a fixed grid, so a late
+  frame doesn't push the following ones back
+- static: the scene says how long it will look the same without input
+  (Scene.idle_time, combined with transitions, loading and music fades in
+  SceneManager.idle_time); the loop blocks in pygame.event.wait until
+  input arrives or that time is up (at most MAX_IDLE_WAIT_MS)
+- background: while the window is unfocused or minimised, frames run at
+  BACKGROUND_FPS the same way, and nothing is drawn while minimised
+
+Events woken up by the wait are handed back through events(), in order.
+"""
+
+import time
+from typing import List
+
+import pygame
+
+# frame rate while the window is unfocused or minimised
+BACKGROUND_FPS = 10
+# static screens still run a frame this often
+MAX_IDLE_WAIT_MS = 500
+# the end of each wait is spun rather than slept
+SPIN_MS = 2.0
+
+# pacing modes (see FramePacer.mode)
+ANIMATING = 'animating'
+STATIC = 'static'
+BACKGROUND = 'background'
+
+
+class FramePacer:
+    """Waits for the next frame in Game.run (see the module docstring)."""
+
+    def __init__(self, fps: float, adaptive: bool = True):
+        """
+        Args:
+            fps: frame rate while animating
+            adaptive: wait for input on static screens and slow down in
+                the background (False: always fps)
+        """
+        self.fps = fps
+        self.adaptive = adaptive
+        self.focused = True
+        self.minimized = False
+        self.mode = ANIMATING
+        self._last = time.perf_counter()
+        self._due = self._last
+        self._woken: List[pygame.event.EventType] = []
+        # how late animating frames started, for summary()
+        self.frames = 0
+        self.late_total = 0.0
+        self.late_worst = 0.0
+
+    @property
+    def visible(self) -> bool:
+        """False while minimised: the frame needn't be drawn."""
+        return not self.minimized
+
+    def tick(self, idle_time: float = 0.0) -> float:
+        """Wait until the next frame should run; returns the seconds since the last one.
+
+        Args:
+            idle_time: seconds the screen stays the same without input
+                (SceneManager.idle_time)
+        """
+        period = 1.0 / self.fps
+        if self.adaptive and (self.minimized or not self.focused):
+            self.mode = BACKGROUND
+            self._wait_event(self._last + 1.0 / BACKGROUND_FPS)
+        elif self.adaptive and idle_time > period:
+            self.mode = STATIC
+            self._wait_event(self._last + min(idle_time, MAX_IDLE_WAIT_MS / 1000.0))
+        else:
+            self.mode = ANIMATING
+            self._due += period
+            now = time.perf_counter()
+            if self._due < now - period:
+                # more than a frame behind (a hitch, or coming back from idle): restart the grid
+                self._due = now
+            self._sleep_until(self._due)
+        now = time.perf_counter()
+        if self.mode == ANIMATING:
+            late = now - self._due
+            self.frames += 1
+            self.late_total += late
+            self.late_worst = max(self.late_worst, late)
+        else:
+            self._due = now
+        dt = now - self._last
+        self._last = now
+        return dt
+
+    def _sleep_until(self, deadline: float) -> None:
+        remaining = deadline - time.perf_counter() - SPIN_MS / 1000.0
+        if remaining > 0:
+            time.sleep(remaining)
+        while time.perf_counter() < deadline:
+            pass
+
+    def _wait_event(self, deadline: float) -> None:
+        """Block until an event arrives or deadline passes."""
+        if self._woken or pygame.event.peek():
+            return
+        timeout = int((deadline - time.perf_counter()) * 1000)
+        if timeout <= 0:
+            return
+        event = pygame.event.wait(timeout)
+        if event.type != pygame.NOEVENT:
+            self._woken.append(event)
+
+    def events(self) -> List[pygame.event.EventType]:
+        """This frame's events (the one that ended the wait first), tracking focus."""
+        events = self._woken + pygame.event.get()
+        self._woken = []
+        for event in events:
+            if event.type == pygame.WINDOWFOCUSLOST:
+                self.focused = False
+            elif event.type == pygame.WINDOWFOCUSGAINED:
+                self.focused = True
+            elif event.type in (pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN):
+                self.minimized = True
+            elif event.type in (pygame.WINDOWRESTORED, pygame.WINDOWSHOWN, pygame.WINDOWMAXIMIZED):
+                self.minimized = False
+        return events
+
+    def summary(self) -> str:
+        """How late animating frames started (sleep-then-spin accuracy)."""
+        if not self.frames:
+            return "frame_pacer: no animating frames"
+        return (f"frame_pacer: {self.frames} animating frames at {self.fps} fps, started "
+                f"{self.late_total * 1000 / self.frames:.3f} ms late on average, worst {self.late_worst * 1000:.2f} ms")
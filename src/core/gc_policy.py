@@ -0,0 +1,162 @@
+"""Schedule CPython's garbage collector around frames and scene switches.
+
+Every frame makes plenty of short-lived containers (traffic rects,
+particle dicts, wrapped text lines), so the collector kicks in whenever
+its allocation counters say so: in the middle of a draw, and now and then
+as a multi-millisecond full collection. With --gc-policy, Game.run hands
+the collector to a GCPolicy instead:
+
+- install() collects once and gc.freeze()s what startup built (modules,
+  the shared assets, the splash scene), so later full collections don't
+  walk it, and raises the thresholds so automatic collections get rare
+- end_frame() runs a full collection once a new scene has finished
+  loading (the switch frame is slow anyway and the old scene was just
+  released), and otherwise spends the frame's idle time, the part of the
+  frame budget the frame pacer would wait through, on young collections that
+  are expected to fit in it (from the pauses measured so far)
+
+Every collection is timed through gc.callbacks: pauses show up as spans
+in profiler traces and as loads in hitch reports, and summary() (printed
+on exit) compares the automatic ones with the scheduled ones.
+"""
+
+import gc
+import time
+from typing import Dict, List
+
+from . import hitch, profiler
+
+# automatic collection thresholds while installed (CPython's default is 700, 10, 10)
+THRESHOLDS = (10000, 20, 100)
+# young objects worth an idle collection
+IDLE_MIN_OBJECTS = 1000
+# idle time kept free for the frame pacer's own timing
+IDLE_MARGIN_MS = 1.0
+# pauses from this long count as hitches in summary()
+LONG_PAUSE_MS = 2.0
+# assumed cost of a collection not measured yet, per generation
+INITIAL_ESTIMATE_MS = (0.5, 2.0, 20.0)
+
+
+class _PauseStats:
+    __slots__ = ('count', 'total', 'worst', 'long')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.worst = 0.0
+        self.long = 0
+
+    def add(self, ms: float) -> None:
+        self.count += 1
+        self.total += ms
+        self.worst = max(self.worst, ms)
+        if ms >= LONG_PAUSE_MS:
+            self.long += 1
+
+
+class GCPolicy:
+    """Runs the collector between frames rather than mid-frame (see the module docstring)."""
+
+    def __init__(self, thresholds=THRESHOLDS):
+        self.thresholds = tuple(thresholds)
+        self.installed = False
+        self._saved_thresholds = gc.get_threshold()
+        self._scheduled = False  # a collection we started is running
+        self._start = 0.0
+        self._span = None
+        self._scene_id = None  # id() of the scene last collected for
+        # 'auto' or 'scheduled' -> one _PauseStats per generation
+        self.pauses: Dict[str, List[_PauseStats]] = {
+            'auto': [_PauseStats() for _ in range(3)],
+            'scheduled': [_PauseStats() for _ in range(3)],
+        }
+        self.frozen = 0
+
+    def install(self, scene=None) -> None:
+        """Time collections, freeze the startup objects and raise the thresholds."""
+        if self.installed:
+            return
+        gc.callbacks.append(self._on_gc)
+        self._collect(2)
+        gc.freeze()
+        self.frozen = gc.get_freeze_count()
+        gc.set_threshold(*self.thresholds)
+        self._scene_id = id(scene)
+        self.installed = True
+
+    def uninstall(self) -> None:
+        """Restore the thresholds and stop timing collections."""
+        if not self.installed:
+            return
+        gc.set_threshold(*self._saved_thresholds)
+        gc.unfreeze()
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+        self.installed = False
+
+    def end_frame(self, scene, loading: bool, idle_ms: float) -> None:
+        """Collect after a scene switch, or in the time left until the next frame.
+
+        Args:
+            scene: the current scene
+            loading: its generator start() hasn't finished (see SceneManager)
+            idle_ms: time left in this frame's budget
+        """
+        if not self.installed or loading:
+            return
+        if id(scene) != self._scene_id:
+            self._scene_id = id(scene)
+            self._collect(2)
+            return
+        idle_ms -= IDLE_MARGIN_MS
+        young, middle, _ = gc.get_count()
+        if young < IDLE_MIN_OBJECTS:
+            return
+        # the older generation too once it is halfway to its threshold
+        generation = 1 if middle >= self.thresholds[1] // 2 else 0
+        while generation >= 0 and self._estimate(generation) > idle_ms:
+            generation -= 1
+        if generation >= 0:
+            self._collect(generation)
+
+    def _estimate(self, generation: int) -> float:
+        stats = self.pauses['scheduled'][generation]
+        if not stats.count:
+            return INITIAL_ESTIMATE_MS[generation]
+        # twice the mean: a collection overrunning the frame is the thing to avoid
+        return 2 * stats.total / stats.count
+
+    def _collect(self, generation: int) -> None:
+        self._scheduled = True
+        try:
+            gc.collect(generation)
+        finally:
+            self._scheduled = False
+
+    def _on_gc(self, phase: str, info: dict) -> None:
+        if phase == 'start':
+            self._span = profiler.span('gc', 'gc', {'generation': info['generation']})
+            self._span.__enter__()
+            self._start = time.perf_counter()
+            return
+        ms = (time.perf_counter() - self._start) * 1000
+        if self._span is not None:
+            self._span.__exit__(None, None, None)
+            self._span = None
+        kind = 'scheduled' if self._scheduled else 'auto'
+        generation = info['generation']
+        self.pauses[kind][generation].add(ms)
+        hitch.note_load('gc', f"{kind} gen{generation} {ms:.1f} ms, {info['collected']} collected")
+
+    def summary(self) -> str:
+        """Collections and their pauses, automatic vs scheduled, per generation."""
+        lines = [f"gc: {self.frozen} startup objects frozen, thresholds {self.thresholds}"]
+        for kind, generations in self.pauses.items():
+            for generation, stats in enumerate(generations):
+                if not stats.count:
+                    continue
+                lines.append(f"  {kind:9s} gen{generation}: {stats.count:5d} collections, "
+                             f"mean {stats.total / stats.count:6.2f} ms, worst {stats.worst:6.2f} ms, "
+                             f"{stats.long} over {LONG_PAUSE_MS:g} ms")
+        return '\n'.join(lines)
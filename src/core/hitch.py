@@ -0,0 +1,196 @@
+"""Frame hitch detector: catch single slow frames that averages hide.
+
+A scene start, a mask scan or a mixer load costs one 80 ms frame now and
+then, which never shows in the FPS. Game.run wraps every frame:
+
+    hitches.begin_frame(scene_name)
+    hitches.enter('event')   ...   hitches.enter('update')   ...   hitches.enter('draw')
+    hitches.end_frame(scene_name)
+
+A frame whose work (the clock's sleep excluded) takes longer than the
+budget is logged with the scene, the time spent per phase, the assets and
+sounds loaded during the frame (reported by the loaders through
+note_load()) and Python stacks of the main thread, sampled by a helper
+thread while the frame was still over budget. Entries go to a log file
+rotated at LOG_MAX_BYTES; close() prints the worst offenders.
+
+`python game.py --hitch-budget 33` changes the budget, 0 turns it off.
+"""
+
+import os
+import sys
+import threading
+import time
+import traceback
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_BUDGET_MS = 20.0
+LOG_PATH = os.path.join('profiles', 'hitches.log')
+LOG_MAX_BYTES = 1024 * 1024
+LOG_BACKUPS = 3
+# stacks sampled per slow frame, and frames kept per stack
+MAX_SAMPLES = 3
+STACK_DEPTH = 12
+# offenders printed by close()
+SUMMARY_SIZE = 10
+
+_active: Optional['HitchDetector'] = None
+
+
+def note_load(kind: str, name: str) -> None:
+    """Tell the running detector something was loaded (called by the asset and audio loaders)."""
+    detector = _active
+    if detector is not None and detector.frame_start is not None:
+        detector.loads.append((kind, name, detector.phase))
+
+
+class HitchDetector:
+    """Watches frame times and logs the slow ones (see the module docstring)."""
+
+    def __init__(self, budget_ms: float = DEFAULT_BUDGET_MS, log_path: str = LOG_PATH):
+        global _active
+        self.budget = budget_ms / 1000.0
+        self.log_path = log_path
+        self.frame_start: Optional[float] = None
+        self.frame_id = 0
+        self.scene = ''
+        self.phase = ''
+        self.loads: List[Tuple[str, str, str]] = []
+        self._phase_start = 0.0
+        self._phase_times: Dict[str, float] = {}
+        self._samples: List[Tuple[str, List[str]]] = []
+        # (scene, slowest phase, innermost game frame) -> [count, worst ms, total ms]
+        self.offenders: Dict[Tuple[str, str, str], list] = {}
+        self.hitches = 0
+        self._main_id = threading.get_ident()
+        self._stop = threading.Event()
+        self._in_frame = threading.Event()  # set from begin_frame to end_frame; the watchdog waits on it
+        self._thread = threading.Thread(target=self._watch, name='hitch-watchdog', daemon=True)
+        self._thread.start()
+        _active = self
+
+    # --- main thread ---
+
+    def begin_frame(self, scene: str = '') -> None:
+        self.frame_id += 1
+        self.scene = scene
+        self.loads = []
+        self._samples = []
+        self._phase_times = {}
+        self.phase = ''
+        self.frame_start = self._phase_start = time.perf_counter()
+        self._in_frame.set()
+
+    def enter(self, phase: str) -> None:
+        """Start the next phase of the frame (closing the previous one)."""
+        now = time.perf_counter()
+        if self.phase:
+            self._phase_times[self.phase] = self._phase_times.get(self.phase, 0.0) + now - self._phase_start
+        self.phase = phase
+        self._phase_start = now
+
+    def end_frame(self, scene: Optional[str] = None) -> Optional[float]:
+        """Finish the frame; returns its time in ms if it was over budget.
+
+        scene is the scene at the end of the frame, if the frame switched scenes.
+        """
+        self.enter('')
+        if scene and scene != self.scene:
+            self.scene = f'{self.scene} -> {scene}'
+        elapsed = time.perf_counter() - self.frame_start
+        self.frame_start = None
+        self._in_frame.clear()
+        if elapsed <= self.budget:
+            return None
+        ms = elapsed * 1000
+        self.hitches += 1
+        slowest = max(self._phase_times, key=self._phase_times.get, default='')
+        self._record_offender(ms, slowest)
+        self._write(ms)
+        return ms
+
+    def _record_offender(self, ms: float, slowest: str) -> None:
+        where = ''
+        for phase, stack in self._samples:
+            if phase == slowest or not where:
+                where = stack[-1].strip() if stack else ''
+        key = (self.scene, slowest, where)
+        entry = self.offenders.setdefault(key, [0, 0.0, 0.0])
+        entry[0] += 1
+        entry[1] = max(entry[1], ms)
+        entry[2] += ms
+
+    def _write(self, ms: float) -> None:
+        lines = [f"{time.strftime('%Y-%m-%d %H:%M:%S')} frame {self.frame_id} {self.scene}: "
+                 f"{ms:.1f} ms (budget {self.budget * 1000:.0f})"]
+        lines.append('  phases: ' + ', '.join(f'{p} {t * 1000:.1f} ms' for p, t in self._phase_times.items()))
+        for kind, name, phase in self.loads:
+            lines.append(f'  load [{phase}] {kind}: {name}')
+        for phase, stack in self._samples:
+            lines.append(f'  stack [{phase}]:')
+            lines.extend('    ' + line for line in stack)
+        try:
+            self._rotate()
+            with open(self.log_path, 'a') as f:
+                f.write('\n'.join(lines) + '\n')
+        except OSError as e:
+            print(f"hitch: could not write {self.log_path}: {e}")
+
+    def _rotate(self) -> None:
+        folder = os.path.dirname(self.log_path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        if not os.path.exists(self.log_path) or os.path.getsize(self.log_path) < LOG_MAX_BYTES:
+            return
+        for i in range(LOG_BACKUPS - 1, 0, -1):
+            older = f'{self.log_path}.{i}'
+            if os.path.exists(older):
+                os.replace(older, f'{self.log_path}.{i + 1}')
+        os.replace(self.log_path, f'{self.log_path}.1')
+
+    # --- watchdog thread ---
+
+    def _watch(self) -> None:
+        # poll at a quarter of the budget: a slow frame is sampled soon after it goes over;
+        # between frames (the pacer waiting for input, say) the thread sleeps
+        interval = max(0.002, self.budget / 4)
+        while True:
+            self._in_frame.wait()
+            if self._stop.wait(interval):
+                return
+            start = self.frame_start
+            if start is None or len(self._samples) >= MAX_SAMPLES:
+                continue
+            if time.perf_counter() - start < self.budget * (len(self._samples) + 1):
+                continue
+            frame_id, phase = self.frame_id, self.phase
+            main = sys._current_frames().get(self._main_id)
+            if main is None:
+                continue
+            stack = [f'{os.path.basename(f.filename)}:{f.lineno} {f.name}  {f.line or ""}'.rstrip()
+                     for f in traceback.extract_stack(main, limit=STACK_DEPTH)]
+            del main
+            # the frame may have ended while the stack was taken
+            if frame_id == self.frame_id and self.frame_start is not None:
+                self._samples.append((phase, stack))
+
+    # --- shutdown ---
+
+    def summary(self) -> str:
+        """The worst offenders: where slow frames happened most, by total time lost."""
+        lines = [f"hitch: {self.hitches} frames over {self.budget * 1000:.0f} ms (log: {self.log_path})"]
+        ranked = sorted(self.offenders.items(), key=lambda item: -item[1][2])[:SUMMARY_SIZE]
+        for (scene, phase, where), (count, worst, total) in ranked:
+            lines.append(f"  {count:4d}x  worst {worst:7.1f} ms  {scene or '-'} [{phase}] {where}")
+        return '\n'.join(lines)
+
+    def close(self) -> None:
+        """Stop the watchdog and print the summary."""
+        global _active
+        self._stop.set()
+        self._in_frame.set()
+        self._thread.join(timeout=1.0)
+        if _active is self:
+            _active = None
+        if self.hitches:
+            print(self.summary())
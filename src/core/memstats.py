@@ -0,0 +1,243 @@
+"""Surface memory accounting and leak checks across scene transitions.
+
+Pixels live in a few global registries (assets.SURFACES, assets.ANIMATIONS,
+animation_sets.SETS, backgrounds) and in whatever scenes keep on their
+attributes (scaled roads, photos, rotation caches...). report() walks all
+of them and adds up w * h * bytesize per owner, counting each surface once
+and subsurface views as free (they share their parent's pixels):
+
+    print(memstats.format_report(memstats.report(manager)))
+
+With tracking enabled (enable(), or `python game.py --memstats`),
+SceneManager.go_to also:
+
+- takes a tracemalloc snapshot and prints the biggest allocation changes
+  since the previous scene switch
+- remembers the surfaces only the finished scene owned, and a couple of
+  frames later warns if the scene or any of those surfaces is still
+  reachable (something outside the scene kept a reference)
+
+F9 in the game and scripts/benchmark_scenes.py --memory print the report.
+"""
+
+import gc
+import tracemalloc
+import weakref
+import pygame
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from . import animation_sets, assets, audio, backgrounds
+
+# frames to wait after go_to before checking the finished scene is gone
+# (the old scene's own update() is usually still on the stack during go_to)
+CHECK_DELAY_FRAMES = 2
+# how deep report() follows a scene's attributes
+MAX_DEPTH = 6
+# allocation changes printed per scene switch
+TOP_ALLOCATIONS = 8
+
+ENABLED = False
+
+# only objects from this package are walked attribute by attribute
+_PACKAGE = __name__.split('.')[0] + '.'
+# attributes and types that point back at shared state rather than at what
+# an object owns
+_SKIP_ATTRIBUTES = {'manager'}
+_SKIP_TYPES = {'SceneManager', 'Game'}
+
+_snapshot: Optional[tracemalloc.Snapshot] = None
+# (scene name, weakref to scene, weakrefs to its surfaces, frames left)
+_pending: List[list] = []
+
+
+class Usage(NamedTuple):
+    count: int
+    bytes: int
+
+
+def surface_bytes(surf: pygame.Surface) -> int:
+    """Pixel bytes owned by surf (0 for subsurfaces, which share their parent's)."""
+    if surf.get_parent() is not None:
+        return 0
+    w, h = surf.get_size()
+    return w * h * surf.get_bytesize()
+
+
+def _walk(obj, found: Dict[int, pygame.Surface], seen: set, depth: int = 0) -> None:
+    """Collect the surfaces reachable from obj into found (by id)."""
+    if isinstance(obj, pygame.Surface):
+        found.setdefault(id(obj), obj)
+        return
+    if depth > MAX_DEPTH or id(obj) in seen:
+        return
+    if isinstance(obj, (str, bytes, int, float, bool, type(None))):
+        return
+    seen.add(id(obj))
+    if isinstance(obj, dict):
+        for value in list(obj.values()):
+            _walk(value, found, seen, depth + 1)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for value in list(obj):
+            _walk(value, found, seen, depth + 1)
+    elif type(obj).__module__.startswith(_PACKAGE) and type(obj).__name__ not in _SKIP_TYPES:
+        for name, value in list(getattr(obj, '__dict__', {}).items()):
+            if name not in _SKIP_ATTRIBUTES:
+                _walk(value, found, seen, depth + 1)
+
+
+def surfaces_of(obj) -> Dict[int, pygame.Surface]:
+    """Surfaces reachable from obj's attributes, by id."""
+    found: Dict[int, pygame.Surface] = {}
+    _walk(obj, found, set())
+    return found
+
+
+def _registries() -> Iterable[Tuple[str, object]]:
+    yield 'assets.SURFACES', assets.SURFACES
+    yield 'assets.COLD', assets.COLD
+    yield 'assets.ANIMATIONS', [a._frames for a in list(assets.ANIMATIONS.values())]
+    yield 'animation_sets', [(s.frames, s.variants) for s in list(animation_sets.SETS.values())]
+    yield 'backgrounds', (backgrounds.GRADIENTS, backgrounds.BACKDROPS)
+
+
+def _global_surfaces() -> Dict[str, Dict[int, pygame.Surface]]:
+    owners = {}
+    claimed: set = set()
+    # the screen isn't owned by whichever scene kept a reference to it
+    screen = pygame.display.get_surface() if pygame.display.get_init() else None
+    if screen is not None:
+        owners['display'] = {id(screen): screen}
+        claimed.add(id(screen))
+    for owner, container in _registries():
+        found = {k: s for k, s in surfaces_of(container).items() if k not in claimed}
+        claimed.update(found)
+        owners[owner] = found
+    return owners
+
+
+def _usage(surfaces: Dict[int, pygame.Surface]) -> Usage:
+    return Usage(len(surfaces), sum(surface_bytes(s) for s in surfaces.values()))
+
+
+def report(manager=None) -> Dict[str, Usage]:
+    """Surface count and pixel bytes per owner.
+
+    Owners are the global registries, the manager's transition buffers and
+    the current scene ('scene:<ClassName>', only surfaces no registry
+    holds). Music read into memory is listed as 'audio.MUSIC_DATA'.
+    """
+    owners = _global_surfaces()
+    result = {owner: _usage(found) for owner, found in owners.items()}
+    claimed = set()
+    for found in owners.values():
+        claimed.update(found)
+    if manager is not None:
+        for owner, obj in (('transitions', getattr(manager, 'transitions', None)),
+                           (f'scene:{type(manager.scene).__name__}', manager.scene)):
+            if obj is None:
+                continue
+            found = {k: s for k, s in surfaces_of(obj).items() if k not in claimed}
+            claimed.update(found)
+            result[owner] = _usage(found)
+    music = list(audio.MUSIC_DATA.values())
+    result['audio.MUSIC_DATA'] = Usage(len(music), sum(len(b) for b in music))
+    return result
+
+
+def format_report(usage: Dict[str, Usage]) -> str:
+    """Render report() as a table, biggest owner first."""
+    lines = [f"{'owner':32s} {'count':>7s} {'MB':>9s}"]
+    total = 0
+    for owner, (count, size) in sorted(usage.items(), key=lambda item: -item[1].bytes):
+        lines.append(f"{owner:32s} {count:7d} {size / 1048576:9.2f}")
+        total += size
+    lines.append(f"{'total':32s} {'':7s} {total / 1048576:9.2f}")
+    return '\n'.join(lines)
+
+
+def enable(frames: int = 1) -> None:
+    """Start tracemalloc and check every scene switch (costs some speed)."""
+    global ENABLED
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(frames)
+    ENABLED = True
+
+
+def disable() -> None:
+    global ENABLED, _snapshot
+    ENABLED = False
+    _snapshot = None
+    _pending.clear()
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def scene_finished(scene) -> None:
+    """Remember what a scene that just ended owns, to check it gets freed.
+
+    Called by SceneManager.go_to before the next scene starts.
+    """
+    if not ENABLED or scene is None:
+        return
+    claimed = set()
+    for found in _global_surfaces().values():
+        claimed.update(found)
+    refs = []
+    for key, surf in surfaces_of(scene).items():
+        if key not in claimed and surface_bytes(surf):
+            refs.append(weakref.ref(surf))
+    _pending.append([type(scene).__name__, weakref.ref(scene), refs, CHECK_DELAY_FRAMES])
+
+
+def scene_changed() -> None:
+    """Snapshot allocations and print what grew since the previous switch."""
+    global _snapshot
+    if not ENABLED or not tracemalloc.is_tracing():
+        return
+    snapshot = tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    ))
+    if _snapshot is not None:
+        print('memstats: biggest allocation changes since the last scene switch')
+        for stat in snapshot.compare_to(_snapshot, 'lineno')[:TOP_ALLOCATIONS]:
+            print('  ', stat)
+    _snapshot = snapshot
+
+
+def check_finished(force: bool = False) -> List[str]:
+    """Warn about finished scenes whose surfaces are still reachable.
+
+    Called every frame by SceneManager.update; a scene is checked
+    CHECK_DELAY_FRAMES frames after it ended (or now with force).
+    Returns the warnings printed.
+    """
+    if not _pending:
+        return []
+    due = []
+    for entry in _pending:
+        entry[3] -= 1
+        if force or entry[3] <= 0:
+            due.append(entry)
+    if not due:
+        return []
+    gc.collect()
+    # surfaces a registry (the cold cache included) holds now aren't leaks
+    claimed = set()
+    for found in _global_surfaces().values():
+        claimed.update(found)
+    warnings = []
+    for entry in due:
+        _pending.remove(entry)
+        name, scene_ref, refs, _ = entry
+        alive = [s for s in (r() for r in refs) if s is not None and id(s) not in claimed]
+        if scene_ref() is not None:
+            warnings.append(f"memstats: {name} ended but is still reachable "
+                            f"({len(alive)} surfaces, {sum(map(surface_bytes, alive)) / 1048576:.2f} MB)")
+        elif alive:
+            warnings.append(f"memstats: {len(alive)} surfaces ({sum(map(surface_bytes, alive)) / 1048576:.2f} MB) "
+                            f"from finished {name} are still alive")
+    for warning in warnings:
+        print(warning)
+    return warnings
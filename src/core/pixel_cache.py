@@ -0,0 +1,177 @@
+"""Persistent cache of decoded (and optionally resized) pixels.
+
+Decoding PNG/JPEG files dominates scene starts. The first time an image is
+decoded for a given transform the raw RGBA pixels are written to a blob in
+CACHE_DIR; later runs read the blob back through a memory map and wrap
+the pixels with pygame.image.frombuffer, skipping the decoder entirely.
+
+Blob layout: a fixed header (see HEADER) followed by width*height*4 bytes
+of RGBA (or RGBX for opaque images). Blobs are named after a hash of the
+source path and transform and are invalidated when the source's mtime and
+size change and its content hash no longer matches. The directory is kept
+under MAX_CACHE_BYTES by evicting the least recently used blobs.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import pygame
+from typing import Callable, Optional
+
+# Get the project root (two levels up from src/core/)
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+CACHE_DIR = os.path.join(ROOT, '.cache', 'pixels')
+MAX_CACHE_BYTES = 256 * 1024 * 1024
+# set to False to always decode from the source files
+ENABLED = True
+
+MAGIC = b'PXC1'
+VERSION = 1
+FLAG_ALPHA = 1
+# magic, version, flags, width, height, source size, source mtime (ns), source hash
+HEADER = struct.Struct('<4sHHIIQQ16s')
+
+_lock = threading.Lock()
+
+
+def _blob_path(source_path: str, transform: str) -> str:
+    ident = f"{os.path.abspath(source_path)}|{transform}".encode('utf-8')
+    return os.path.join(CACHE_DIR, hashlib.sha1(ident).hexdigest() + '.px')
+
+
+def _source_hash(source_path: str) -> bytes:
+    h = hashlib.blake2b(digest_size=16)
+    with open(source_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            h.update(chunk)
+    return h.digest()
+
+
+def load(source_path: str, transform: str = 'raw') -> Optional[pygame.Surface]:
+    """Return the cached surface for (source, transform), or None on a miss.
+
+    The surface owns a copy of the pixels (the blob's memory map is closed
+    before returning), so it can be drawn onto like a decoded image.
+    """
+    if not ENABLED:
+        return None
+    blob = _blob_path(source_path, transform)
+    try:
+        st = os.stat(source_path)
+        with open(blob, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    try:
+        magic, version, flags, w, h, size, mtime_ns, digest = HEADER.unpack_from(mm, 0)
+        if magic != MAGIC or version != VERSION or len(mm) != HEADER.size + w * h * 4:
+            raise ValueError('corrupt blob')
+        if size != st.st_size or mtime_ns != st.st_mtime_ns:
+            # touched but maybe unchanged (e.g. a fresh checkout): compare content
+            if size != st.st_size or digest != _source_hash(source_path):
+                raise ValueError('stale blob')
+            _rewrite_header(blob, flags, w, h, st, digest)
+        fmt = 'RGBA' if flags & FLAG_ALPHA else 'RGBX'
+        # a surface over the read-only map would crash the first fill() or blit onto it
+        surf = pygame.image.frombuffer(bytearray(mm[HEADER.size:]), (w, h), fmt)
+    except (ValueError, struct.error):
+        mm.close()
+        _remove(blob)
+        return None
+    mm.close()
+    try:
+        # mark as recently used for eviction
+        os.utime(blob)
+    except OSError:
+        pass
+    return surf
+
+
+def store(source_path: str, transform: str, surf: pygame.Surface) -> None:
+    """Write surf's pixels to the cache as the result of (source, transform)."""
+    if not ENABLED or surf is None:
+        return
+    if surf.get_colorkey() is not None:
+        # RGBA/RGBX blobs can't represent colorkey transparency
+        return
+    try:
+        st = os.stat(source_path)
+        digest = _source_hash(source_path)
+        has_alpha = bool(surf.get_flags() & pygame.SRCALPHA)
+        pixels = pygame.image.tobytes(surf, 'RGBA' if has_alpha else 'RGBX')
+        w, h = surf.get_size()
+        header = HEADER.pack(MAGIC, VERSION, FLAG_ALPHA if has_alpha else 0,
+                             w, h, st.st_size, st.st_mtime_ns, digest)
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        blob = _blob_path(source_path, transform)
+        tmp = f"{blob}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, 'wb') as f:
+            f.write(header)
+            f.write(pixels)
+        os.replace(tmp, blob)
+    except Exception as e:
+        print('Failed to cache pixels for', source_path, e)
+        return
+    evict()
+
+
+def cached(source_path: str, transform: str, build: Callable[[], pygame.Surface]) -> Optional[pygame.Surface]:
+    """Return the cached surface for (source, transform), building and storing it on a miss."""
+    surf = load(source_path, transform)
+    if surf is not None:
+        return surf
+    surf = build()
+    if surf is not None:
+        store(source_path, transform, surf)
+    return surf
+
+
+def evict(max_bytes: int = None) -> None:
+    """Delete least recently used blobs until the cache fits in max_bytes."""
+    if max_bytes is None:
+        max_bytes = MAX_CACHE_BYTES
+    with _lock:
+        try:
+            entries = []
+            for fn in os.listdir(CACHE_DIR):
+                if not fn.endswith('.px'):
+                    continue
+                full = os.path.join(CACHE_DIR, fn)
+                st = os.stat(full)
+                entries.append((st.st_mtime, st.st_size, full))
+        except OSError:
+            return
+        total = sum(e[1] for e in entries)
+        if total <= max_bytes:
+            return
+        # trim to 90% so we don't evict again on the very next store
+        target = int(max_bytes * 0.9)
+        for _, size, full in sorted(entries):
+            if total <= target:
+                break
+            if _remove(full):
+                total -= size
+
+
+def clear() -> None:
+    """Remove every cached blob."""
+    evict(0)
+
+
+def _rewrite_header(blob: str, flags: int, w: int, h: int, st: os.stat_result, digest: bytes) -> None:
+    try:
+        with open(blob, 'r+b') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, flags, w, h, st.st_size, st.st_mtime_ns, digest))
+    except OSError:
+        pass
+
+
+def _remove(path: str) -> bool:
+    try:
+        os.remove(path)
+        return True
+    except OSError:
+        # still mapped (Windows) or already gone
+        return False
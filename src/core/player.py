@@ -15,7 +15,7 @@ class Player(pygame.sprite.Sprite):
         # try to load character animations (scaled to canonical size); fallback to placeholder surface
         CANON_SIZE = (32, 48)
         try:
-            self.animations = assets.get_animations('maria', size=CANON_SIZE) or {}
+            self.animations = assets.get_animations('maria', size=CANON_SIZE, only=('idle', 'walk')) or {}
         except Exception:
             self.animations = {}
 
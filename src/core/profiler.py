@@ -0,0 +1,289 @@
+"""Span markers, Chrome traces and per-scene cProfile captures.
+
+Two ways to see where a frame goes without editing code:
+
+Trace: span markers around SceneManager.update/draw, scene start-up, the
+asset loaders and the tile layer draws are recorded for a window of
+frames and written as Chrome trace-event JSON (open it in
+chrome://tracing or https://ui.perfetto.dev). F10 in the game, or
+`python game.py --trace 300`, traces the next frames:
+
+    with profiler.span('DriveScene.road'):
+        ...
+
+    @profiler.traced()
+    def load_something(...):
+        ...
+
+Spans cost one flag check while no trace is being recorded.
+
+cProfile: F11, or `python game.py --profile`, runs cProfile and writes one
+capture per scene when the game leaves it: <Scene>.prof for pstats or
+snakeviz, and <Scene>.collapsed ("a;b;c <µs>" lines) for flamegraph.pl or
+speedscope. cProfile records caller/callee pairs rather than whole stacks,
+so the collapsed stacks split each function's time over its callers in
+proportion to what each caller spent in it.
+
+Files go to PROFILE_DIR.
+"""
+
+import contextlib
+import cProfile
+import functools
+import json
+import os
+import pstats
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+PROFILE_DIR = 'profiles'
+# frames the F10 hotkey traces
+TRACE_FRAMES = 120
+# collapsed stacks deeper than this are cut off
+MAX_STACK_DEPTH = 64
+
+TRACING = False  # spans are being recorded
+PROFILING = False  # cProfile is running
+
+_events: List[dict] = []
+_trace_frames_left = 0
+_trace_path: Optional[str] = None
+_frame_index = 0
+_epoch = time.perf_counter()
+_pid = os.getpid()
+_lock = threading.Lock()
+
+_profile: Optional[cProfile.Profile] = None
+_profile_scene: Optional[str] = None
+
+_NULL = contextlib.nullcontext()
+
+
+def _now_us() -> float:
+    return (time.perf_counter() - _epoch) * 1e6
+
+
+class _Span:
+    __slots__ = ('name', 'cat', 'args', 'start')
+
+    def __init__(self, name: str, cat: str, args: Optional[dict]):
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self):
+        self.start = _now_us()
+        return self
+
+    def __exit__(self, *exc):
+        end = _now_us()
+        event = {'name': self.name, 'cat': self.cat, 'ph': 'X', 'ts': self.start,
+                 'dur': end - self.start, 'pid': _pid, 'tid': threading.get_ident()}
+        if self.args:
+            event['args'] = self.args
+        with _lock:
+            _events.append(event)
+        return False
+
+
+def span(name: str, cat: str = 'game', args: Optional[dict] = None):
+    """Context manager timing a block while a trace is recorded (a no-op otherwise)."""
+    if not TRACING:
+        return _NULL
+    return _Span(name, cat, args)
+
+
+def traced(name: Optional[str] = None, cat: str = 'game'):
+    """Decorator: record every call of the function as a span (named after it by default)."""
+    def decorate(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not TRACING:
+                return func(*args, **kwargs)
+            with _Span(label, cat, None):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def instant(name: str, cat: str = 'game', args: Optional[dict] = None) -> None:
+    """Mark a moment (e.g. a scene switch) in the trace."""
+    if not TRACING:
+        return
+    event = {'name': name, 'cat': cat, 'ph': 'i', 's': 'g', 'ts': _now_us(),
+             'pid': _pid, 'tid': threading.get_ident()}
+    if args:
+        event['args'] = args
+    with _lock:
+        _events.append(event)
+
+
+# --- traces ---
+
+def _default_path(suffix: str) -> str:
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    return os.path.join(PROFILE_DIR, time.strftime('%Y%m%d-%H%M%S') + suffix)
+
+
+def start_trace(frames: int = TRACE_FRAMES, path: Optional[str] = None) -> None:
+    """Record spans for the next frames (counted by frame()), then write the trace."""
+    global TRACING, _trace_frames_left, _trace_path
+    with _lock:
+        _events.clear()
+    _trace_frames_left = frames
+    _trace_path = path
+    TRACING = True
+    print(f"profiler: tracing {frames} frames")
+
+
+def stop_trace() -> Optional[str]:
+    """Stop recording and write what was recorded; returns the file written."""
+    global TRACING
+    if not TRACING:
+        return None
+    TRACING = False
+    path = _trace_path or _default_path('.trace.json')
+    write_trace(path)
+    return path
+
+
+def write_trace(path: str) -> None:
+    """Write the recorded spans as Chrome trace-event JSON."""
+    with _lock:
+        events = list(_events)
+        _events.clear()
+    thread_names = [{'name': 'thread_name', 'ph': 'M', 'pid': _pid, 'tid': t.ident, 'args': {'name': t.name}}
+                    for t in threading.enumerate()]
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump({'traceEvents': thread_names + events, 'displayTimeUnit': 'ms'}, f)
+    print(f"profiler: wrote {len(events)} events to {path}")
+
+
+def frame():
+    """Span for one game frame; call once per frame around update and draw.
+
+    Counts down the traced frame window and writes the trace when it ends.
+    """
+    global _frame_index, _trace_frames_left
+    _frame_index += 1
+    if not TRACING:
+        return _NULL
+    _trace_frames_left -= 1
+    if _trace_frames_left < 0:
+        stop_trace()
+        return _NULL
+    return _Span('frame', 'frame', {'index': _frame_index})
+
+
+# --- cProfile ---
+
+def start_profile(scene=None) -> None:
+    """Run cProfile from now on, writing a capture per scene (see scene_changed)."""
+    global PROFILING, _profile, _profile_scene
+    if PROFILING:
+        return
+    _profile = cProfile.Profile()
+    _profile_scene = type(scene).__name__ if scene is not None else 'Game'
+    PROFILING = True
+    _profile.enable()
+    print("profiler: cProfile on")
+
+
+def stop_profile() -> Optional[str]:
+    """Stop cProfile and write the capture of the current scene; returns the .prof path."""
+    global PROFILING, _profile
+    if not PROFILING:
+        return None
+    _profile.disable()
+    PROFILING = False
+    path = _write_profile(_profile, _profile_scene)
+    _profile = None
+    print("profiler: cProfile off")
+    return path
+
+
+def toggle_profile(scene=None) -> None:
+    if PROFILING:
+        stop_profile()
+    else:
+        start_profile(scene)
+
+
+def scene_changed(scene) -> None:
+    """Called by SceneManager.go_to: mark the switch and start a new capture for scene."""
+    global _profile, _profile_scene
+    name = type(scene).__name__
+    instant(f'go_to {name}', 'scene')
+    if not PROFILING:
+        return
+    _profile.disable()
+    _write_profile(_profile, _profile_scene)
+    _profile = cProfile.Profile()
+    _profile_scene = name
+    _profile.enable()
+
+
+def _write_profile(profile: cProfile.Profile, scene_name: str) -> Optional[str]:
+    stats = pstats.Stats(profile)
+    if not stats.stats:
+        return None
+    base = _default_path(f'-{scene_name}')
+    stats.dump_stats(base + '.prof')
+    lines = collapsed_stacks(stats)
+    with open(base + '.collapsed', 'w') as f:
+        f.write('\n'.join(lines))
+    print(f"profiler: wrote {base}.prof and {base}.collapsed")
+    return base + '.prof'
+
+
+def _label(func) -> str:
+    filename, line, name = func
+    if filename == '~':
+        return name  # built-in
+    return f'{name} ({os.path.basename(filename)}:{line})'
+
+
+def collapsed_stacks(stats: pstats.Stats) -> List[str]:
+    """Approximate "frame;frame;frame <µs>" lines from a cProfile capture.
+
+    Starting from functions nobody profiled called, each callee gets the
+    share of its time that the caller on the current path accounts for.
+    """
+    raw = stats.stats
+    callees: Dict[tuple, Dict[tuple, float]] = defaultdict(dict)
+    for func, (_, _, _, _, callers) in raw.items():
+        for caller, (_, _, _, cumulative) in callers.items():
+            callees[caller][func] = cumulative
+    totals: Dict[str, float] = defaultdict(float)
+
+    def walk(func, share: float, stack: List[str], on_path: set):
+        own = raw[func][2]
+        # traced() wrappers would show up under every decorated function
+        hidden = func[0] == __file__ and func[2] == 'wrapper'
+        if not hidden:
+            stack.append(_label(func))
+        on_path.add(func)
+        if own * share > 0 and stack:
+            totals[';'.join(stack)] += own * share
+        if len(stack) < MAX_STACK_DEPTH:
+            for callee, edge in callees.get(func, {}).items():
+                callee_total = raw[callee][3]
+                # skip recursion and paths under a microsecond (keeps the expansion small)
+                if callee in on_path or share * edge < 1e-6:
+                    continue
+                walk(callee, share * min(1.0, edge / callee_total), stack, on_path)
+        on_path.discard(func)
+        if not hidden:
+            stack.pop()
+
+    for func, (_, _, _, _, callers) in raw.items():
+        if not callers:
+            walk(func, 1.0, [], set())
+    return [f'{stack} {int(seconds * 1e6)}' for stack, seconds in totals.items() if seconds * 1e6 >= 1]
@@ -0,0 +1,353 @@
+"""Render backends: software Surface (default) or SDL2 Renderer/Texture.
+
+Scenes draw on a Surface and every scale, rotation and alpha blend runs on
+the CPU. With `python game.py --renderer sdl2` the window is driven by
+pygame._sdl2.video instead: images are uploaded once as Textures and SDL's
+renderer (GPU, or its own software driver on a machine without one) does
+the scaling, rotation and alpha-mod.
+
+Both backends hand the scene manager a Canvas each frame:
+
+    canvas.blit(image, pos, scale=1.0, angle=0.0, alpha=255, center=False)
+    canvas.fill(color, rect=None)          # color may carry an alpha
+    surface = canvas.surface()             # software layer for Surface drawing
+
+Scenes that don't know about canvases keep drawing on canvas.surface(); on
+the Surface backend that is the screen itself. On the SDL2 backend it is a
+frame buffer uploaded as one streaming texture at present time, and asking
+for it after textured draws starts a transparent layer on top, so draw
+order is kept either way.
+
+The SDL2 backend is experimental: only IntroScene draws through
+canvas.blit() so far. Every other scene draws its whole frame in software,
+which is then uploaded as a full-screen texture each frame, so those
+scenes are slower than on the Surface backend (headless, with SDL's
+software renderer: 1.8-4.0 ms/frame against 0.5-2.4 ms). Scenes have to
+move their scaling and alpha work to canvas.blit() before the backend pays
+off.
+
+Textures are cached per source surface (weakly, so they go when the surface
+does): asset surfaces are long-lived and are uploaded exactly once.
+Surfaces created every frame are uploaded every frame, so cache text and
+other generated images in the scene instead.
+"""
+
+import math
+import weakref
+import pygame
+from typing import List, Optional, Tuple
+
+from . import assets, transitions
+from .rotation_cache import RotationCache
+
+Color = Tuple[int, ...]
+
+SURFACE = 'surface'
+SDL2 = 'sdl2'
+BACKENDS = (SURFACE, SDL2)
+
+# SDL_BLENDMODE_BLEND
+_BLEND = 1
+
+# translucent fill surfaces kept by a SurfaceCanvas (sizes vary, e.g. rotating shadows)
+MAX_TINTS = 32
+
+_active = None  # backend created by create_backend()
+
+
+def transformed_size(size: Tuple[int, int], scale: float = 1.0, angle: float = 0.0) -> Tuple[int, int]:
+    """Bounding box of a size after scaling and rotating by angle degrees."""
+    w, h = size[0] * scale, size[1] * scale
+    if angle % 360:
+        a = math.radians(angle)
+        c, s = abs(math.cos(a)), abs(math.sin(a))
+        w, h = w * c + h * s, w * s + h * c
+    return int(round(w)), int(round(h))
+
+
+class Canvas:
+    """What a scene draws on for one frame (see the module docstring)."""
+
+    accelerated = False  # True when scale/rotate/alpha run in the renderer
+
+    def __init__(self, size: Tuple[int, int]):
+        self.size = tuple(size)
+
+    def get_size(self) -> Tuple[int, int]:
+        return self.size
+
+    def surface(self) -> pygame.Surface:
+        """Return a Surface for software drawing, above everything drawn so far."""
+        raise NotImplementedError
+
+    def frame_surface(self) -> pygame.Surface:
+        """The Surface software drawing lands on first (snapshot source for cross-fades)."""
+        raise NotImplementedError
+
+    def blit(self, image: pygame.Surface, pos, scale: float = 1.0, angle: float = 0.0,
+             alpha: int = 255, center: bool = False, cache: Optional[RotationCache] = None,
+             key=None, spin: float = 0.0) -> None:
+        """Draw image, optionally scaled, rotated and faded.
+
+        Args:
+            image: source surface
+            pos: top-left of the (transformed) image, or its center if center is set
+            scale: zoom factor
+            angle: rotation in degrees, counter-clockwise like rotozoom
+            alpha: opacity 0-255
+            center: treat pos as the image center
+            cache, key, spin: on the Surface backend, transformed images are
+                looked up in cache under key (see RotationCache.get) instead
+                of being rotated every frame; ignored by the SDL2 backend
+        """
+        raise NotImplementedError
+
+    def fill(self, color: Color, rect: Optional[pygame.Rect] = None) -> None:
+        """Fill rect (or the whole canvas) with color; a 4th component blends it."""
+        raise NotImplementedError
+
+
+class SurfaceCanvas(Canvas):
+    """Canvas over a software Surface: transforms run on the CPU."""
+
+    def __init__(self, target: pygame.Surface):
+        super().__init__(target.get_size())
+        self.target = target
+        self._tints = {}  # (size, color) -> translucent fill surface
+
+    def surface(self) -> pygame.Surface:
+        return self.target
+
+    def frame_surface(self) -> pygame.Surface:
+        return self.target
+
+    def blit(self, image, pos, scale=1.0, angle=0.0, alpha=255, center=False,
+             cache=None, key=None, spin=0.0):
+        if alpha <= 0:
+            return
+        if angle % 360 or scale != 1.0:
+            if cache is not None:
+                image = cache.get(key, image, angle, scale, spin=spin)
+            elif angle % 360:
+                image = pygame.transform.rotozoom(image, angle, scale)
+            else:
+                size = transformed_size(image.get_size(), scale)
+                image = pygame.transform.smoothscale(image, size)
+        if center:
+            pos = image.get_rect(center=(int(pos[0]), int(pos[1]))).topleft
+        if alpha >= 255:
+            self.target.blit(image, pos)
+            return
+        old = image.get_alpha()
+        image.set_alpha(alpha)
+        self.target.blit(image, pos)
+        image.set_alpha(old)
+
+    def fill(self, color, rect=None):
+        alpha = color[3] if len(color) > 3 else 255
+        if alpha <= 0:
+            return
+        if rect is None:
+            transitions.default_compositor().fade(self.target, alpha, tuple(color[:3]))
+            return
+        rect = pygame.Rect(rect)
+        if alpha >= 255:
+            self.target.fill(color[:3], rect)
+            return
+        tint_key = (rect.size, tuple(color))
+        tint = self._tints.get(tint_key)
+        if tint is None:
+            if len(self._tints) >= MAX_TINTS:
+                self._tints.clear()
+            tint = pygame.Surface(rect.size, pygame.SRCALPHA)
+            tint.fill(color)
+            self._tints[tint_key] = tint
+        self.target.blit(tint, rect)
+
+
+class TextureCanvas(Canvas):
+    """Canvas recorded for an SDL2 Renderer: transforms run in SDL."""
+
+    accelerated = True
+
+    def __init__(self, renderer, size: Tuple[int, int]):
+        super().__init__(size)
+        from pygame._sdl2 import video
+        self._video = video
+        self.renderer = renderer
+        self._textures: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+        self._ops: List[tuple] = []
+        # software layers: the opaque frame, then transparent ones on top
+        self._frame = pygame.Surface(self.size, pygame.SRCALPHA)
+        self._frame_texture = None
+        self._layers: List[Tuple[pygame.Surface, object]] = []
+        self._layers_used = 0
+        self._dirty = True  # last op was a textured draw (or nothing yet)
+
+    def texture(self, image: pygame.Surface):
+        """Return the Texture for image, uploading it the first time."""
+        tex = self._textures.get(image)
+        if tex is None:
+            tex = self._video.Texture.from_surface(self.renderer, image)
+            tex.blend_mode = _BLEND
+            self._textures[image] = tex
+        return tex
+
+    def begin(self) -> None:
+        """Start a new frame."""
+        self._ops.clear()
+        self._layers_used = 0
+        self._dirty = True
+
+    def surface(self) -> pygame.Surface:
+        if not self._dirty:
+            return self._ops[-1][1]
+        self._dirty = False
+        if not self._ops:
+            # nothing textured below: the opaque frame covers the canvas
+            self._ops.append(('layer', self._frame, None))
+            return self._frame
+        if self._layers_used == len(self._layers):
+            self._layers.append((pygame.Surface(self.size, pygame.SRCALPHA), None))
+        layer = self._layers[self._layers_used][0]
+        self._layers_used += 1
+        layer.fill((0, 0, 0, 0))
+        self._ops.append(('layer', layer, self._layers_used - 1))
+        return layer
+
+    def frame_surface(self) -> pygame.Surface:
+        return self._frame
+
+    def blit(self, image, pos, scale=1.0, angle=0.0, alpha=255, center=False,
+             cache=None, key=None, spin=0.0):
+        if alpha <= 0:
+            return
+        w, h = image.get_size()
+        w, h = w * scale, h * scale
+        if center:
+            x, y = pos[0] - w / 2, pos[1] - h / 2
+        else:
+            # pos is the top-left of the rotated bounding box, as for rotozoom
+            bw, bh = transformed_size((w, h), 1.0, angle)
+            x, y = pos[0] + (bw - w) / 2, pos[1] + (bh - h) / 2
+        dst = pygame.Rect(int(round(x)), int(round(y)), int(round(w)), int(round(h)))
+        self._ops.append(('blit', self.texture(image), dst, -angle, int(alpha)))
+        self._dirty = True
+
+    def fill(self, color, rect=None):
+        color = tuple(color) if len(color) > 3 else tuple(color) + (255,)
+        if color[3] <= 0:
+            return
+        rect = pygame.Rect(rect) if rect is not None else pygame.Rect((0, 0), self.size)
+        self._ops.append(('fill', color, rect))
+        self._dirty = True
+
+    def _layer_texture(self, surface: pygame.Surface, index: Optional[int]):
+        if index is None:
+            if self._frame_texture is None:
+                self._frame_texture = self._video.Texture(self.renderer, self.size, streaming=True)
+            tex = self._frame_texture
+        else:
+            layer, tex = self._layers[index]
+            if tex is None:
+                tex = self._video.Texture(self.renderer, self.size, streaming=True)
+                tex.blend_mode = _BLEND
+                self._layers[index] = (layer, tex)
+        tex.update(surface)
+        return tex
+
+    def render(self) -> None:
+        """Replay this frame's draws on the renderer."""
+        renderer = self.renderer
+        renderer.draw_color = (0, 0, 0, 255)
+        renderer.clear()
+        for op in self._ops:
+            kind = op[0]
+            if kind == 'blit':
+                _, tex, dst, angle, alpha = op
+                tex.alpha = alpha
+                tex.draw(dstrect=dst, angle=angle)
+            elif kind == 'fill':
+                _, color, rect = op
+                renderer.draw_blend_mode = _BLEND
+                renderer.draw_color = color
+                renderer.fill_rect(rect)
+            else:
+                _, surface, index = op
+                self._layer_texture(surface, index).draw()
+
+
+class SurfaceBackend:
+    """The display Surface from pygame.display.set_mode (the default)."""
+
+    name = SURFACE
+
+    def __init__(self, size: Tuple[int, int], title: str):
+        self.screen = pygame.display.set_mode(size)
+        pygame.display.set_caption(title)
+        self.canvas = SurfaceCanvas(self.screen)
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        return self.screen.get_size()
+
+    def begin_frame(self) -> Canvas:
+        return self.canvas
+
+    def present(self) -> None:
+        pygame.display.flip()
+
+    def close(self) -> None:
+        pass
+
+
+class SDL2Backend:
+    """A pygame._sdl2.video Window and Renderer."""
+
+    name = SDL2
+
+    def __init__(self, size: Tuple[int, int], title: str, vsync: bool = False):
+        from pygame._sdl2 import video
+        self.window = video.Window(title, size=size)
+        self.renderer = video.Renderer(self.window, accelerated=-1, vsync=vsync)
+        self.canvas = TextureCanvas(self.renderer, size)
+        # there is no display Surface to convert() to: use 32-bit (A)RGB, which uploads as is
+        assets.set_pixel_format(pygame.Surface((1, 1), 0, 32), pygame.Surface((1, 1), pygame.SRCALPHA, 32))
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        return self.canvas.size
+
+    def begin_frame(self) -> Canvas:
+        self.canvas.begin()
+        return self.canvas
+
+    def present(self) -> None:
+        self.canvas.render()
+        self.renderer.present()
+
+    def close(self) -> None:
+        self.window.destroy()
+
+
+def create_backend(name: str, size: Tuple[int, int], title: str):
+    """Open the window with the named backend, falling back to Surface if SDL2 fails."""
+    global _active
+    if name == SDL2:
+        try:
+            _active = SDL2Backend(size, title)
+            return _active
+        except Exception as e:
+            print(f"SDL2 renderer unavailable ({e}); using the Surface renderer")
+    _active = SurfaceBackend(size, title)
+    return _active
+
+
+def screen_size() -> Tuple[int, int]:
+    """Size of the game's window, whichever backend drives it."""
+    screen = pygame.display.get_surface()
+    if screen is not None:
+        return screen.get_size()
+    if _active is not None:
+        return _active.size
+    return 1024, 768
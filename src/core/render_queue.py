@@ -0,0 +1,131 @@
+"""Depth-sorted render queue.
+
+Scenes used to hand-order their draw calls (NPCs, then their names, then
+Maria, then Shani...) with one blit per call, and special-case overlaps
+such as a sitting character in front of a table. Instead, a scene submits
+what it wants drawn during draw() and flushes the queue once:
+
+    queue.submit(frame, (x, y))                 # y-sorted by the sprite's bottom edge
+    queue.submit(label, (x, y - 25), sort_y=y + 128)   # same depth as its sprite
+    queue.flush(surface)
+
+flush() sorts the entries by (layer, sort_y, submit order) and hands runs
+of plain blits to Surface.blits, so a frame costs a few calls however many
+sprites are on screen. Callables can be submitted for vector drawing; they
+run in order between the batched runs.
+
+Static layers (a tilemap, a backdrop) are composed once into a cached
+surface with set_static() and drawn with a single blit every flush until
+they are invalidated.
+"""
+
+import pygame
+from typing import Callable, Dict, List, Optional, Tuple
+
+from . import assets
+
+# layers, drawn bottom first
+BACKGROUND = 0
+WORLD = 10  # characters and props, y-sorted
+OVERLAY = 20  # labels/effects that should never be covered by the world
+
+Position = Tuple[int, int]
+
+
+class RenderQueue:
+    """Collects a frame's sprites and draws them in depth order."""
+
+    def __init__(self):
+        # (layer, sort_y, seq, surface or callable, pos, area)
+        self._entries: List[tuple] = []
+        self._seq = 0
+        # layer -> (key, surface, pos) composed by set_static()
+        self._static: Dict[int, Tuple[object, pygame.Surface, Position]] = {}
+
+    def submit(self, surface: pygame.Surface, pos: Position, layer: int = WORLD,
+               sort_y: Optional[float] = None, area: Optional[pygame.Rect] = None) -> None:
+        """Queue a blit.
+
+        Args:
+            surface: what to draw
+            pos: top-left position on the target
+            layer: draw layer (BACKGROUND, WORLD, OVERLAY or any int)
+            sort_y: depth within the layer; defaults to the bottom edge
+                    (pos y + height), so sprites lower on screen are in front
+            area: optional source rect, as for Surface.blit
+        """
+        if surface is None:
+            return
+        if sort_y is None:
+            sort_y = pos[1] + (area[3] if area is not None else surface.get_height())
+        self._entries.append((layer, sort_y, self._seq, surface, pos, area))
+        self._seq += 1
+
+    def submit_draw(self, draw: Callable[[pygame.Surface], None], layer: int = WORLD,
+                    sort_y: float = 0) -> None:
+        """Queue a callable that draws onto the target (for shapes and placeholders)."""
+        self._entries.append((layer, sort_y, self._seq, draw, None, None))
+        self._seq += 1
+
+    def set_static(self, layer: int, key, size: Tuple[int, int],
+                   build: Callable[[pygame.Surface], None], pos: Position = (0, 0),
+                   alpha: bool = False) -> pygame.Surface:
+        """Compose a static layer once and draw it at every flush.
+
+        build is only called when key changes (or after invalidate()), so
+        pass a key that identifies the content, e.g. the map name.
+
+        Args:
+            layer: layer the static surface is drawn in (below that layer's sprites)
+            key: identifies the content; a different key rebuilds the surface
+            size: size of the composed surface
+            build: draws the content onto the (blank) surface
+            pos: where the composed surface goes on the target
+            alpha: keep per-pixel alpha (for static layers over other layers)
+        """
+        cached = self._static.get(layer)
+        if cached is not None and cached[0] == key and cached[1].get_size() == tuple(size):
+            if cached[2] != tuple(pos):
+                self._static[layer] = (key, cached[1], tuple(pos))
+            return cached[1]
+        surf = pygame.Surface(size, pygame.SRCALPHA if alpha else 0)
+        build(surf)
+        surf = assets.display_format(surf, alpha)
+        self._static[layer] = (key, surf, tuple(pos))
+        return surf
+
+    def invalidate(self, layer: Optional[int] = None) -> None:
+        """Drop one static layer (or all of them) so it is rebuilt next time."""
+        if layer is None:
+            self._static.clear()
+        else:
+            self._static.pop(layer, None)
+
+    def clear(self) -> None:
+        """Drop this frame's entries without drawing them."""
+        self._entries.clear()
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def flush(self, surface: pygame.Surface) -> None:
+        """Draw the static layers and queued entries in order, then empty the queue."""
+        entries = self._entries
+        # static layers sort before everything submitted to the same layer
+        for layer, (_, static, pos) in self._static.items():
+            entries.append((layer, float('-inf'), -1, static, pos, None))
+        entries.sort(key=lambda e: (e[0], e[1], e[2]))
+
+        batch = []
+        for _, _, _, item, pos, area in entries:
+            if isinstance(item, pygame.Surface):
+                batch.append((item, pos, area) if area is not None else (item, pos))
+                continue
+            if batch:
+                surface.blits(batch, doreturn=False)
+                batch = []
+            item(surface)
+        if batch:
+            surface.blits(batch, doreturn=False)
+        self.clear()
@@ -0,0 +1,187 @@
+"""Cache of rotated and scaled sprites, quantized by angle.
+
+rotozoom is one of the most expensive calls in the game, and sprites that
+spin slowly (the IntroScene photo montage) used to be rotated again on
+every frame. RotationCache rounds the angle to a configurable step and
+keeps each (sprite, angle, scale) result, so a spinning sprite only costs
+a rotozoom the first time it passes through a given step. Results are kept
+under a byte budget (least recently used first out), and can be computed
+ahead of time on a background thread.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+import pygame
+
+# defaults
+DEFAULT_STEP = 1.0  # degrees
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# how many steps ahead the background thread rotates a spinning sprite
+DEFAULT_LOOKAHEAD = 4
+
+
+def _surface_bytes(surf: pygame.Surface) -> int:
+    return surf.get_width() * surf.get_height() * surf.get_bytesize()
+
+
+class RotationCache:
+    """Rotated/scaled variants of sprites, looked up by quantized angle.
+
+    Sprites are identified by a caller-chosen hashable key (an asset key, an
+    index...), so the same cache can hold several sprites.
+    """
+
+    def __init__(self, step: float = DEFAULT_STEP, max_bytes: int = DEFAULT_MAX_BYTES,
+                 background: bool = False, lookahead: int = DEFAULT_LOOKAHEAD):
+        """
+        Args:
+            step: angle quantization in degrees (1.0 = one variant per degree)
+            max_bytes: memory budget for cached surfaces
+            background: rotate upcoming angles on a worker thread
+            lookahead: steps ahead to prepare when background is on
+        """
+        self.step = step
+        self.max_bytes = max_bytes
+        self.lookahead = lookahead
+        self._entries: 'OrderedDict[tuple, pygame.Surface]' = OrderedDict()
+        self._bytes = 0
+        self._shadows: Dict[tuple, pygame.Surface] = {}
+        self._lock = threading.Lock()
+        # stats
+        self.hits = 0
+        self.misses = 0
+
+        self._pending = set()
+        self._queue = []
+        self._wake = threading.Condition(self._lock)
+        self._worker: Optional[threading.Thread] = None
+        self._stopped = False
+        if background:
+            self._worker = threading.Thread(target=self._run, name='rotation-cache', daemon=True)
+            self._worker.start()
+
+    def quantize(self, angle: float) -> float:
+        """Round angle to the nearest step, in [0, 360)."""
+        return (round(angle / self.step) * self.step) % 360
+
+    def get(self, key: Hashable, image: pygame.Surface, angle: float, scale: float = 1.0,
+            spin: float = 0.0) -> pygame.Surface:
+        """Return image rotated by angle (quantized) and scaled by scale.
+
+        Args:
+            key: identifies image in this cache
+            image: the source surface (only used on a miss)
+            angle: rotation in degrees, counter-clockwise like rotozoom
+            scale: zoom factor
+            spin: rotation direction/speed; with a background worker the next
+                  few steps in that direction are prepared ahead of time
+        """
+        q = self.quantize(angle)
+        entry_key = (key, q, scale)
+        with self._lock:
+            surf = self._entries.get(entry_key)
+            if surf is not None:
+                self._entries.move_to_end(entry_key)
+                self.hits += 1
+        if surf is None:
+            self.misses += 1
+            surf = pygame.transform.rotozoom(image, q, scale)
+            with self._lock:
+                self._insert(entry_key, surf)
+        if self._worker is not None and spin:
+            self._schedule(key, image, q, scale, self.step if spin > 0 else -self.step)
+        return surf
+
+    def shadow(self, size: Tuple[int, int], color=(0, 0, 0, 50)) -> pygame.Surface:
+        """Return a cached translucent rectangle of the given size (for drop shadows)."""
+        shadow_key = (tuple(size), tuple(color))
+        surf = self._shadows.get(shadow_key)
+        if surf is None:
+            surf = pygame.Surface(size, pygame.SRCALPHA)
+            surf.fill(color)
+            self._shadows[shadow_key] = surf
+        return surf
+
+    def prewarm(self, key: Hashable, image: pygame.Surface, scale: float = 1.0,
+                start: float = 0.0, stop: float = 360.0) -> None:
+        """Queue every step in [start, stop) for background rotation (or do it now without a worker)."""
+        n = int((stop - start) / self.step)
+        angles = [self.quantize(start + i * self.step) for i in range(n)]
+        if self._worker is None:
+            for a in angles:
+                self.get(key, image, a, scale)
+            return
+        with self._lock:
+            for a in angles:
+                self._enqueue(key, image, a, scale)
+            self._wake.notify()
+
+    def clear(self) -> None:
+        """Drop every cached surface and any queued work."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._queue.clear()
+            self._pending.clear()
+        self._shadows.clear()
+
+    def close(self) -> None:
+        """Stop the background worker (if any) and free the cache."""
+        with self._lock:
+            self._stopped = True
+            self._wake.notify()
+        if self._worker is not None:
+            self._worker.join(timeout=1.0)
+            self._worker = None
+        self.clear()
+
+    @property
+    def bytes_used(self) -> int:
+        return self._bytes
+
+    # --- internals (call with self._lock held unless noted) ---
+
+    def _insert(self, entry_key: tuple, surf: pygame.Surface) -> None:
+        if entry_key in self._entries:
+            return
+        self._entries[entry_key] = surf
+        self._bytes += _surface_bytes(surf)
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            _, old = self._entries.popitem(last=False)
+            self._bytes -= _surface_bytes(old)
+
+    def _enqueue(self, key, image, angle, scale) -> None:
+        entry_key = (key, angle, scale)
+        if entry_key in self._entries or entry_key in self._pending:
+            return
+        self._pending.add(entry_key)
+        self._queue.append((entry_key, image))
+
+    def _schedule(self, key, image, angle, scale, delta) -> None:
+        # called without the lock
+        with self._lock:
+            for i in range(1, self.lookahead + 1):
+                self._enqueue(key, image, self.quantize(angle + i * delta), scale)
+            if self._queue:
+                self._wake.notify()
+
+    def _run(self) -> None:
+        # worker thread: rotate queued angles until closed
+        while True:
+            with self._lock:
+                while not self._queue and not self._stopped:
+                    self._wake.wait()
+                if self._stopped:
+                    return
+                entry_key, image = self._queue.pop(0)
+            _, angle, scale = entry_key
+            try:
+                surf = pygame.transform.rotozoom(image, angle, scale)
+            except Exception as e:
+                print('Failed to rotate sprite', entry_key[0], e)
+                surf = None
+            with self._lock:
+                self._pending.discard(entry_key)
+                if surf is not None:
+                    self._insert(entry_key, surf)
@@ -1,5 +1,8 @@
+import inspect
+import time
 import pygame
-from typing import Optional
+from typing import Generator, Optional
+from . import assets, animation_sets, audio, memstats, profiler, render_backend, transitions
 
 
 class Scene:
@@ -15,11 +18,52 @@ class Scene:
     Music support:
     - Set music_file attribute to enable background music
     - Music will automatically play when scene starts and stop when it ends
+    - The manager starts reading the file into memory in the background
+      before start(); the track begins playing once it is loaded. Sound
+      effects come from the shared bank (audio.get_sound / audio.play_sound)
+
+    Asset support:
+    - List the image keys the scene needs in required_assets (e.g.
+      'scenes/disney/castle.png' or a folder like 'photos/'); the manager
+      decodes them in parallel before start() and the scene reads them
+      with self.scope.get() (or scope.get_scaled/get_fitted/get_region)
+    - Everything loaded through self.scope (required_assets included, and
+      sounds from scope.sound()) is released when the manager leaves the
+      scene; images nobody else holds move to a bounded cold cache
+
+    Fades:
+    - Call self.fade(surface, alpha) at the end of draw() to fade the frame
+      to black (or another colour) without allocating an overlay
+    - Pass cross_fade=seconds to manager.go_to() to blend the current frame
+      into the next scene
+
+    Incremental loading:
+    - start() may be a generator that yields after each unit of work (one
+      character, one tile layer, one photo...), optionally yielding the
+      fraction done (0..1); the manager resumes it for up to
+      SceneManager.LOAD_BUDGET_MS per frame and draws a progress bar
+      instead of the scene, so the window keeps handling QUIT/ESC.
+      update(), draw() and handle_event() only run once it has finished
+
+    Frame pacing:
+    - Override idle_time() to return how many seconds the scene will look
+      the same if no input arrives (math.inf for "until input", 0 while it
+      animates); the game loop then waits for events instead of redrawing
+      at full rate (see frame_pacer)
+
+    Render backends:
+    - The game draws through draw_canvas(canvas), which by default calls
+      draw() with the canvas's software surface; override it to scale,
+      rotate and fade images through canvas.blit() so the SDL2 renderer
+      can do that work (see render_backend)
     """
 
     def __init__(self, manager: Optional[object] = None):
         self.manager = manager
         self.music_file = None  # Override in subclass to set music
+        self.required_assets = []  # Override in subclass to batch-load images
+        self.scope = assets.AssetScope(self)  # images and sounds held while the scene is active
+        self.music_continues = False  # set by the manager when the next scene plays the same track
 
     def start(self):
         # Play scene music if specified and not already playing
@@ -32,9 +76,9 @@ class Scene:
                 self._play_music(self.music_file)
 
     def end(self):
-        # Fade out music when scene ends
-        if self.music_file and pygame.mixer.music.get_busy():
-            pygame.mixer.music.fadeout(1000)  # Fade out over 1 second
+        # Fade out music when scene ends, unless the next scene keeps playing it
+        if self.music_file and not self.music_continues:
+            audio.music.fadeout(1000)  # Fade out over 1 second
     
     def _play_music(self, music_path: str, volume: float = 0.5, loops: int = -1, fade_ms: int = 1000):
         """Play background music for this scene.
@@ -45,12 +89,12 @@ class Scene:
             loops: Number of times to loop (-1 for infinite)
             fade_ms: Fade in duration in milliseconds (default 1000ms = 1 second)
         """
-        try:
-            pygame.mixer.music.load(music_path)
-            pygame.mixer.music.set_volume(volume)
-            pygame.mixer.music.play(loops, fade_ms=fade_ms)
-        except Exception as e:
-            print(f"Failed to load music {music_path}: {e}")
+        audio.music.play(music_path, volume=volume, loops=loops, fade_ms=fade_ms)
+
+    def fade(self, surface: pygame.Surface, alpha: float, color=(0, 0, 0)):
+        """Blend the drawn frame towards color (alpha 0..255) using the manager's overlays."""
+        compositor = getattr(self.manager, 'transitions', None) or transitions.default_compositor()
+        compositor.fade(surface, alpha, color)
 
     def handle_event(self, event: pygame.event.EventType):
         pass
@@ -61,15 +105,50 @@ class Scene:
     def draw(self, surface: pygame.Surface):
         pass
 
+    def idle_time(self) -> float:
+        """Seconds update() and draw() can be skipped without the screen changing (0: animating)."""
+        return 0.0
+
+    def draw_canvas(self, canvas: render_backend.Canvas):
+        self.draw(canvas.surface())
+
 
 class SceneManager:
     """Simple scene manager to switch active scenes."""
 
+    # Time per frame spent resuming a generator start() (see Scene)
+    LOAD_BUDGET_MS = 8.0
+    # Loading screen
+    LOAD_BACKGROUND = (0, 0, 0)
+    LOAD_BAR_COLOR = (235, 235, 235)
+    LOAD_BAR_SIZE = (320, 8)
+
     def __init__(self):
         self.scene: Optional[Scene] = None
         self.current_music_file: Optional[str] = None
+        self.transitions = transitions.TransitionCompositor()
+        self._last_frame: Optional[pygame.Surface] = None  # surface the last frame was drawn to
+        self._loading: Optional[Generator] = None  # the scene's start() while it is still running
+        self._loading_previous: Optional[Scene] = None  # released once loading finishes
+        self.load_progress: Optional[float] = None  # fraction the loading scene last yielded
+        self._load_elapsed = 0.0  # seconds spent on the loading screen (animates the bar)
 
-    def go_to(self, scene: Scene):
+    @property
+    def loading(self) -> bool:
+        """True while the current scene's generator start() hasn't finished."""
+        return self._loading is not None
+
+    def go_to(self, scene: Scene, cross_fade: float = 0.0):
+        """Switch to scene.
+
+        Args:
+            scene: the new scene (started here)
+            cross_fade: seconds to blend the last drawn frame into the new scene
+        """
+        profiler.scene_changed(scene)
+        if cross_fade > 0 and self._last_frame is not None:
+            # snapshot before the new scene can touch the screen
+            self.transitions.cross_fade(self._last_frame, cross_fade)
         # Check if new scene has same music as currently playing
         next_music = getattr(scene, 'music_file', None)
         same_music = (self.current_music_file is not None and 
@@ -78,32 +157,152 @@ class SceneManager:
         
         if self.scene is not None:
             try:
-                # Only end (fade out) if next scene has different music
+                # end() always runs (scenes free their caches there); it only
+                # fades the music out if the next scene has different music
+                self.scene.music_continues = same_music
                 if not same_music:
-                    self.scene.end()
                     self.current_music_file = None
+                self.scene.end()
             except Exception:
                 pass
         
+        previous = self.scene
+        if self._loading is not None:
+            # left before it finished loading: drop the rest of its start() and
+            # release what both it and the scene before it held
+            self._loading.close()
+            self._loading = None
+            self._release(self._loading_previous, scene)
+            self._loading_previous = None
+        if previous is not None and previous is not scene:
+            memstats.scene_finished(previous)
         self.scene = scene
         self.scene.manager = self
+        self._preload_assets(scene)
+        started = None
         try:
             # Always call start() for scene initialization
-            self.scene.start()
+            with profiler.span(f'{type(scene).__name__}.start', 'scene'):
+                started = self.scene.start()
             # Track current music file
             if next_music:
                 self.current_music_file = next_music
         except Exception:
             pass
+        if inspect.isgenerator(started):
+            self._loading = started
+            self._loading_previous = previous
+            self.load_progress = None
+            self._load_elapsed = 0.0
+            self._resume_loading()
+        else:
+            self._finish_switch(previous)
+
+    def _resume_loading(self):
+        """Run the loading scene's start() for up to LOAD_BUDGET_MS."""
+        deadline = time.perf_counter() + self.LOAD_BUDGET_MS / 1000.0
+        name = f'{type(self.scene).__name__}.start'
+        try:
+            while True:
+                with profiler.span(name, 'scene'):
+                    progress = next(self._loading)
+                if progress is not None:
+                    self.load_progress = min(1.0, max(0.0, float(progress)))
+                if time.perf_counter() >= deadline:
+                    return
+        except StopIteration:
+            pass
+        except Exception as e:
+            print(f"Failed to start {type(self.scene).__name__}: {e}")
+        self._loading = None
+        self._finish_switch(self._loading_previous)
+        self._loading_previous = None
+
+    def _finish_switch(self, previous: Optional[Scene]):
+        # Release the old scene's animation sets only now, so the ones the
+        # new scene also acquired in start() are shared rather than reloaded
+        self._release(previous, self.scene)
+        memstats.scene_changed()
+
+    def _release(self, previous: Optional[Scene], scene: Optional[Scene]):
+        if previous is not None and previous is not scene:
+            animation_sets.release(previous)
+            assets.release(previous)
+            audio.release(previous)
+
+    def _preload_assets(self, scene: Scene):
+        """Batch-decode the images a scene declared in required_assets."""
+        next_music = getattr(scene, 'music_file', None)
+        audio.prefetch_music(next_music)
+        # only the track playing now (it may continue or fade out) and the next one stay in memory
+        audio.release_music((audio.music.current, next_music))
+        keys = []
+        for key in getattr(scene, 'required_assets', None) or ():
+            if key.endswith('/'):
+                keys.extend(assets.keys_under(key))
+            else:
+                keys.append(key)
+        if keys:
+            try:
+                assets.preload(keys, owner=scene)
+            except Exception as e:
+                print(f"Failed to preload assets: {e}")
 
     def handle_event(self, event: pygame.event.EventType):
-        if self.scene:
+        if self.scene and not self.loading:
             self.scene.handle_event(event)
 
     def update(self, dt: float):
-        if self.scene:
-            self.scene.update(dt)
+        with profiler.span('SceneManager.update'):
+            self.transitions.update(dt)
+            audio.music.update(dt)
+            if self.loading:
+                # the previous scene is held until loading finishes: check for leaks after that
+                self._load_elapsed += dt
+                self._resume_loading()
+                return
+            memstats.check_finished()
+            if self.scene:
+                self.scene.update(dt)
+
+    def idle_time(self) -> float:
+        """Seconds nothing on screen (or in the music) changes without input; 0 while animating."""
+        if (self.scene is None or self.loading or self.transitions.active
+                or audio.music.fading_out or audio.music.pending):
+            return 0.0
+        return self.scene.idle_time()
+
+    def _draw_loading(self, surface: pygame.Surface):
+        """Loading screen: a bar filled to load_progress (a sweeping block if unknown)."""
+        surface.fill(self.LOAD_BACKGROUND)
+        w, h = self.LOAD_BAR_SIZE
+        bar = pygame.Rect(0, 0, w, h)
+        bar.center = (surface.get_width() // 2, surface.get_height() * 3 // 4)
+        pygame.draw.rect(surface, self.LOAD_BAR_COLOR, bar, 1)
+        if self.load_progress is None:
+            # sweep back and forth, 1 s each way
+            t = abs(self._load_elapsed % 2.0 - 1.0)
+            fill = pygame.Rect(bar.x + int((w - w // 4) * t), bar.y, w // 4, h)
+        else:
+            fill = pygame.Rect(bar.x, bar.y, int(w * self.load_progress), h)
+        surface.fill(self.LOAD_BAR_COLOR, fill)
 
     def draw(self, surface: pygame.Surface):
-        if self.scene:
-            self.scene.draw(surface)
+        with profiler.span('SceneManager.draw'):
+            if self.loading:
+                self._draw_loading(surface)
+            elif self.scene:
+                self.scene.draw(surface)
+            self.transitions.draw(surface)
+        self._last_frame = surface
+
+    def draw_canvas(self, canvas: render_backend.Canvas):
+        """Like draw(), through a render backend's canvas."""
+        with profiler.span('SceneManager.draw'):
+            if self.loading:
+                self._draw_loading(canvas.surface())
+            elif self.scene:
+                self.scene.draw_canvas(canvas)
+            if self.transitions.active:
+                self.transitions.draw(canvas.surface())
+        self._last_frame = canvas.frame_surface()
@@ -0,0 +1,110 @@
+"""Fades and cross-fades between scenes.
+
+Scenes used to fade by allocating a full-screen Surface every frame just to
+fill it with black and blit it with set_alpha. The TransitionCompositor
+owned by SceneManager keeps one overlay per (size, colour) and one snapshot
+buffer, allocated the first time they're needed and reused afterwards.
+
+- fade(surface, alpha, color): darken (or tint) a finished frame towards a
+  colour; scenes call it through Scene.fade()
+- cross_fade(frame, duration): copy the outgoing scene's last frame once and
+  blend it out over the incoming scene; SceneManager.go_to(scene,
+  cross_fade=seconds) starts one
+"""
+
+import pygame
+from typing import Dict, Optional, Tuple
+
+Color = Tuple[int, int, int]
+
+# longest step a cross-fade advances per update, so a slow scene start()
+# (a long first dt) doesn't skip the whole fade
+MAX_STEP = 1.0 / 30
+
+
+class TransitionCompositor:
+    """Preallocated overlay and snapshot buffers for scene transitions."""
+
+    def __init__(self):
+        self._overlays: Dict[Tuple[Tuple[int, int], Color], pygame.Surface] = {}
+        self._snapshot: Optional[pygame.Surface] = None
+        self._duration = 0.0
+        self._elapsed = 0.0
+
+    def overlay(self, size: Tuple[int, int], color: Color = (0, 0, 0)) -> pygame.Surface:
+        """Return the shared full-size overlay of the given colour.
+
+        The surface is shared: set its alpha right before blitting it.
+        """
+        key = (tuple(size), tuple(color[:3]))
+        surf = self._overlays.get(key)
+        if surf is None:
+            surf = pygame.Surface(size)
+            surf.fill(key[1])
+            self._overlays[key] = surf
+        return surf
+
+    def fade(self, surface: pygame.Surface, alpha: float, color: Color = (0, 0, 0)) -> None:
+        """Blend surface towards color; alpha 0 leaves it as is, 255 covers it."""
+        alpha = int(alpha)
+        if alpha <= 0:
+            return
+        if alpha >= 255:
+            surface.fill(color)
+            return
+        overlay = self.overlay(surface.get_size(), color)
+        overlay.set_alpha(alpha)
+        surface.blit(overlay, (0, 0))
+
+    def cross_fade(self, frame: pygame.Surface, duration: float) -> None:
+        """Start blending frame (the outgoing scene's last frame) out over duration seconds.
+
+        frame is copied once into the snapshot buffer, so it can be the
+        screen itself.
+        """
+        if duration <= 0:
+            return
+        size = frame.get_size()
+        if self._snapshot is None or self._snapshot.get_size() != size:
+            self._snapshot = pygame.Surface(size)
+        self._snapshot.set_alpha(None)
+        self._snapshot.blit(frame, (0, 0))
+        self._duration = duration
+        self._elapsed = 0.0
+
+    @property
+    def active(self) -> bool:
+        """True while a cross-fade is running."""
+        return self._duration > 0
+
+    def update(self, dt: float) -> None:
+        if self._duration > 0:
+            self._elapsed += min(dt, MAX_STEP)
+            if self._elapsed >= self._duration:
+                self._duration = 0.0
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """Blend the snapshot over the incoming scene's frame (call after the scene draws)."""
+        if self._duration <= 0 or self._snapshot is None:
+            return
+        alpha = int(255 * (1.0 - self._elapsed / self._duration))
+        if alpha > 0:
+            self._snapshot.set_alpha(alpha)
+            surface.blit(self._snapshot, (0, 0))
+
+    def clear(self) -> None:
+        """Stop any cross-fade and free the buffers (e.g. after a display mode change)."""
+        self._overlays.clear()
+        self._snapshot = None
+        self._duration = 0.0
+
+
+# used by scenes drawn without a SceneManager
+_default: Optional[TransitionCompositor] = None
+
+
+def default_compositor() -> TransitionCompositor:
+    global _default
+    if _default is None:
+        _default = TransitionCompositor()
+    return _default
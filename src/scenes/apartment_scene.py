@@ -4,9 +4,11 @@ import os
 import random
 from ..core.scene import Scene
 from ..core.dialogue import DialogueBox
-from ..core import assets
+from ..core import assets, animation_sets, render_backend, render_queue
+from ..core.camera import Camera
 from ..utils.tilemap import load_apartment_tilemap, load_apartment_collision_map, load_apartment_object_rects
 from ..utils.lpc_demo import AnimationManager, IDLE_SPEED, WALK_SPEED, Animation, SIT_SPEED
+from ..utils.navigation import NavGrid, Navigator, Walker
 
 # Debug flag - set to True to enable debug output and see collision boxes
 DEBUG = False
@@ -19,7 +21,17 @@ class ApartmentScene(Scene):
     - WASD or Arrow keys to move Maria
     - SPACE to interact with objects
     """
-    
+
+    # Only these character sheets are decoded (see assets.get_animations)
+    ANIMATIONS_USED = ('idle', 'walk', 'sit', 'emote')
+
+    # The world (background and sprites) is drawn at 1/NATIVE_SCALE resolution and upscaled once
+    NATIVE_SCALE = 2
+    CHARACTER_SCALE = 2.0  # LPC frames are shown at 2x on screen
+    # Body box relative to a character's draw position (64x64 frames at 2x, 48 wide in the middle)
+    CHARACTER_FOOTPRINT = (40, 0, 48, 128)
+    NAV_CELL_SIZE = 16
+
     def __init__(self, manager=None):
         super().__init__(manager)
         self.music_file = "art/music/apartment/first_date.mp3"  # Set your music file here
@@ -39,21 +51,31 @@ class ApartmentScene(Scene):
         self.cutscene_active = True
         self.cutscene_step = -1  # Start at -1 for initial delay
         self.cutscene_timer = 0
-        self.cutscene_substep = 0  # Track which part of pathfinding we're on
         self.player_can_move = False
         self.space_key_cooldown = 0  # Cooldown for space key presses
         
         # Background image
         self.background = None
+        self.render_queue = render_queue.RenderQueue()
         self.background_scale = 4.0  # Scale 256x256 to 1024x1024 to fill screen width
-        self.background_offset_y = -200  # Offset upward to cut off top and show more floor
+        # Camera shows the map from y=200 (cuts off the top, shows more floor)
+        self.camera = Camera((1024, 768), scale=self.NATIVE_SCALE, position=(0, 200))
         self.collision_rects = []
+        # Scripted walks (grid baked from collision_rects in start())
+        self.navigator = None
+        self.maria = None
+        self.shani = None
         
         # Animation managers
         self.maria_anim = None
         self.shani_anim = None
         self.maria_sitting_sprite = None  # Static sprite for sitting
         self.shani_sitting_sprite = None  # Static sprite for sitting
+        self.required_assets = [
+            'scenes/apartment/apartment/untitled.png',
+            'characters/maria/sit.png',
+            'characters/shani/sit.png',
+        ]
         
         # Interactable objects on the table (4 objects: wine bottle, 2 wine glasses, box)
         # These will be loaded from TMJ Object Layer 1 to match their collision boxes
@@ -75,7 +97,6 @@ class ApartmentScene(Scene):
         self.shani_target_pos = None
         self.shani_delay_timer = 0
         self.shani_can_move = False
-        self.shani_game_substep = 0  # Track pathfinding substeps for game movement
         self.maria_sitting = False
         self.maria_target_pos = None
         
@@ -112,10 +133,10 @@ class ApartmentScene(Scene):
         
         apartment_folder = os.path.join('art', 'scenes', 'apartment', 'apartment')
         try:
-            # Load and scale background image (256x256 -> 1024x1024 to fill screen width, then offset)
+            # Load and scale background image (256x256 -> 1024x1024 on screen, kept at native resolution)
             bg_path = os.path.join(apartment_folder, 'untitled.png')
-            self.background = pygame.image.load(bg_path).convert()
-            self.background = pygame.transform.scale(self.background, (1024, 1024))
+            bg_size = int(1024 // self.camera.scale)
+            self.background = pygame.transform.scale(self.scope.get(bg_path), (bg_size, bg_size))
             
             # Load collision map from TMJ file
             self.collision_rects = load_apartment_collision_map(
@@ -124,9 +145,9 @@ class ApartmentScene(Scene):
                 scale=self.background_scale
             )
             
-            # Apply background offset to collision rects
+            # Move collision rects into view coordinates
             for rect in self.collision_rects:
-                rect.y += self.background_offset_y
+                self.camera.rect_to_view(rect)
             
             # Load object collision boxes from TMJ Object Layer 1
             object_rects = load_apartment_object_rects(
@@ -135,9 +156,9 @@ class ApartmentScene(Scene):
                 scale=self.background_scale
             )
             
-            # Apply background offset to object rects
+            # Move object rects into view coordinates
             for rect in object_rects:
-                rect.y += self.background_offset_y
+                self.camera.rect_to_view(rect)
             
             # Sort objects by x-position (left to right) and assign to interaction boxes
             if len(object_rects) >= 4:
@@ -148,7 +169,8 @@ class ApartmentScene(Scene):
                 self.wine_glass2_rect = sorted_objs[3]  # Rightmost
             
             # Add manual table collision (830 * 4.0 scale - 200 offset)
-            table_y = int(830 * self.background_scale / 3.0) + self.background_offset_y
+            map_top = self.camera.to_view(0, 0)[1]
+            table_y = int(830 * self.background_scale / 3.0) + map_top
             table_x = int(320 * self.background_scale / 3.0)
             table_width = int(300 * self.background_scale / 3.0)
             self.collision_rects.append(pygame.Rect(table_x, table_y, table_width, 70))
@@ -156,10 +178,10 @@ class ApartmentScene(Scene):
             # Add boundary walls (account for background offset)
             wall_thickness = 10
             self.collision_rects.extend([
-                pygame.Rect(0, self.background_offset_y, 1024, wall_thickness),  # Top
+                pygame.Rect(0, map_top, 1024, wall_thickness),  # Top
                 pygame.Rect(0, 768 - wall_thickness, 1024, wall_thickness),  # Bottom
-                pygame.Rect(0, self.background_offset_y, wall_thickness, 1024),  # Left
-                pygame.Rect(1024 - wall_thickness, self.background_offset_y, wall_thickness, 1024)  # Right
+                pygame.Rect(0, map_top, wall_thickness, 1024),  # Left
+                pygame.Rect(1024 - wall_thickness, map_top, wall_thickness, 1024)  # Right
             ])
             
         except Exception as e:
@@ -173,11 +195,19 @@ class ApartmentScene(Scene):
         # Setup Shani animations (facing left)
         self.shani_anim = self._setup_character('shani', ['idle_left', 'idle'])
         self.shani_sitting_sprite = self._load_sitting_sprite('shani')
+        
+        # Bake where a character can stand (visible part of the map) for the scripted walks
+        view_top = max(0, self.camera.to_view(0, 0)[1])
+        nav_grid = NavGrid(pygame.Rect(0, view_top, 1024, 768 - view_top), self.collision_rects,
+                           cell_size=self.NAV_CELL_SIZE, footprint=self.CHARACTER_FOOTPRINT)
+        self.navigator = Navigator(nav_grid)
+        self.maria = Walker(self.player_pos, self.maria_anim, self.player_facing)
+        self.shani = Walker(self.shani_pos, self.shani_anim, self.shani_facing)
     
     def _setup_character(self, char_name, initial_anim_priority):
         """Load and setup a character's animation manager."""
         try:
-            anims = assets.get_animations(char_name, size=(64, 64))
+            anims = assets.get_animations(char_name, size=(64, 64), only=self.ANIMATIONS_USED)
         except Exception as e:
             print(f"Could not load {char_name} animations: {e}")
             return None
@@ -185,21 +215,13 @@ class ApartmentScene(Scene):
         mgr = AnimationManager()
         
         # Add animations with appropriate speeds and filtering
-        for name, frames in anims.items():
-            if not frames:
-                continue
-            
+        for name in anims:
             # Filter transparent frames from walk animations for smoother movement
-            if 'walk' in name:
-                visible_frames = []
-                for frame in frames:
-                    try:
-                        mask = pygame.mask.from_surface(frame)
-                        if mask.count() > 0:
-                            visible_frames.append(frame)
-                    except Exception:
-                        visible_frames.append(frame)
-                frames = visible_frames if visible_frames else frames
+            anim_set = animation_sets.acquire(
+                self, char_name, name, size=(64, 64),
+                filter=animation_sets.VISIBLE if 'walk' in name else None)
+            if anim_set is None:
+                continue
             
             # Determine animation speed
             speed = (IDLE_SPEED if 'idle' in name else
@@ -210,7 +232,7 @@ class ApartmentScene(Scene):
             loop = 'sit' not in name
             
             try:
-                mgr.add(name, Animation(frames, speed_ms=speed, loop=loop))
+                mgr.add(name, Animation.from_set(anim_set, speed_ms=speed, loop=loop))
             except Exception:
                 pass
         
@@ -223,15 +245,14 @@ class ApartmentScene(Scene):
         return mgr
     
     def _load_sitting_sprite(self, char_name):
-        """Load the first frame of the down-facing sitting animation as a static sprite."""
+        """Load the first frame of the down-facing sitting animation as a static 128x128 sprite."""
         try:
-            sit_path = os.path.join('art', 'characters', char_name, 'sit.png')
-            sit_sheet = pygame.image.load(sit_path).convert_alpha()
             # Extract first frame of row 2 (down-facing)
             # sit.png has 4 rows (up, left, down, right) with 4 frames each
-            sprite = pygame.Surface((64, 64), pygame.SRCALPHA, 32)
-            sprite.blit(sit_sheet, (0, 0), (0, 128, 64, 64))  # Row 2 (y=128) is down-facing
-            return sprite
+            sitting = animation_sets.acquire_region(
+                self, f'characters/{char_name}/sit.png', [(0, 128, 64, 64)])  # Row 2 (y=128) is down-facing
+            scale = self.CHARACTER_SCALE / self.camera.scale
+            return sitting.scaled_frame(0, scale) if sitting is not None else None
         except Exception as e:
             print(f"Could not load sitting sprite for {char_name}: {e}")
             return None
@@ -240,7 +261,7 @@ class ApartmentScene(Scene):
         # Handle game overlay clicks
         if event.type == pygame.MOUSEBUTTONDOWN and self.show_game_overlay:
             mx, my = event.pos
-            w, h = pygame.display.get_surface().get_size()
+            w, h = render_backend.screen_size()
             box = pygame.Rect((w - 520)//2, (h - 220)//2, 520, 220)
             option1_rect = pygame.Rect(box.x + 60, box.y + 140, 160, 48)
             option2_rect = pygame.Rect(box.x + 300, box.y + 140, 160, 48)
@@ -433,62 +454,10 @@ class ApartmentScene(Scene):
                         self.maria_anim.play('idle_right')
             
             elif self.cutscene_step == 1:
-                # Step 1: Shani walks towards Maria using substeps
-                target_x = 230  # Right side of Maria (150 + 80 for spacing)
-                target_y = 624  # 824 - 200 offset
-                
-                # Substep 0: Move left to target x
-                if self.cutscene_substep == 0:
-                    if self.shani_pos[0] > target_x:
-                        self.shani_pos[0] -= self.player_speed * dt
-                        self.shani_facing = 'left'
-                        if self.shani_anim and self.shani_anim.current != 'walk_left':
-                            self.shani_anim.play('walk_left')
-                        # Update animation during cutscene
-                        if self.shani_anim:
-                            self.shani_anim.update(dt * 1000)
-                    else:
-                        self.shani_pos[0] = target_x
-                        self.cutscene_substep = 1
-                
-                # Substep 1: Move down to target y
-                elif self.cutscene_substep == 1:
-                    if abs(self.shani_pos[1] - target_y) > 2:
-                        if self.shani_pos[1] < target_y:
-                            self.shani_pos[1] += self.player_speed * dt
-                            self.shani_facing = 'down'
-                            anim_name = 'walk_down'
-                        else:
-                            self.shani_pos[1] -= self.player_speed * dt
-                            self.shani_facing = 'up'
-                            anim_name = 'walk_up'
-                        if self.shani_anim and self.shani_anim.current != anim_name:
-                            self.shani_anim.play(anim_name)
-                        # Update animation during cutscene
-                        if self.shani_anim:
-                            self.shani_anim.update(dt * 1000)
-                    else:
-                        self.shani_pos[1] = target_y
-                        self.cutscene_substep = 2
-                
-                # Substep 2: Arrived at Maria
-                if self.cutscene_substep == 2:
-                    if DEBUG:
-                        print(f"Shani reached Maria! pos={self.shani_pos[0]:.1f}, target={target_x}, diff={abs(self.shani_pos[0] - target_x):.1f}")
-                    # Reached Maria
-                    self.shani_pos[0] = target_x
-                    self.shani_pos[1] = target_y
-                    self.shani_facing = 'left'
-                    if self.shani_anim:
-                        self.shani_anim.play('idle_left')
-                    # Show dialogue
-                    self.dialog.set_lines([
-                        "Thanks for coming over!",
-                        "Wow, your pictures did not do you justice!",
-                        "You are gorgeous!",
-                        "Feel free to check out my apartment!"
-                    ])
-                    self.cutscene_step = 2
+                # Step 1: Shani walks over to Maria (to her right side)
+                if not self.navigator.is_walking(self.shani):
+                    self.navigator.walk_to(self.shani, (230, 624), speed=self.player_speed,
+                                           on_arrive=self._shani_reached_maria)
             
             elif self.cutscene_step == 2:
                 # Step 2: Wait for dialogue to finish
@@ -574,109 +543,22 @@ class ApartmentScene(Scene):
                 if DEBUG:
                     print("Shani can now move to game interaction!")
         
-        # Handle Shani movement when game interaction is triggered (walk around table)
-        if self.game_interaction_active and not self.shani_sitting and self.shani_can_move:
-            if self.shani_target_pos:
-                target_x, target_y = self.shani_target_pos
-                speed = 180
-                
-                # Substep 0: Move up higher to avoid Maria (to y=350)
-                if self.shani_game_substep == 0:
-                    intermediate_y = 350
-                    if self.shani_pos[1] > intermediate_y + 5:
-                        self.shani_pos[1] -= speed * dt
-                        facing = 'up'
-                        
-                        if self.shani_anim:
-                            walk_anim = f'walk_{facing}'
-                            if self.shani_anim.current != walk_anim:
-                                self.shani_anim.play(walk_anim)
-                    else:
-                        self.shani_pos[1] = intermediate_y
-                        self.shani_game_substep = 1
-                
-                # Substep 1: Move right to target x
-                elif self.shani_game_substep == 1:
-                    if abs(self.shani_pos[0] - target_x) > 5:
-                        self.shani_pos[0] += speed * dt
-                        facing = 'right'
-                        
-                        if self.shani_anim:
-                            walk_anim = f'walk_{facing}'
-                            if self.shani_anim.current != walk_anim:
-                                self.shani_anim.play(walk_anim)
-                    else:
-                        self.shani_pos[0] = target_x
-                        self.shani_game_substep = 2
-                
-                # Substep 2: Move down to final target y (chair position)
-                elif self.shani_game_substep == 2:
-                    if abs(self.shani_pos[1] - target_y) > 5:
-                        self.shani_pos[1] += speed * dt
-                        facing = 'down'
-                        
-                        if self.shani_anim:
-                            walk_anim = f'walk_{facing}'
-                            if self.shani_anim.current != walk_anim:
-                                self.shani_anim.play(walk_anim)
-                    else:
-                        # Reached target, sit down
-                        self.shani_pos[0] = target_x
-                        self.shani_pos[1] = target_y
-                        self.shani_sitting = True
-                        if DEBUG:
-                            print(f"Shani reached sitting position! shani_sitting={self.shani_sitting}, maria_sitting={self.maria_sitting}")
-                        if self.shani_anim:
-                            # Try to play sit animation, fall back to idle if not available
-                            if 'sit_down' in self.shani_anim.animations:
-                                self.shani_anim.play('sit_down')
-                            elif 'sit' in self.shani_anim.animations:
-                                self.shani_anim.play('sit')
-                            else:
-                                self.shani_anim.play('idle_left')
-        
-        # Handle Maria movement when game interaction is triggered
-        if self.game_interaction_active and not self.maria_sitting and self.maria_target_pos:
-            target_x, target_y = self.maria_target_pos
-            dx = target_x - self.player_pos[0]
-            dy = target_y - self.player_pos[1]
-            distance = math.sqrt(dx * dx + dy * dy)
-            
-            if distance > 5:
-                # Move Maria toward target
-                nx = dx / distance
-                ny = dy / distance
-                speed = 180
-                self.player_pos[0] += nx * speed * dt
-                self.player_pos[1] += ny * speed * dt
-                
-                # Determine facing direction
-                if abs(dx) > abs(dy):
-                    self.player_facing = 'left' if dx < 0 else 'right'
-                else:
-                    self.player_facing = 'up' if dy < 0 else 'down'
-                
-                # Play walk animation
-                if self.maria_anim:
-                    walk_anim = f'walk_{self.player_facing}'
-                    if self.maria_anim.current != walk_anim:
-                        self.maria_anim.play(walk_anim)
-            else:
-                # Reached target, sit down
-                self.player_pos[0] = target_x
-                self.player_pos[1] = target_y
-                self.maria_sitting = True
-                if DEBUG:
-                    print(f"Maria reached sitting position! maria_sitting={self.maria_sitting}, shani_sitting={self.shani_sitting}")
-                if self.maria_anim:
-                    # Try to play sit animation, fall back to idle
-                    if 'sit_down' in self.maria_anim.animations:
-                        self.maria_anim.play('sit_down')
-                    elif 'sit' in self.maria_anim.animations:
-                        self.maria_anim.play('sit')
-                    else:
-                        self.maria_anim.play('idle_right')
-                
+        # Send Shani and Maria to their chairs when game interaction is triggered
+        if self.game_interaction_active:
+            if (self.shani_can_move and self.shani_target_pos and not self.shani_sitting
+                    and not self.navigator.is_walking(self.shani)):
+                self.navigator.walk_to(self.shani, self.shani_target_pos, speed=180, on_arrive=self._sit_down)
+            if (self.maria_target_pos and not self.maria_sitting
+                    and not self.navigator.is_walking(self.maria)):
+                self.navigator.walk_to(self.maria, self.maria_target_pos, speed=180, on_arrive=self._sit_down)
+        
+        self.navigator.update(dt)
+        self.shani_facing = self.shani.facing
+        if self.navigator.is_walking(self.maria):
+            self.player_facing = self.maria.facing
+            is_moving = True
+        else:
+            self.maria.facing = self.player_facing
         
         # Check if both are sitting - show game overlay (outside movement blocks)
         if self.game_interaction_active and self.shani_sitting and self.maria_sitting and not self.show_game_overlay:
@@ -730,55 +612,89 @@ class ApartmentScene(Scene):
                     message = "After their first date Shani and Maria went out on many more dates..."
                     self.manager.go_to(TransitionScene(message, DisneyScene, self.manager, duration=5.0, music_file=self.music_file))
 
-    def draw(self, surface: pygame.Surface):
-        surface.fill((20, 20, 30))
-        
-        # Draw background image if available
+    def _shani_reached_maria(self, walker):
+        """Intro cutscene: Shani arrived next to Maria, start the welcome dialogue."""
+        if DEBUG:
+            print(f"Shani reached Maria! pos={self.shani_pos}")
+        walker.facing = self.shani_facing = 'left'
+        walker.play('idle_left')
+        self.dialog.set_lines([
+            "Thanks for coming over!",
+            "Wow, your pictures did not do you justice!",
+            "You are gorgeous!",
+            "Feel free to check out my apartment!"
+        ])
+        self.cutscene_step = 2
+
+    def _sit_down(self, walker):
+        """A character reached their chair for the card game."""
+        if walker is self.shani:
+            self.shani_sitting = True
+            fallback = 'idle_left'
+        else:
+            self.maria_sitting = True
+            fallback = 'idle_right'
+        if DEBUG:
+            print(f"Sat down! shani_sitting={self.shani_sitting}, maria_sitting={self.maria_sitting}")
+        # Try to play sit animation, fall back to idle if not available
+        for name in ('sit_down', 'sit', fallback):
+            if walker.anim and name in walker.anim.animations:
+                walker.anim.play(name)
+                break
+
+    def _draw_background(self, target: pygame.Surface):
+        """Static background at native resolution (cached by the render queue)."""
+        target.fill((20, 20, 30))
         if self.background:
-            surface.blit(self.background, (0, self.background_offset_y))
+            target.blit(self.background, self.camera.to_native(self.camera.to_view(0, 0)))
         else:
             # Fallback if image didn't load
-            surface.fill((60, 50, 70))
-        
-        # Draw Shani
+            target.fill((60, 50, 70))
+
+    def _queue_wine_glass(self, glass_rect, sort_y: float):
+        """Queue the background's wine glass region at depth sort_y (over the sitter in front of it)."""
+        if glass_rect and self.background:
+            camera = self.camera
+            # The glass rect is in view coordinates; the background is the whole map at native scale
+            map_rect = glass_rect.move(camera.x, camera.y)
+            self.render_queue.submit(self.background, camera.to_native(glass_rect.topleft),
+                                     area=camera.native_rect(map_rect), sort_y=sort_y)
+
+    def draw(self, surface: pygame.Surface):
+        queue = self.render_queue
+        camera = self.camera
+        world = camera.begin(surface)
+        queue.set_static(render_queue.BACKGROUND, self.background is not None, camera.native_size,
+                         self._draw_background)
+        char_scale = self.CHARACTER_SCALE / camera.scale
+
+        # Characters are y-sorted by their feet (sprites are 128px tall on screen)
+        # Shani
+        shani_x, shani_y = self.shani_pos
         if self.shani_sitting and self.shani_sitting_sprite:
             # Use static sitting sprite
-            scaled = pygame.transform.scale(self.shani_sitting_sprite, (128, 128))
-            surface.blit(scaled, (self.shani_pos[0], self.shani_pos[1]))
+            queue.submit(self.shani_sitting_sprite, camera.to_native((shani_x, shani_y)), sort_y=shani_y + 128)
         elif self.shani_anim:
-            self.shani_anim.draw(surface, self.shani_pos[0], self.shani_pos[1], scale=2.0)
-        
-        # Redraw wine glass on top of Shani when she's sitting (to fix layering)
-        if self.shani_sitting and self.background:
-            # Extract and redraw the wine glass region from background
-            # Need to get the rect position relative to the background (without offset)
-            glass_rect = self.wine_glass2_rect
-            if glass_rect:
-                # The glass rect has already been offset, so subtract it to get background coordinates
-                bg_rect = pygame.Rect(glass_rect.x, glass_rect.y - self.background_offset_y, 
-                                     glass_rect.width, glass_rect.height)
-                glass_subsurface = self.background.subsurface(bg_rect)
-                # Blit at the screen position (which includes the offset)
-                surface.blit(glass_subsurface, (glass_rect.x, glass_rect.y))
-        
-        # Draw Maria
+            queue.submit(self.shani_anim.current_frame(scale=char_scale), camera.to_native((shani_x, shani_y)),
+                         sort_y=shani_y + 128)
+        # The wine glass on the table stays in front of Shani while she sits
+        if self.shani_sitting:
+            self._queue_wine_glass(self.wine_glass2_rect, shani_y + 128)
+
+        # Maria
+        maria_x, maria_y = int(self.player_pos[0]), int(self.player_pos[1])
         if self.maria_sitting and self.maria_sitting_sprite:
             # Use static sitting sprite
-            scaled = pygame.transform.scale(self.maria_sitting_sprite, (128, 128))
-            surface.blit(scaled, (int(self.player_pos[0]), int(self.player_pos[1])))
+            queue.submit(self.maria_sitting_sprite, camera.to_native((maria_x, maria_y)), sort_y=maria_y + 128)
         elif self.maria_anim:
-            self.maria_anim.draw(surface, int(self.player_pos[0]), int(self.player_pos[1]), scale=2.0)
-        
-        # Redraw wine glass on top of Maria when she's sitting (to fix layering)
-        if self.maria_sitting and self.background:
-            glass_rect = self.wine_glass1_rect
-            if glass_rect:
-                # The glass rect has already been offset, so subtract it to get background coordinates
-                bg_rect = pygame.Rect(glass_rect.x, glass_rect.y - self.background_offset_y,
-                                     glass_rect.width, glass_rect.height)
-                glass_subsurface = self.background.subsurface(bg_rect)
-                # Blit at the screen position (which includes the offset)
-                surface.blit(glass_subsurface, (glass_rect.x, glass_rect.y))
+            queue.submit(self.maria_anim.current_frame(scale=char_scale), camera.to_native((maria_x, maria_y)),
+                         sort_y=maria_y + 128)
+        # Same for Maria's glass
+        if self.maria_sitting:
+            self._queue_wine_glass(self.wine_glass1_rect, maria_y + 128)
+
+        queue.flush(world)
+        camera.present(surface)
         
         # Debug: draw collision boxes
         if DEBUG:
@@ -853,7 +769,4 @@ class ApartmentScene(Scene):
         
         # Draw fade out overlay
         if self.fade_out and self.fade_alpha > 0:
-            fade_surface = pygame.Surface(surface.get_size())
-            fade_surface.fill((0, 0, 0))
-            fade_surface.set_alpha(int(self.fade_alpha))
-            surface.blit(fade_surface, (0, 0))
+            self.fade(surface, self.fade_alpha)
@@ -1,10 +1,27 @@
 import pygame
 import random
 from ..core.scene import Scene
+from ..core import render_backend
+from ..core.rotation_cache import RotationCache
 
 
 class BumbleScene(Scene):
-    """Simple swipe-style scene: Maria swipes through profiles until she finds Shani."""
+    """Simple swipe-style scene: Maria swipes through profiles until she finds Shani.
+
+    Each profile is rendered once into a card surface (see _build_card); the
+    swipe animations only move, rotate and fade that cached card.
+    """
+
+    BACKGROUND = (255, 200, 0)  # Yellow
+    CARD_WIDTH = 700
+    CARD_TOP = 100
+    CARD_SHADOW = 8
+    SWIPE_TIME = 0.35  # seconds for a rejected card to leave the screen
+    SWIPE_ANGLE = 14  # degrees the card tilts by the end of a swipe
+    ROTATION_STEP = 2.0  # card rotations are cached per this many degrees
+    NUDGE_TIME = 0.4  # seconds for the accept nudge to the right and back
+    NUDGE_DISTANCE = 40
+    NUDGE_ANGLE = 4
 
     def __init__(self, manager=None):
         super().__init__(manager)
@@ -65,21 +82,47 @@ class BumbleScene(Scene):
         self.heart_image = None
         self.hearts = []  # List of heart positions and properties
         self.heart_spawn_timer = 0.0
+        # pre-rendered surfaces
+        self.cards = {}  # profile index -> card surface (card + shadow)
+        self.card_size = None  # (w, h) of the screen the cards were built for
+        self.hint_surfaces = {}  # profile index -> hint text below the card
+        self.title_surface = None
+        self.match_surface = None
+        self.heart_sizes = {}  # heart size in pixels -> scaled heart
+        self.card_rotations = None
+        # running card animations
+        self.swipe = None  # {'index', 'timer'}: rejected card flying off to the left
+        self.nudge_timer = 0.0  # accept nudge, counts down to 0
+        self.required_assets = ['scenes/bumble/red_heart.png'] + [
+            f"characters/{p['character']}/idle.png" for p in self.profiles if p.get("character")
+        ]
 
     def start(self):
         super().start()  # Call parent to handle music
         self.font = pygame.font.SysFont(None, 36)
         self.index = 0
         self.matched = False
+        self.swipe = None
+        self.nudge_timer = 0.0
         self._load_character_sprites()
         
         # Load heart image
-        try:
-            self.heart_image = pygame.image.load("art/scenes/bumble/red_heart.png").convert_alpha()
+        heart = self.scope.get('scenes/bumble/red_heart.png')
+        if heart is not None:
             # Scale heart to reasonable size
-            self.heart_image = pygame.transform.scale(self.heart_image, (40, 40))
-        except Exception as e:
-            print(f"Failed to load red_heart.png: {e}")
+            self.heart_image = pygame.transform.scale(heart, (40, 40))
+        else:
+            print("Failed to load red_heart.png")
+
+        # Render every card up front so draw() never lays out text
+        self.card_rotations = RotationCache(step=self.ROTATION_STEP, max_bytes=48 * 1024 * 1024,
+                                            background=True)
+        self._build_cards(render_backend.screen_size())
+
+    def end(self):
+        super().end()
+        if self.card_rotations is not None:
+            self.card_rotations.close()
     
     def _load_character_sprites(self):
         """Load character sprites for profiles."""
@@ -87,7 +130,7 @@ class BumbleScene(Scene):
             char_name = profile.get("character")
             if char_name:
                 try:
-                    sprite_sheet = pygame.image.load(f"art/characters/{char_name}/idle.png").convert_alpha()
+                    sprite_sheet = self.scope.get(f"characters/{char_name}/idle.png")
                     # Get the front-facing sprite (third row down - y=128)
                     sprite = sprite_sheet.subsurface(pygame.Rect(0, 128, 64, 64))
                     self.character_sprites[char_name] = sprite
@@ -108,10 +151,14 @@ class BumbleScene(Scene):
 
     def _reject(self):
         if self.index < len(self.profiles) - 1:
+            # the rejected card flies off over the next one
+            self.swipe = {'index': self.index, 'timer': 0.0}
             self.index += 1
 
     def _accept(self):
         """Handle accepting Shani's profile - triggers match animation."""
+        if not self.matched:
+            self.nudge_timer = self.NUDGE_TIME
         self.matched = True
         self.transition_timer = 8.0
 
@@ -131,6 +178,15 @@ class BumbleScene(Scene):
                 self.hearts.remove(heart)
 
     def update(self, dt: float):
+        if self.swipe is not None:
+            self.swipe['timer'] += dt
+            if self.swipe['timer'] >= self.SWIPE_TIME:
+                self.swipe = None
+                # only now, so the worker doesn't evict the rotations in use
+                self._prewarm_card(self.index)
+        if self.nudge_timer > 0:
+            self.nudge_timer = max(0.0, self.nudge_timer - dt)
+
         if self.matched:
             # Spawn hearts continuously
             if self.heart_image:
@@ -155,21 +211,23 @@ class BumbleScene(Scene):
                     manager=self.manager
                 ))
 
-    def _draw_title(self, surface: pygame.Surface, w: int):
-        """Draw the 'Welcome to Bumble!' title with shadow."""
+    def _render_title(self) -> pygame.Surface:
+        """Render the 'Welcome to Bumble!' title with its shadow (3px down/right)."""
         title_font = pygame.font.SysFont(None, 64, bold=True)
         shadow_surf = title_font.render("Welcome to Bumble!", True, (200, 150, 0))
-        shadow_x = (w - shadow_surf.get_width()) // 2
-        surface.blit(shadow_surf, (shadow_x + 3, 33))
-        
         title_surf = title_font.render("Welcome to Bumble!", True, (255, 255, 255))
-        title_x = (w - title_surf.get_width()) // 2
-        surface.blit(title_surf, (title_x, 30))
+        # opaque on the background colour, so the antialiased edges blend exactly as before
+        surf = pygame.Surface((title_surf.get_width() + 3, title_surf.get_height() + 3))
+        surf.fill(self.BACKGROUND)
+        surf.blit(shadow_surf, (3, 3))
+        surf.blit(title_surf, (0, 0))
+        return surf
 
     def _draw_card_background(self, surface: pygame.Surface, box: pygame.Rect):
         """Draw the card shadow and white background."""
-        shadow_box = pygame.Rect(box.x + 8, box.y + 8, box.width, box.height)
-        pygame.draw.rect(surface, (200, 150, 0, 80), shadow_box, border_radius=12)
+        shadow_box = box.move(self.CARD_SHADOW, self.CARD_SHADOW)
+        # opaque: the alpha was ignored when this was drawn straight on the screen
+        pygame.draw.rect(surface, (200, 150, 0), shadow_box, border_radius=12)
         pygame.draw.rect(surface, (255, 255, 255), box, border_radius=12)
 
     def _draw_character_sprite(self, surface: pygame.Surface, char_name: str, box: pygame.Rect):
@@ -251,65 +309,139 @@ class BumbleScene(Scene):
         
         return y_pos + badge_height + 12
 
-    def draw(self, surface: pygame.Surface):
-        surface.fill((255, 200, 0))  # Yellow background
-        w, h = surface.get_size()
-        
-        # Draw title
-        self._draw_title(surface, w)
-        
-        # Card dimensions
-        box_w = 700
-        box_h = h - 140
-        box = pygame.Rect((w - box_w) // 2, 100, box_w, box_h)
-        
-        # Draw card background
+    def _card_box(self, w: int, h: int) -> pygame.Rect:
+        """Screen rect of the card (without its shadow)."""
+        return pygame.Rect((w - self.CARD_WIDTH) // 2, self.CARD_TOP, self.CARD_WIDTH, h - 140)
+
+    def _build_card(self, profile: dict, box_size) -> pygame.Surface:
+        """Render one profile into a card surface (card at (0, 0), shadow included)."""
+        surface = pygame.Surface((box_size[0] + self.CARD_SHADOW, box_size[1] + self.CARD_SHADOW),
+                                 pygame.SRCALPHA)
+        box = pygame.Rect((0, 0), box_size)
         self._draw_card_background(surface, box)
 
-        # Current profile
-        cur = self.profiles[self.index]
         name_font = pygame.font.SysFont(None, 48, bold=True)
         label_font = pygame.font.SysFont(None, 26, bold=True)
         info_font = pygame.font.SysFont(None, 26)
-        small_font = pygame.font.SysFont(None, 24)
-        
+
         # Draw character sprite
-        self._draw_character_sprite(surface, cur.get("character"), box)
-        
+        self._draw_character_sprite(surface, profile.get("character"), box)
+
         # Name and age
         text_y = box.y + 240
-        name_age_text = f"{cur['name']}, {cur['age']}"
+        name_age_text = f"{profile['name']}, {profile['age']}"
         name_age_surf = name_font.render(name_age_text, True, (10, 10, 10))
         name_age_x = box.x + (box.width - name_age_surf.get_width()) // 2
         surface.blit(name_age_surf, (name_age_x, text_y))
-        
+
         # Draw profile badges
         current_y = text_y + 60
-        current_y = self._draw_info_badge(surface, box, "briefcase", "Occupation", cur['occupation'], current_y, label_font, info_font)
-        current_y = self._draw_info_badge(surface, box, "heart", "Looking for", cur['looking_for'], current_y, label_font, info_font)
-        current_y = self._draw_info_badge(surface, box, "star", "Hobbies", cur['hobbies'], current_y, label_font, info_font)
-        
+        current_y = self._draw_info_badge(surface, box, "briefcase", "Occupation", profile['occupation'], current_y, label_font, info_font)
+        current_y = self._draw_info_badge(surface, box, "heart", "Looking for", profile['looking_for'], current_y, label_font, info_font)
+        current_y = self._draw_info_badge(surface, box, "star", "Hobbies", profile['hobbies'], current_y, label_font, info_font)
+        return surface
+
+    def _build_cards(self, size) -> None:
+        """Pre-render every card, hint and title for a screen of the given size."""
+        box = self._card_box(*size)
+        small_font = pygame.font.SysFont(None, 24)
+        self.cards.clear()
+        self.hint_surfaces.clear()
+        for i, profile in enumerate(self.profiles):
+            self.cards[i] = self._build_card(profile, box.size)
+            hint = "Press X to reject"
+            if profile.get("match", False):
+                hint += " — Press C to accept"
+            self.hint_surfaces[i] = small_font.render(hint, True, (0, 0, 0))
+        self.title_surface = self._render_title()
+        self.match_surface = pygame.font.SysFont(None, 48).render("It's a match!", True, (255, 50, 120))
+        if self.card_rotations is not None:
+            self.card_rotations.clear()
+            self._prewarm_card(self.index)
+        self.card_size = tuple(size)
+
+    def _prewarm_card(self, index: int) -> None:
+        """Rotate the angles the current card's animation will use while it is being read."""
+        if self.card_rotations is None or index not in self.cards:
+            return
+        # the worker gets its own copy: it can't rotate a surface while draw() blits it
+        card = self.cards[index].copy()
+        if self.profiles[index].get("match"):
+            self.card_rotations.prewarm(index, card, start=-self.NUDGE_ANGLE, stop=0)
+        else:
+            self.card_rotations.prewarm(index, card, start=self.ROTATION_STEP,
+                                         stop=self.SWIPE_ANGLE + self.ROTATION_STEP)
+
+    def _get_heart(self, size: int) -> pygame.Surface:
+        heart = self.heart_sizes.get(size)
+        if heart is None:
+            heart = pygame.transform.scale(self.heart_image, (size, size))
+            self.heart_sizes[size] = heart
+        return heart
+
+    def _draw_card(self, surface: pygame.Surface, index: int, box: pygame.Rect,
+                   dx: float = 0, angle: float = 0, alpha: int = 255):
+        """Blit a cached card at box, moved by dx, rotated by angle and faded to alpha."""
+        card = self.cards[index]
+        if angle and self.card_rotations.quantize(angle):
+            card = self.card_rotations.get(index, card, angle)
+        # rotation grows the surface around the same centre
+        center_x = box.x + (box.width + self.CARD_SHADOW) // 2 + int(dx)
+        center_y = box.y + (box.height + self.CARD_SHADOW) // 2
+        rect = card.get_rect(center=(center_x, center_y))
+        if alpha < 255:
+            # cards are cached: set the fade just for this blit
+            old_alpha = card.get_alpha()
+            card.set_alpha(alpha)
+            surface.blit(card, rect)
+            card.set_alpha(old_alpha)
+        else:
+            surface.blit(card, rect)
+
+    def draw(self, surface: pygame.Surface):
+        surface.fill(self.BACKGROUND)
+        w, h = surface.get_size()
+        if self.card_size != (w, h):
+            self._build_cards((w, h))
+
+        # Draw title
+        surface.blit(self.title_surface, ((w - self.title_surface.get_width() + 3) // 2, 30))
+
+        box = self._card_box(w, h)
+
+        # Current card, nudged right and back when accepted
+        dx = angle = 0
+        if self.nudge_timer > 0:
+            t = 1.0 - self.nudge_timer / self.NUDGE_TIME
+            bump = 1.0 - abs(2.0 * t - 1.0)  # 0 -> 1 -> 0
+            dx = self.NUDGE_DISTANCE * bump
+            angle = -self.NUDGE_ANGLE * bump
+        self._draw_card(surface, self.index, box, dx, angle)
+
+        # Rejected card flying off to the left over the current one
+        if self.swipe is not None:
+            t = min(1.0, self.swipe['timer'] / self.SWIPE_TIME)
+            ease = t * t
+            self._draw_card(surface, self.swipe['index'], box,
+                            dx=-(box.right + self.CARD_SHADOW) * ease,
+                            angle=self.SWIPE_ANGLE * ease,
+                            alpha=int(255 * (1.0 - ease)))
+
         # Hint text below the card
-        is_match = cur.get("match", False)
-        hint = "Press X to reject"
-        if is_match:
-            hint += " — Press C to accept"
-        hint_surf = small_font.render(hint, True, (0, 0, 0))
+        hint_surf = self.hint_surfaces[self.index]
         hint_x = (w - hint_surf.get_width()) // 2
-        surface.blit(hint_surf, (hint_x, box.y + box_h + 15))
+        surface.blit(hint_surf, (hint_x, box.y + box.height + 15))
 
         if self.matched:
             # Draw hearts
             if self.heart_image:
+                blits = []
                 for heart in self.hearts:
                     # Scale heart based on size_mult
-                    size = int(40 * heart['size_mult'])
-                    scaled_heart = pygame.transform.scale(self.heart_image, (size, size))
+                    scaled_heart = self._get_heart(int(40 * heart['size_mult']))
                     # Get rect for centered blitting
-                    rect = scaled_heart.get_rect(center=(heart['x'], heart['y']))
-                    surface.blit(scaled_heart, rect)
-            
-            m = pygame.font.SysFont(None, 48).render("It's a match!", True, (255, 50, 120))
-            surface.blit(m, ((w - m.get_width()) // 2, box.y + 6))
-
+                    blits.append((scaled_heart, scaled_heart.get_rect(center=(heart['x'], heart['y']))))
+                surface.blits(blits, doreturn=False)
 
+            m = self.match_surface
+            surface.blit(m, ((w - m.get_width()) // 2, box.y + 6))
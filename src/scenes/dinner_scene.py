@@ -3,7 +3,9 @@ import math
 import os
 from ..core.scene import Scene
 from ..core.dialogue import DialogueBox
-from ..core import assets
+from ..core import assets, animation_sets, render_backend, render_queue
+from ..core.animation_scheduler import AnimationScheduler, BACKGROUND_TICK_MS
+from ..core.camera import Camera
 from ..utils.tilemap import load_dinner_tilemap, load_collision_map
 from ..utils.lpc_demo import Animation, AnimationManager, IDLE_SPEED, WALK_SPEED, SIT_SPEED
 
@@ -21,7 +23,11 @@ class DinnerScene(Scene):
     - Mouse click YES on proposal overlay to accept
     """
     
-    # NPC positions for drawing and collision detection (adjusted for -200 background offset)
+    # The world (tilemap and sprites) is drawn at 1/NATIVE_SCALE resolution and upscaled once
+    NATIVE_SCALE = 2
+    CHARACTER_SCALE = 2.0  # LPC frames are shown at 2x on screen
+
+    # NPC positions for drawing and collision detection (view coordinates: camera at y=200)
     NPC_POSITIONS = [
         (200, 380),   # Mom - left side (580 - 200)
         (280, 380),   # Dad - next to Mom (580 - 200)
@@ -31,11 +37,31 @@ class DinnerScene(Scene):
         (730, 440),   # Marisa - bottom right (640 - 200)
     ]
 
+    # Only these character sheets are decoded (see assets.get_animations)
+    ANIMATIONS_USED = ('idle', 'walk', 'sit', 'emote')
+
+    # (attribute, character, initial animations in priority order), set up one per loading step
+    CHARACTERS = (
+        ('maria_anim_mgr', 'maria', ['idle', 'idle_down']),
+        ('shani_anim_mgr', 'shani', ['walk_left', 'walk', 'idle_left', 'idle']),
+        ('mom_anim_mgr', 'mom', ['idle_down', 'idle']),
+        ('dad_anim_mgr', 'dad', ['idle_down', 'idle']),
+        ('gio_anim_mgr', 'gio', ['idle_down', 'idle']),
+        ('loriana_anim_mgr', 'loriana', ['idle_down', 'idle']),
+        ('oresti_anim_mgr', 'oresti', ['idle_down', 'idle']),
+        ('marisa_anim_mgr', 'marisa', ['idle_down', 'idle']),
+    )
+
     def __init__(self, manager=None):
         super().__init__(manager)
         self.music_file = "art/music/dinner/marryyou.mp3"  # Set your music file here
         self.font = None
         self.dialog = None
+        # Characters and props are depth-sorted through the render queue
+        self.render_queue = render_queue.RenderQueue()
+        self.labels = {}  # name -> rendered name label
+        self.ring_sprite = None
+        self.overlay_blits = []  # full-resolution names/ring, drawn after the world
         # NPC positions (for display only)
         self.npcs = [
             ("Mom", "Wow this is nice! I love you egg"),
@@ -45,7 +71,9 @@ class DinnerScene(Scene):
             ("Oresti", "Oh so you can play a video game but you can't play DND? Just kiddingyou did well kiddo"),
             ("Marisa", "I can't believe I'm in a video game! Maria, you look amazing like this!"),
         ]
-        self.background_offset_y = -200  # Offset upward to cut off top and show more floor
+        # Camera shows the map from y=200 (cuts off the top, shows more floor);
+        # the world is rendered at half resolution and upscaled once
+        self.camera = Camera((1024, 768), scale=self.NATIVE_SCALE, position=(0, 200))
         self.player_pos = (512, 580)  # Maria starting position - bottom center (780 - 200 offset)
         self.last_npc_collision = None  # Track last NPC collision for dialogue closing
         self.interacting = False  # Track if currently in interaction dialogue
@@ -86,6 +114,7 @@ class DinnerScene(Scene):
         # Emote system
         self.npc_emotes = []  # List of active emote states (npc_index, start_time)
         self.emote_duration = 3.0  # Play emote animation for 3 seconds
+        self.required_assets = ['characters/shani/combat.png']
 
 
     def _setup_character(self, char_name, initial_anim_priority=None):
@@ -100,7 +129,7 @@ class DinnerScene(Scene):
             AnimationManager instance or None
         """
         try:
-            anims = assets.get_animations(char_name, size=(48, 64))
+            anims = assets.get_animations(char_name, size=(48, 64), only=self.ANIMATIONS_USED)
             if not anims:
                 return None
         except Exception:
@@ -109,22 +138,13 @@ class DinnerScene(Scene):
         mgr = AnimationManager()
         
         # Add all animations with appropriate settings
-        for name, frames in anims.items():
-            if not frames:
-                continue
-            
+        for name in anims:
             # For walk animations, filter out transparent/empty frames for smoother looping
-            if 'walk' in name:
-                visible_frames = []
-                for frame in frames:
-                    try:
-                        mask = pygame.mask.from_surface(frame)
-                        if mask.count() > 0:  # Frame has visible pixels
-                            visible_frames.append(frame)
-                    except Exception:
-                        visible_frames.append(frame)  # Keep frame if mask fails
-                if visible_frames:
-                    frames = visible_frames
+            anim_set = animation_sets.acquire(
+                self, char_name, name, size=(48, 64),
+                filter=animation_sets.VISIBLE if 'walk' in name else None)
+            if anim_set is None:
+                continue
             
             # Detect speed from animation name
             if 'idle' in name:
@@ -141,7 +161,7 @@ class DinnerScene(Scene):
             loop = 'sit' not in name  # Only sit animations don't loop
             
             try:
-                mgr.add(name, Animation(frames, speed_ms=speed, loop=loop))
+                mgr.add(name, Animation.from_set(anim_set, speed_ms=speed, loop=loop))
             except Exception:
                 pass
         
@@ -248,41 +268,48 @@ class DinnerScene(Scene):
                     pass
 
     def start(self):
+        """Load the scene a step at a time (the manager shows a progress bar meanwhile)."""
         super().start()  # Call parent to handle music
         self.font = pygame.font.SysFont(None, 28)
+        self.labels = {}
         self.dialog = DialogueBox(self.font, 760, 120)
+        # tilemap, collisions, kneeling sprites, then one step per character
+        steps = 3 + len(self.CHARACTERS)
         
         # Load tilemap background
+        dinner_folder = os.path.join('art', 'scenes', 'dinner', 'dinner')
+        # Game is now 1024x1024, tilemap is 16x16 tiles at 16px
+        # Scale: 1024 / 256 = 4x (16px tiles → 64px display tiles)
+        self.tilemap_scale = 4.0
         try:
-            dinner_folder = os.path.join('art', 'scenes', 'dinner', 'dinner')
             self.tilemap_layers = load_dinner_tilemap(dinner_folder)
-            # Game is now 1024x1024, tilemap is 16x16 tiles at 16px
-            # Scale: 1024 / 256 = 4x (16px tiles → 64px display tiles)
-            self.tilemap_scale = 4.0
-            
-            # Load collision map
+        except Exception as e:
+            print(f"Could not load tilemap: {e}")
+            self.tilemap_layers = []
+        yield 1 / steps
+        
+        # Load collision map
+        try:
             collision_file = os.path.join(dinner_folder, 'data', 'collisions.js')
             self.collision_rects = load_collision_map(collision_file, tile_size=16, scale=self.tilemap_scale)
             
-            # Apply background offset to collision rects
+            # Move collision rects into view coordinates
             for rect in self.collision_rects:
-                rect.y += self.background_offset_y
+                self.camera.rect_to_view(rect)
         except Exception as e:
-            print(f"Could not load tilemap: {e}")
-            self.tilemap_layers = []
+            print(f"Could not load collisions: {e}")
             self.collision_rects = []
+        yield 2 / steps
         
         # Load Shani's kneeling sprites from combat.png
         self.shani_kneeling_sprites = []
         try:
-            combat_path = os.path.join('art', 'characters', 'shani', 'combat.png')
-            combat_sheet = pygame.image.load(combat_path).convert_alpha()
             # Second row (y=64) has left-facing kneeling frames
-            # Extract 2 kneeling sprites (frames at x=0 and x=64)
-            for i in range(2):
-                sprite = pygame.Surface((64, 64), pygame.SRCALPHA, 32)
-                sprite.blit(combat_sheet, (0, 0), (i * 64, 64, 64, 64))
-                self.shani_kneeling_sprites.append(sprite)
+            # Extract 2 kneeling sprites (frames at x=0 and x=64), drawn at 128x128
+            kneeling = animation_sets.acquire_region(
+                self, 'characters/shani/combat.png', [(i * 64, 64, 64, 64) for i in range(2)])
+            if kneeling is not None:
+                self.shani_kneeling_sprites = kneeling.scaled(self.CHARACTER_SCALE / self.camera.scale)
         except Exception as e:
             print(f"Could not load Shani kneeling sprites: {e}")
             self.shani_kneeling_sprites = []
@@ -290,16 +317,12 @@ class DinnerScene(Scene):
         self.shani_kneeling = False  # Track if Shani is in kneeling pose
         self.kneeling_frame = 0  # Current kneeling frame
         self.kneeling_timer = 0.0  # Timer for kneeling animation
+        yield 3 / steps
         
         # Setup character animations
-        self.maria_anim_mgr = self._setup_character('maria', ['idle', 'idle_down'])
-        self.shani_anim_mgr = self._setup_character('shani', ['walk_left', 'walk', 'idle_left', 'idle'])
-        self.mom_anim_mgr = self._setup_character('mom', ['idle_down', 'idle'])
-        self.dad_anim_mgr = self._setup_character('dad', ['idle_down', 'idle'])
-        self.gio_anim_mgr = self._setup_character('gio', ['idle_down', 'idle'])
-        self.loriana_anim_mgr = self._setup_character('loriana', ['idle_down', 'idle'])
-        self.oresti_anim_mgr = self._setup_character('oresti', ['idle_down', 'idle'])
-        self.marisa_anim_mgr = self._setup_character('marisa', ['idle_down', 'idle'])
+        for i, (attr, char_name, initial) in enumerate(self.CHARACTERS):
+            setattr(self, attr, self._setup_character(char_name, initial))
+            yield (4 + i) / steps
         
         # Character sprite registry: maps NPC index to animation manager
         self.npc_sprites = {
@@ -311,7 +334,15 @@ class DinnerScene(Scene):
             5: self.marisa_anim_mgr,  # Marisa at position index 5
         }
         
-
+        # Only animate what can change on screen: guests holding an idle pose sleep,
+        # and seated guests tick at a lower rate than Maria and Shani
+        self.animations = AnimationScheduler(view=pygame.Rect((0, 0), render_backend.screen_size()))
+        self.animations.add(self.maria_anim_mgr, rect=lambda: pygame.Rect(self.player_pos[0], self.player_pos[1], 96, 128))
+        self.animations.add(self.shani_anim_mgr, rect=self._shani_rect)
+        for i, npc_anim_mgr in self.npc_sprites.items():
+            x, y = self.NPC_POSITIONS[i]
+            self.animations.add(npc_anim_mgr, rect=lambda r=pygame.Rect(x - 48, y - 64, 96, 128): r,
+                                tick_ms=BACKGROUND_TICK_MS)
 
     def handle_event(self, event: pygame.event.EventType):
         if event.type == pygame.KEYDOWN:
@@ -603,100 +634,151 @@ class DinnerScene(Scene):
             except Exception:
                 pass
 
-        # Update all character animations
-        dt_ms = int(dt * 1000)
-        for mgr_name in ['maria_anim_mgr', 'shani_anim_mgr', 'mom_anim_mgr', 'dad_anim_mgr', 'gio_anim_mgr', 'loriana_anim_mgr', 'oresti_anim_mgr', 'marisa_anim_mgr']:
-            mgr = getattr(self, mgr_name, None)
-            if mgr:
-                try:
-                    mgr.update(dt_ms)
-                except Exception:
-                    pass
+        # Update character animations (sleeping, hidden and background ones are skipped)
+        self.animations.update(int(dt * 1000))
+
+    def _shani_rect(self):
+        """Where Shani's animation is drawn (None while she isn't, or kneels with her own sprites)."""
+        if not self.p2_active or self.shani_kneeling:
+            return None
+        return pygame.Rect(int(self.p2_x), int(self.p2_y), 96, 128)
+
+    def _draw_tilemap(self, target: pygame.Surface):
+        """Static background: every tile layer at native scale (cached by the render queue)."""
+        for tilemap, layer_data in self.tilemap_layers:
+            tilemap.draw_layer(target, layer_data, scale=self.tilemap_scale / self.camera.scale)
+
+    def _draw_fallback_background(self, target: pygame.Surface):
+        """Static background when the tilemap couldn't load: a plain table."""
+        # Drawn at view size, then reduced to the native target once
+        view = pygame.Surface(self.camera.view_size)
+        # Fallback: solid color background
+        view.fill((80, 40, 30))
+        # draw table (adjusted for -200 offset: 540 - 200 = 340)
+        # Table base
+        pygame.draw.rect(view, (120, 80, 50), (200, 340, 880, 160))
+        # Tablecloth - white/cream with slight transparency look
+        tablecloth_rect = pygame.Rect(190, 330, 900, 180)
+        pygame.draw.rect(view, (240, 235, 220), tablecloth_rect)
+        # Tablecloth border/trim
+        pygame.draw.rect(view, (200, 180, 150), tablecloth_rect, 3)
+        # Add decorative pattern (simple stripes or dots)
+        for i in range(200, 1080, 40):
+            pygame.draw.line(view, (220, 210, 195), (i, 335), (i, 505), 1)
+        # Add subtle shadow under tablecloth
+        pygame.draw.rect(view, (100, 60, 40), (195, 505, 890, 8))
+        pygame.transform.scale(view, target.get_size(), target)
+
+    def _label(self, name: str) -> pygame.Surface:
+        """Rendered name label (cached)."""
+        label = self.labels.get(name)
+        if label is None:
+            label = self.labels[name] = self.font.render(name, True, (10, 10, 10))
+        return label
+
+    def _get_ring_sprite(self) -> pygame.Surface:
+        """The engagement ring Shani holds out, centred at (12, 12) of a 24x24 sprite."""
+        if self.ring_sprite is None:
+            ring = pygame.Surface((24, 24), pygame.SRCALPHA)
+            cx, cy = 12, 12
+            # Draw ring - gold band with translucent center
+            pygame.draw.circle(ring, (255, 215, 0), (cx, cy), 8)  # Gold outer circle
+            # Translucent inner circle
+            inner_circle = pygame.Surface((12, 12), pygame.SRCALPHA)
+            pygame.draw.circle(inner_circle, (0, 0, 0, 100), (6, 6), 5)  # Translucent dark center
+            ring.blit(inner_circle, (cx - 6, cy - 6))
+            # Diamond on top
+            diamond_points = [
+                (cx, cy - 12),  # Top point
+                (cx - 6, cy - 6),  # Left
+                (cx, cy - 2),  # Bottom
+                (cx + 6, cy - 6)  # Right
+            ]
+            pygame.draw.polygon(ring, (230, 230, 255), diamond_points)  # Light blue diamond
+            pygame.draw.polygon(ring, (200, 200, 230), diamond_points, 1)  # Outline
+            self.ring_sprite = ring
+        return self.ring_sprite
+
+    def _queue_character(self, frame, x: int, y: int, name: str, label_pos, sort_y: int,
+                         placeholder=None):
+        """Queue a character sprite (or placeholder shape) at depth sort_y (the feet), and its name.
+
+        Positions are in view pixels; the sprite is drawn in the camera's
+        native target, the name on the screen afterwards (full resolution).
+        """
+        queue = self.render_queue
+        if frame is not None:
+            queue.submit(frame, self.camera.to_native((x, y)), sort_y=sort_y)
+        elif placeholder is not None:
+            rect, color, circle = placeholder
+            rect = self.camera.native_rect(rect)
+            if circle:
+                queue.submit_draw(lambda s: pygame.draw.circle(s, color, rect.center, rect.width // 2), sort_y=sort_y)
+            else:
+                queue.submit_draw(lambda s: pygame.draw.rect(s, color, rect), sort_y=sort_y)
+        self.overlay_blits.append((self._label(name), label_pos))
 
     def draw(self, surface: pygame.Surface):
-        # Draw tilemap background if available (with vertical offset)
+        queue = self.render_queue
+        camera = self.camera
+        world = camera.begin(surface)
+        # Static background, composed once at native resolution
         if self.tilemap_layers:
-            # Create a temporary surface to draw the tilemap, then blit with offset
-            temp_surface = pygame.Surface((1024, 1024), pygame.SRCALPHA)
-            for tilemap, layer_data in self.tilemap_layers:
-                tilemap.draw_layer(temp_surface, layer_data, scale=self.tilemap_scale)
-            surface.blit(temp_surface, (0, self.background_offset_y))
+            map_size = 1024 // camera.scale
+            queue.set_static(render_queue.BACKGROUND, 'tilemap', (map_size, map_size), self._draw_tilemap,
+                             pos=camera.to_native(camera.to_view(0, 0)))
         else:
-            # Fallback: solid color background
-            surface.fill((80, 40, 30))
-            w, h = surface.get_size()
-            # draw table (adjusted for -200 offset: 540 - 200 = 340)
-            # Table base
-            pygame.draw.rect(surface, (120, 80, 50), (200, 340, 880, 160))
-            # Tablecloth - white/cream with slight transparency look
-            tablecloth_rect = pygame.Rect(190, 330, 900, 180)
-            pygame.draw.rect(surface, (240, 235, 220), tablecloth_rect)
-            # Tablecloth border/trim
-            pygame.draw.rect(surface, (200, 180, 150), tablecloth_rect, 3)
-            # Add decorative pattern (simple stripes or dots)
-            for i in range(200, 1080, 40):
-                pygame.draw.line(surface, (220, 210, 195), (i, 335), (i, 505), 1)
-            # Add subtle shadow under tablecloth
-            pygame.draw.rect(surface, (100, 60, 40), (195, 505, 890, 8))
-
-        # Draw NPCs around table
+            queue.set_static(render_queue.BACKGROUND, 'fallback', camera.native_size,
+                             self._draw_fallback_background)
+
+        # Character sprites are drawn at CHARACTER_SCALE on screen
+        char_scale = self.CHARACTER_SCALE / camera.scale
+        self.overlay_blits = []
+
+        # NPCs around table
         for i, (name, _) in enumerate(self.npcs):
             x, y = self.NPC_POSITIONS[i]
             # Draw sprite if available, otherwise draw circle placeholder
             sprite_mgr = self.npc_sprites.get(i)
+            label = self._label(name)
             if sprite_mgr:
-                sprite_mgr.draw(surface, x - 48, y - 64, scale=2.0)  # center sprite (48x64 at 2x = 96x128)
-                # Draw name above sprite (like Maria and Shani)
-                txt = self.font.render(name, True, (10, 10, 10))
-                surface.blit(txt, (x - txt.get_width()//2, y - 70))  # above sprite
+                # center sprite (48x64 at 2x = 96x128), name above sprite (like Maria and Shani)
+                self._queue_character(sprite_mgr.current_frame(scale=char_scale), x - 48, y - 64, name,
+                                      (x - label.get_width()//2, y - 70), sort_y=y + 64)
             else:
-                pygame.draw.circle(surface, (200, 180, 150), (x, y), 28)
-                txt = self.font.render(name, True, (10, 10, 10))
-                surface.blit(txt, (x - txt.get_width()//2, y - 10))
-            
-
+                self._queue_character(None, x, y, name, (x - label.get_width()//2, y - 10), sort_y=y + 28,
+                                      placeholder=(pygame.Rect(x - 28, y - 28, 56, 56), (200, 180, 150), True))
 
         # Maria at table (player)
         mx, my = self.player_pos
         if self.maria_anim_mgr:
-            self.maria_anim_mgr.draw(surface, mx, my, scale=2.0)
+            self._queue_character(self.maria_anim_mgr.current_frame(scale=char_scale), mx, my, "Maria",
+                                  (mx, my - 25), sort_y=my + 128)
         else:
-            pygame.draw.rect(surface, (255, 150, 200), (mx, my, 96, 128))  # 2× size
-        mlabel = self.font.render("Maria", True, (10, 10, 10))
-        surface.blit(mlabel, (mx, my - 25))
+            self._queue_character(None, mx, my, "Maria", (mx, my - 25), sort_y=my + 128,
+                                  placeholder=(pygame.Rect(mx, my, 96, 128), (255, 150, 200), False))  # 2× size
 
-        # draw Shani if active
+        # Shani if active
         if self.p2_active:
+            px, py = int(self.p2_x), int(self.p2_y)
             if self.shani_kneeling and len(self.shani_kneeling_sprites) > 0:
-                # Draw kneeling sprite
+                # Kneeling sprite (128x128 on screen)
                 kneeling_sprite = self.shani_kneeling_sprites[self.kneeling_frame]
-                scaled_sprite = pygame.transform.scale(kneeling_sprite, (128, 128))
-                surface.blit(scaled_sprite, (int(self.p2_x), int(self.p2_y)))
-                
-                # Draw ring in Shani's extended hand (left hand extended forward when kneeling left)
-                ring_x = int(self.p2_x) + 35  # Position in front of Shani
-                ring_y = int(self.p2_y) + 70  # Mid-height where hand would be
-                # Draw ring - gold band with translucent center
-                pygame.draw.circle(surface, (255, 215, 0), (ring_x, ring_y), 8)  # Gold outer circle
-                # Create translucent inner circle
-                inner_circle = pygame.Surface((12, 12), pygame.SRCALPHA)
-                pygame.draw.circle(inner_circle, (0, 0, 0, 100), (6, 6), 5)  # Translucent dark center
-                surface.blit(inner_circle, (ring_x - 6, ring_y - 6))
-                # Diamond on top
-                diamond_points = [
-                    (ring_x, ring_y - 12),  # Top point
-                    (ring_x - 6, ring_y - 6),  # Left
-                    (ring_x, ring_y - 2),  # Bottom
-                    (ring_x + 6, ring_y - 6)  # Right
-                ]
-                pygame.draw.polygon(surface, (230, 230, 255), diamond_points)  # Light blue diamond
-                pygame.draw.polygon(surface, (200, 200, 230), diamond_points, 1)  # Outline
+                self._queue_character(kneeling_sprite, px, py, "Shani", (px, py - 25), sort_y=py + 128)
+                # Ring in Shani's extended hand (left hand extended forward when kneeling left),
+                # in front of Shani, at mid-height where the hand would be
+                self.overlay_blits.append((self._get_ring_sprite(), (px + 35 - 12, py + 70 - 12)))
             elif self.shani_anim_mgr:
-                self.shani_anim_mgr.draw(surface, int(self.p2_x), int(self.p2_y), scale=2.0)
+                self._queue_character(self.shani_anim_mgr.current_frame(scale=char_scale), px, py, "Shani",
+                                      (px, py - 25), sort_y=py + 128)
             else:
-                pygame.draw.rect(surface, (120, 170, 240), (int(self.p2_x), int(self.p2_y), 96, 128))  # 2× size
-            sl = self.font.render("Shani", True, (10, 10, 10))
-            surface.blit(sl, (int(self.p2_x), int(self.p2_y) - 25))
+                self._queue_character(None, px, py, "Shani", (px, py - 25), sort_y=py + 128,
+                                      placeholder=(pygame.Rect(px, py, 96, 128), (120, 170, 240), False))  # 2× size
+
+        queue.flush(world)
+        camera.present(surface)
+        # Names and the ring stay at full resolution, over the world
+        surface.blits(self.overlay_blits, doreturn=False)
 
         # Debug: Draw collision boxes if DEBUG is True
         if DEBUG:
@@ -816,7 +898,7 @@ class DinnerScene(Scene):
 
     def _get_proposal_rects(self):
         """Return (box_rect, yes_rect, no_rect) for current display size."""
-        w, h = pygame.display.get_surface().get_size()
+        w, h = render_backend.screen_size()
         box = pygame.Rect((w - 520)//2, (h - 220)//2, 520, 220)
         yes_rect = pygame.Rect(box.x + 60, box.y + 140, 160, 48)
         no_rect = pygame.Rect(box.x + 300, box.y + 140, 160, 48)
@@ -2,6 +2,8 @@ import pygame
 import random
 import math
 from ..core.scene import Scene
+from ..core import assets, backgrounds
+from ..core.collage import Collage
 
 
 class DisneyScene(Scene):
@@ -17,6 +19,9 @@ class DisneyScene(Scene):
     FIREWORK_SPAWN_INTERVAL = 0.3
     FIREWORK_PARTICLES = 20
     STAR_COUNT = 105
+    # Twinkling stars and firework particles are drawn from sprites
+    # pre-rendered per alpha bucket of this size
+    ALPHA_BUCKET = 16
     
     # Character positions
     MARIA_START_X_OFFSET = -102
@@ -88,6 +93,13 @@ class DisneyScene(Scene):
         self.hint_fade_direction = 1
         self.star_alphas = {}
         self.kiss_animation_progress = 0
+
+        # Compositor caches (built on first draw)
+        self.visible_stars = None  # [(index, pos, patch rect or None)] for stars not hidden by the castle
+        self.star_sprites = {}  # alpha bucket -> star sprite
+        self.particle_sprites = {}  # (color, alpha bucket) -> particle sprite
+        self.hint_surface = None
+        self.heart_cache = (0, None)  # (size, scaled heart)
         
         # Photo montage (after heart animation)
         self.photos = []
@@ -97,7 +109,13 @@ class DisneyScene(Scene):
         self.photo_display_time = 0.15  # Time each photo stays on screen
         self.photo_fade_time = 0.15  # Fade in/out duration
         self.photo_timer = 0.0
-        self.displayed_photos = []  # List of (photo, position, alpha) for photos on screen
+        self.collage = None  # Collage of the photos on screen, created in start()
+        self.required_assets = [
+            'scenes/disney/castle.png',
+            'scenes/bumble/heart.png',
+            'characters/maria/idle.png',
+            'characters/shani/idle.png',
+        ]
 
     def start(self):
         """Initialize scene resources and state."""
@@ -107,6 +125,9 @@ class DisneyScene(Scene):
         self._initialize_stars()
         self._load_assets()
         self._load_photos()
+        # Screen dimensions; keep photo centres 140px apart and 90px from the edges
+        self.collage = Collage((1024, 768), min_distance=140, margin=90,
+                               fade_time=self.photo_fade_time)
 
     def _reset_state(self):
         """Reset all animation state variables."""
@@ -132,15 +153,13 @@ class DisneyScene(Scene):
 
     def _load_assets(self):
         """Load all image assets."""
-        try:
-            self.castle_image = pygame.image.load("art/scenes/disney/castle.png").convert_alpha()
-        except Exception as e:
-            print(f"Failed to load castle image: {e}")
+        self.castle_image = self.scope.get('scenes/disney/castle.png')
+        if self.castle_image is None:
+            print("Failed to load castle image")
         
-        try:
-            self.heart_image = pygame.image.load("art/scenes/bumble/heart.png").convert_alpha()
-        except Exception as e:
-            print(f"Failed to load heart image: {e}")
+        self.heart_image = self.scope.get('scenes/bumble/heart.png')
+        if self.heart_image is None:
+            print("Failed to load heart image")
         
         # Load character sprites
         self._load_character_sprite("maria", 3, lambda s: setattr(self, 'maria_sprite', s))
@@ -149,36 +168,28 @@ class DisneyScene(Scene):
     def _load_character_sprite(self, name, row, setter):
         """Helper to load a character sprite from spritesheet."""
         try:
-            sheet = pygame.image.load(f"art/characters/{name}/idle.png").convert_alpha()
+            sheet = self.scope.get(f"characters/{name}/idle.png")
             sprite = sheet.subsurface(pygame.Rect(0, row * 64, 64, 64))
-            setter(sprite)
+            # Scaled once here rather than on every draw
+            setter(pygame.transform.scale(sprite, (self.CHAR_SCALE, self.CHAR_SCALE)))
         except Exception as e:
             print(f"Failed to load {name} sprite: {e}")
     
     def _load_photos(self):
         """Load real photos for floating around castle."""
-        import os
-        photo_folder = os.path.join('art', 'photos')
-        
         # Try to load real photos first
         loaded_photos = False
         try:
-            if os.path.isdir(photo_folder):
-                photo_files = [f for f in os.listdir(photo_folder) if f.lower().endswith(('.png', '.jpg', '.jpeg'))]
-                for photo_file in photo_files:
-                    try:
-                        photo_path = os.path.join(photo_folder, photo_file)
-                        photo = pygame.image.load(photo_path).convert_alpha()
-                        # Resize to reasonable size (max 150px on longest side)
-                        w, h = photo.get_size()
-                        scale_factor = min(150 / w, 150 / h)
-                        new_w = int(w * scale_factor)
-                        new_h = int(h * scale_factor)
-                        photo = pygame.transform.scale(photo, (new_w, new_h))
-                        self.photos.append(photo)
-                        loaded_photos = True
-                    except Exception as e:
-                        print(f"Could not load photo {photo_file}: {e}")
+            for photo_file in assets.keys_under('photos'):
+                try:
+                    # Resize to reasonable size (max 150px on longest side)
+                    photo = self.scope.get_fitted(photo_file, (150, 150))
+                    if photo is None:
+                        continue
+                    self.photos.append(photo)
+                    loaded_photos = True
+                except Exception as e:
+                    print(f"Could not load photo {photo_file}: {e}")
         except Exception as e:
             print(f"Could not load photos: {e}")
         
@@ -228,48 +239,8 @@ class DisneyScene(Scene):
         if self.photo_timer >= total_cycle:
             # Add the current photo to the displayed list with a random position
             if self.current_photo_index < len(self.photos):
-                import random
-                # Screen dimensions
-                screen_w, screen_h = 1024, 768
-                
-                # Try to find a position that doesn't overlap too much with existing photos
-                min_distance = 140  # Minimum distance between photo centers
-                max_attempts = 50
-                best_x, best_y = None, None
-                best_min_dist = 0
-                
-                for attempt in range(max_attempts):
-                    x = random.randint(90, screen_w - 90)
-                    y = random.randint(90, screen_h - 90)
-                    
-                    # Calculate minimum distance to any existing photo
-                    if self.displayed_photos:
-                        min_dist = min(
-                            ((x - p['x'])**2 + (y - p['y'])**2)**0.5
-                            for p in self.displayed_photos
-                        )
-                    else:
-                        min_dist = float('inf')
-                    
-                    # If we found a good spot with enough distance, use it
-                    if min_dist >= min_distance:
-                        best_x, best_y = x, y
-                        break
-                    
-                    # Otherwise, keep track of the best position so far
-                    if min_dist > best_min_dist:
-                        best_min_dist = min_dist
-                        best_x, best_y = x, y
-                
-                x, y = best_x, best_y
-                
-                self.displayed_photos.append({
-                    'photo': self.photos[self.current_photo_index],
-                    'x': x,
-                    'y': y,
-                    'alpha': 0,
-                    'timer': 0
-                })
+                # Spread photos out (placement only checks nearby photos)
+                self.collage.add(self.photos[self.current_photo_index])
                 
                 self.current_photo_index += 1
                 if self.current_photo_index >= len(self.photos):
@@ -277,15 +248,8 @@ class DisneyScene(Scene):
             
             self.photo_timer = 0.0
         
-        # Update alpha for all displayed photos
-        for photo_data in self.displayed_photos:
-            photo_data['timer'] += dt
-            if photo_data['timer'] < self.photo_fade_time:
-                # Fade in
-                photo_data['alpha'] = int(255 * (photo_data['timer'] / self.photo_fade_time))
-            else:
-                # Stay at full alpha
-                photo_data['alpha'] = 255
+        # Fade photos in; finished ones are burned into the collage surface
+        self.collage.update(dt)
 
     def _update_stars(self, dt):
         """Update star twinkling animation."""
@@ -383,11 +347,10 @@ class DisneyScene(Scene):
         """Render the scene."""
         w, h = surface.get_size()
         
-        # Draw background
-        surface.fill(self.SKY_COLOR)
-        self._draw_stars(surface)
-        self._draw_ground(surface, w, h)
-        self._draw_castle(surface, w, h)
+        # Draw background: sky, ground and castle are baked into one surface,
+        # the twinkling stars go on top in a single blits() call
+        surface.blit(self._get_backdrop(w, h), (0, 0))
+        self._draw_stars(surface, w, h)
         
         # Draw characters
         char_y = h - self.CHAR_Y_OFFSET
@@ -402,43 +365,72 @@ class DisneyScene(Scene):
     
     def _draw_photos(self, surface):
         """Draw all displayed photos filling the screen."""
-        if not self.displayed_photos:
-            return
-        
-        # Draw each photo at its position with its current alpha
-        for photo_data in self.displayed_photos:
-            if photo_data['alpha'] <= 0:
-                continue
-            
-            photo = photo_data['photo']
-            
-            # Create a copy with alpha applied
-            photo_with_alpha = photo.copy()
-            photo_with_alpha.set_alpha(int(photo_data['alpha']))
-            
-            # Position the photo
-            photo_rect = photo_with_alpha.get_rect(center=(int(photo_data['x']), int(photo_data['y'])))
-            
-            # Draw subtle shadow
-            shadow = pygame.Surface(photo_with_alpha.get_size(), pygame.SRCALPHA)
-            shadow.fill((0, 0, 0, 100))
-            shadow_rect = shadow.get_rect(center=(int(photo_data['x'] + 3), int(photo_data['y'] + 3)))
-            surface.blit(shadow, shadow_rect)
-            
-            # Draw photo
-            surface.blit(photo_with_alpha, photo_rect)
+        # One blit for every photo that has faded in, plus the ones still fading
+        if self.collage:
+            self.collage.draw(surface)
+
+    def _bucket(self, alpha):
+        """Quantize an alpha value to the nearest bucket (255 stays fully opaque)."""
+        step = self.ALPHA_BUCKET
+        return min(255, (int(alpha) + step // 2) // step * step)
 
-    def _draw_stars(self, surface):
-        """Draw twinkling stars."""
+    def _get_star_sprite(self, alpha):
+        """Return the pre-rendered star for an alpha value."""
+        bucket = self._bucket(alpha)
+        sprite = self.star_sprites.get(bucket)
+        if sprite is None:
+            sprite = pygame.Surface((6, 6), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (*self.STAR_COLOR, bucket), (3, 3), 2)
+            self.star_sprites[bucket] = sprite
+        return sprite
+
+    def _draw_stars(self, surface, w, h):
+        """Draw twinkling stars (only the ones not hidden behind the castle/ground)."""
+        foreground = self._get_foreground(w, h)
+        if self.visible_stars is None:
+            self.visible_stars = self._find_visible_stars(foreground)
+        batch = []
+        for i, pos, patch in self.visible_stars:
+            alpha = self.star_alphas.get(i, {}).get('alpha', 255)
+            batch.append((self._get_star_sprite(alpha), pos))
+            if patch is not None:
+                # star peeks out from behind the castle: put its edge back on top
+                batch.append((foreground, patch.topleft, patch))
+        surface.blits(batch, doreturn=False)
+
+    def _find_visible_stars(self, foreground):
+        """Work out which stars show through the foreground layer.
+
+        Returns (index, top-left, patch) for each star; patch is the star's
+        rect when the foreground partly covers it, else None.
+        """
+        visible = []
+        bounds = foreground.get_rect()
         for i, (x, y) in enumerate(self.STAR_POSITIONS):
-            alpha = int(self.star_alphas.get(i, {}).get('alpha', 255))
-            star_surface = pygame.Surface((6, 6), pygame.SRCALPHA)
-            pygame.draw.circle(star_surface, (*self.STAR_COLOR, alpha), (3, 3), 2)
-            surface.blit(star_surface, (x - 3, y - 3))
+            rect = pygame.Rect(x - 3, y - 3, 6, 6).clip(bounds)
+            if not rect:
+                continue
+            alphas = [foreground.get_at((px, py))[3]
+                      for px in range(rect.left, rect.right)
+                      for py in range(rect.top, rect.bottom)]
+            if min(alphas) == 255:
+                continue  # completely behind the castle or ground
+            visible.append((i, (x - 3, y - 3), rect if max(alphas) > 0 else None))
+        return visible
+
+    def _get_foreground(self, w, h):
+        """Return the cached ground + castle layer (transparent above them)."""
+        return backgrounds.backdrop('disney-foreground', (w, h), [
+            (self.GROUND_COLOR, (0, h - 150, w, 150)),
+            lambda layer: self._draw_castle(layer, w, h),
+        ], alpha=True)
 
-    def _draw_ground(self, surface, w, h):
-        """Draw the ground."""
-        pygame.draw.rect(surface, self.GROUND_COLOR, (0, h - 150, w, 150))
+    def _get_backdrop(self, w, h):
+        """Return the cached sky + ground + castle backdrop."""
+        return backgrounds.backdrop('disney-backdrop', (w, h), [
+            self.SKY_COLOR,
+            (self._get_foreground(w, h), (0, 0)),
+        ])
 
     def _draw_castle(self, surface, w, h):
         """Draw the castle background."""
@@ -460,14 +452,12 @@ class DisneyScene(Scene):
         shani_x = w // 2 + self.SHANI_START_X_OFFSET + \
                   (self.SHANI_END_X_OFFSET - self.SHANI_START_X_OFFSET) * self.kiss_animation_progress
         
-        # Draw sprites
+        # Draw sprites (already scaled to CHAR_SCALE)
         if self.maria_sprite:
-            maria_scaled = pygame.transform.scale(self.maria_sprite, (self.CHAR_SCALE, self.CHAR_SCALE))
-            surface.blit(maria_scaled, (maria_x, char_y))
+            surface.blit(self.maria_sprite, (maria_x, char_y))
         
         if self.shani_sprite:
-            shani_scaled = pygame.transform.scale(self.shani_sprite, (self.CHAR_SCALE, self.CHAR_SCALE))
-            surface.blit(shani_scaled, (shani_x, char_y))
+            surface.blit(self.shani_sprite, (shani_x, char_y))
 
     def _draw_title(self, surface):
         """Draw the scene title."""
@@ -484,19 +474,32 @@ class DisneyScene(Scene):
 
     def _draw_hint(self, surface, w, h):
         """Draw the 'Press SPACE to kiss' hint."""
-        hint = self.font.render("Press SPACE to kiss", True, self.HINT_COLOR)
+        if self.hint_surface is None:
+            self.hint_surface = self.font.render("Press SPACE to kiss", True, self.HINT_COLOR)
+        hint = self.hint_surface
         hint.set_alpha(int(self.hint_alpha))
         surface.blit(hint, ((w - hint.get_width()) // 2, h - 70))
 
     def _draw_fireworks(self, surface):
         """Draw firework particles."""
+        batch = []
         for f in self.fireworks:
             alpha = int(255 * (1 - f['t'] / f['max_t']))
             if alpha > 0:
-                particle_surface = pygame.Surface((12, 12), pygame.SRCALPHA)
-                particle_surface.set_alpha(alpha)
-                pygame.draw.circle(particle_surface, f['color'], (6, 6), 6)
-                surface.blit(particle_surface, (int(f['x']) - 6, int(f['y']) - 6))
+                batch.append((self._get_particle_sprite(f['color'], alpha),
+                              (int(f['x']) - 6, int(f['y']) - 6)))
+        surface.blits(batch, doreturn=False)
+
+    def _get_particle_sprite(self, color, alpha):
+        """Return the pre-rendered firework particle for a colour and alpha value."""
+        key = (color, self._bucket(alpha))
+        sprite = self.particle_sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((12, 12), pygame.SRCALPHA)
+            sprite.set_alpha(key[1])
+            pygame.draw.circle(sprite, color, (6, 6), 6)
+            self.particle_sprites[key] = sprite
+        return sprite
 
     def _draw_heart(self, surface, w, char_y):
         """Draw the growing heart."""
@@ -512,7 +515,10 @@ class DisneyScene(Scene):
         # Scale and draw heart
         current_size = int(self.HEART_BASE_SIZE * self.heart_scale)
         if current_size > 1:
-            scaled_heart = pygame.transform.scale(self.heart_image, (current_size, current_size))
+            # Only rescale while the heart is growing
+            if self.heart_cache[0] != current_size:
+                self.heart_cache = (current_size, pygame.transform.scale(self.heart_image, (current_size, current_size)))
+            scaled_heart = self.heart_cache[1]
             heart_x = heart_center_x - current_size // 2
             heart_y = heart_center_y - current_size // 2
             surface.blit(scaled_heart, (heart_x, heart_y))
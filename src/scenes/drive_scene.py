@@ -36,6 +36,7 @@ class DriveScene(Scene):
         
         # Road and scrolling
         self.road_bg = None
+        self.scaled_road = None  # road_bg at ROAD_SCALE, scaled once in start()
         self.road_x = 0
         self.scroll_speed = 70
         self.road_top = 350  # Moved down from 360
@@ -79,6 +80,12 @@ class DriveScene(Scene):
         # Fade out effect
         self.fade_out = False
         self.fade_alpha = 0
+        
+        road_name = 'dayroad.png' if time_of_day == 'day' else 'nightroad.png'
+        self.required_assets = [
+            f'scenes/drive/date_drive/{road_name}',
+            "scenes/drive/date_drive/'90s vehicles.png",
+        ]
 
     def start(self):
         super().start()  # Call parent to handle music
@@ -89,13 +96,8 @@ class DriveScene(Scene):
         self.current_message = None
         self.message_timer = 0.0
         
-        # Load horn sound effect
-        try:
-            self.horn_sound = pygame.mixer.Sound("art/music/drive/horn.mp3")
-            self.horn_sound.set_volume(0.6)
-        except Exception as e:
-            print(f"Failed to load horn sound: {e}")
-            self.horn_sound = None
+        # Horn sound effect (decoded once, shared through the sound bank)
+        self.horn_sound = self.scope.sound("art/music/drive/horn.mp3", volume=0.6)
         self.message_cooldown = 0.0
         
         # Load the road background based on time of day
@@ -103,13 +105,20 @@ class DriveScene(Scene):
             road_path = os.path.join('art', 'scenes', 'drive', 'date_drive', 'dayroad.png')
         else:
             road_path = os.path.join('art', 'scenes', 'drive', 'date_drive', 'nightroad.png')
-        self.road_bg = pygame.image.load(road_path).convert_alpha()
+        self.road_bg = self.scope.get(road_path)
+        self.scaled_road = None
+        if self.road_bg:
+            # Scale road once
+            self.scaled_road = pygame.transform.scale(
+                self.road_bg,
+                (int(self.road_bg.get_width() * self.ROAD_SCALE),
+                 int(self.road_bg.get_height() * self.ROAD_SCALE)))
         
         # Load car sprites using the car_sprites loader
         vehicles_path = os.path.join('art', 'scenes', 'drive', 'date_drive', "'90s vehicles.png")
         
         # Load all car sprites
-        self.all_cars = load_car_sprites(vehicles_path, expected_cols=4, 
+        self.all_cars = load_car_sprites(self.scope.get(vehicles_path), expected_cols=4, 
                                         directions=["left", "right", "front", "back"],
                                         split_first_col=True)
         
@@ -359,17 +368,15 @@ class DriveScene(Scene):
         surface.fill((0, 0, 0))
         
         # Draw the scrolling road
-        if self.road_bg:
+        if self.scaled_road:
             tile_scaled = int(16 * self.ROAD_SCALE)
             
             # Calculate scroll offset
             scroll_offset_pixels = int(self.road_x)
             scroll_offset_tiles = scroll_offset_pixels / 16
             
-            # Scale road once
-            scaled_width = int(self.road_bg.get_width() * self.ROAD_SCALE)
-            scaled_height = int(self.road_bg.get_height() * self.ROAD_SCALE)
-            scaled_road = pygame.transform.scale(self.road_bg, (scaled_width, scaled_height))
+            scaled_road = self.scaled_road
+            scaled_width = scaled_road.get_width()
             
             # Draw two copies for seamless scrolling loop
             offset_x = int(scroll_offset_tiles * tile_scaled) % scaled_width
@@ -409,7 +416,4 @@ class DriveScene(Scene):
         
         # Draw fade out overlay
         if self.fade_out and self.fade_alpha > 0:
-            fade_surface = pygame.Surface(surface.get_size())
-            fade_surface.fill((0, 0, 0))
-            fade_surface.set_alpha(int(self.fade_alpha))
-            surface.blit(fade_surface, (0, 0))
+            self.fade(surface, self.fade_alpha)
@@ -1,12 +1,23 @@
 import pygame
-import os
 from ..core.scene import Scene
+from ..core import assets, animation_sets, backgrounds, render_backend
+from ..core.animation_scheduler import AnimationScheduler
 from ..core.assets import get_animations
+from ..core.rotation_cache import RotationCache
 from ..utils.lpc_demo import AnimationManager, Animation
 
 
 class IntroScene(Scene):
     """Opening scene with story text and characters walking across screen."""
+
+    # Dark blue at top to lighter blue at bottom
+    GRADIENT_STOPS = ((0.0, (30, 50, 100)), (1.0, (100, 170, 255)))
+
+    # Montage photos are rotated in steps of this many degrees (cached)
+    PHOTO_ROTATION_STEP = 1.0
+    PHOTO_CACHE_BYTES = 48 * 1024 * 1024
+
+    CHARACTER_SCALE = 2.5
     
     def __init__(self, manager):
         super().__init__(manager)
@@ -26,6 +37,10 @@ class IntroScene(Scene):
         self.line_display_time = 2.5  # seconds per line
         self.font_title = None
         self.font_text = None
+        self.debug_font = None
+        self.line_surfaces = {}  # story line index -> rendered text
+        self.hint_surface = None
+        self._surface_canvas = None  # canvas for draw(surface) callers
         
         # Character animation
         self.shani_anim = None
@@ -36,6 +51,7 @@ class IntroScene(Scene):
         self.maria_y = 520
         self.walk_speed = 80
         self.characters_walking = True
+        self.animations = None  # AnimationScheduler, created in start()
         
         # Photo montage
         self.montage_active = False
@@ -43,6 +59,7 @@ class IntroScene(Scene):
         self.montage_duration = 8.0  # Total time for montage
         self.photos = []
         self.photo_data = []  # List of (photo, x, y, scale, rotation, velocity)
+        self.photo_rotations = None  # RotationCache, created in start()
         
         # Timing
         self.intro_complete = False
@@ -50,7 +67,7 @@ class IntroScene(Scene):
         self.fade_duration = 1.0
         
     def start(self):
-        """Initialize the intro scene."""
+        """Initialize the intro scene (a generator: photos load over several frames)."""
         super().start()
         
         # Load fonts
@@ -60,35 +77,40 @@ class IntroScene(Scene):
         except Exception:
             self.font_title = pygame.font.SysFont('Arial', 72)
             self.font_text = pygame.font.SysFont('Arial', 48)
+        self.debug_font = pygame.font.Font(None, 24)
         
-        # Load character animations
+        # Load character animations; they only tick while drawn on screen
         self._setup_characters()
+        self.animations = AnimationScheduler(view=pygame.Rect((0, 0), render_backend.screen_size()))
+        self.animations.add(self.shani_anim, rect=lambda: self._character_rect(self.shani_x, self.shani_y))
+        self.animations.add(self.maria_anim, rect=lambda: self._character_rect(self.maria_x, self.maria_y))
         
-        # Load photos for montage
-        self._load_photos()
+        # Load photos for montage, one per loading step
+        yield from self._load_photos()
+        # Rotations are prepared a few degrees ahead on a worker thread
+        self.photo_rotations = RotationCache(step=self.PHOTO_ROTATION_STEP,
+                                             max_bytes=self.PHOTO_CACHE_BYTES,
+                                             background=True)
+
+    def end(self):
+        super().end()
+        if self.photo_rotations:
+            self.photo_rotations.close()
         
     def _setup_characters(self):
         """Load and setup character animations."""
         # Setup Shani
         try:
-            shani_anims = get_animations('shani', size=(64, 64))
+            shani_anims = get_animations('shani', size=(64, 64), only=('idle', 'walk'))
             self.shani_anim = AnimationManager()
-            for name, frames in shani_anims.items():
-                if frames and len(frames) > 0:
-                    # Filter out transparent frames for walk animations
-                    if 'walk' in name:
-                        visible_frames = []
-                        for frame in frames:
-                            try:
-                                mask = pygame.mask.from_surface(frame)
-                                if mask.count() > 0:
-                                    visible_frames.append(frame)
-                            except Exception:
-                                visible_frames.append(frame)
-                        frames = visible_frames if visible_frames else frames
-                    
+            for name in shani_anims:
+                # Filter out transparent frames for walk animations
+                anim_set = animation_sets.acquire(
+                    self, 'shani', name, size=(64, 64),
+                    filter=animation_sets.VISIBLE if 'walk' in name else None)
+                if anim_set is not None:
                     speed = 150 if 'walk' in name else 200
-                    self.shani_anim.add(name, Animation(frames, speed_ms=speed, loop=True))
+                    self.shani_anim.add(name, Animation.from_set(anim_set, speed_ms=speed, loop=True))
             
             if 'walk_right' in self.shani_anim.animations:
                 self.shani_anim.play('walk_right')
@@ -99,24 +121,16 @@ class IntroScene(Scene):
             
         # Setup Maria
         try:
-            maria_anims = get_animations('maria', size=(64, 64))
+            maria_anims = get_animations('maria', size=(64, 64), only=('idle', 'walk'))
             self.maria_anim = AnimationManager()
-            for name, frames in maria_anims.items():
-                if frames and len(frames) > 0:
-                    # Filter out transparent frames for walk animations
-                    if 'walk' in name:
-                        visible_frames = []
-                        for frame in frames:
-                            try:
-                                mask = pygame.mask.from_surface(frame)
-                                if mask.count() > 0:
-                                    visible_frames.append(frame)
-                            except Exception:
-                                visible_frames.append(frame)
-                        frames = visible_frames if visible_frames else frames
-                    
+            for name in maria_anims:
+                # Filter out transparent frames for walk animations
+                anim_set = animation_sets.acquire(
+                    self, 'maria', name, size=(64, 64),
+                    filter=animation_sets.VISIBLE if 'walk' in name else None)
+                if anim_set is not None:
                     speed = 150 if 'walk' in name else 200
-                    self.maria_anim.add(name, Animation(frames, speed_ms=speed, loop=True))
+                    self.maria_anim.add(name, Animation.from_set(anim_set, speed_ms=speed, loop=True))
             
             if 'walk_right' in self.maria_anim.animations:
                 self.maria_anim.play('walk_right')
@@ -126,29 +140,24 @@ class IntroScene(Scene):
             print(f"Could not load Maria animations: {e}")
     
     def _load_photos(self):
-        """Load real photos for the montage."""
+        """Load real photos for the montage, yielding the fraction done after each one."""
         import random
-        photo_folder = os.path.join('art', 'photos')
         
         # Try to load real photos first
         loaded_photos = False
         try:
-            if os.path.isdir(photo_folder):
-                photo_files = [f for f in os.listdir(photo_folder) if f.lower().endswith(('.png', '.jpg', '.jpeg'))]
-                for photo_file in photo_files:
-                    try:
-                        photo_path = os.path.join(photo_folder, photo_file)
-                        photo = pygame.image.load(photo_path).convert_alpha()
-                        # Resize to reasonable size (max 200px on longest side)
-                        w, h = photo.get_size()
-                        scale_factor = min(200 / w, 200 / h)
-                        new_w = int(w * scale_factor)
-                        new_h = int(h * scale_factor)
-                        photo = pygame.transform.scale(photo, (new_w, new_h))
-                        self.photos.append(photo)
-                        loaded_photos = True
-                    except Exception as e:
-                        print(f"Could not load photo {photo_file}: {e}")
+            photo_files = assets.keys_under('photos')
+            for i, photo_file in enumerate(photo_files):
+                yield i / len(photo_files)
+                try:
+                    # Resize to reasonable size (max 200px on longest side)
+                    photo = self.scope.get_fitted(photo_file, (200, 200))
+                    if photo is None:
+                        continue
+                    self.photos.append(photo)
+                    loaded_photos = True
+                except Exception as e:
+                    print(f"Could not load photo {photo_file}: {e}")
         except Exception as e:
             print(f"Could not load photos: {e}")
         
@@ -225,11 +234,8 @@ class IntroScene(Scene):
                 if self.maria_anim:
                     self.maria_anim.play('idle_right')
         
-        # Always update animations (whether walking or idle)
-        if self.shani_anim:
-            self.shani_anim.update(dt * 1000)
-        if self.maria_anim:
-            self.maria_anim.update(dt * 1000)
+        # Update animations (whether walking or idle) of the characters on screen
+        self.animations.update(dt * 1000)
         
         # Check if text is complete, then start montage
         if self.current_line_index >= len(self.story_lines) and not self.characters_walking and not self.montage_active:
@@ -267,90 +273,105 @@ class IntroScene(Scene):
     
     def draw(self, surface: pygame.Surface):
         """Draw the intro scene."""
-        # Blue gradient background (dark to light)
-        width, height = surface.get_size()
-        for y in range(height):
-            # Dark blue at top to lighter blue at bottom
-            r = int(30 + (y / height) * 70)
-            g = int(50 + (y / height) * 120)
-            b = int(100 + (y / height) * 155)
-            pygame.draw.line(surface, (r, g, b), (0, y), (width, y))
+        if self._surface_canvas is None or self._surface_canvas.target is not surface:
+            self._surface_canvas = render_backend.SurfaceCanvas(surface)
+        self.draw_canvas(self._surface_canvas)
+
+    def _line_surface(self, i: int) -> pygame.Surface:
+        """Rendered story line i (cached, the text never changes)."""
+        text_surface = self.line_surfaces.get(i)
+        if text_surface is None:
+            # Use title font for first line, regular font for others
+            if i == 0:
+                text_surface = self.font_title.render(self.story_lines[i], True, (255, 220, 150))  # Golden
+            else:
+                text_surface = self.font_text.render(self.story_lines[i], True, (255, 255, 255))
+            self.line_surfaces[i] = text_surface
+        return text_surface
+
+    def _character_rect(self, x: float, y: float):
+        """Screen rect of a character at (x, y), or None while it isn't drawn."""
+        if self.montage_active or x <= -100:
+            return None
+        size = int(64 * self.CHARACTER_SCALE)
+        return pygame.Rect(int(x), int(y), size, size)
+
+    def _draw_character(self, canvas, anim: AnimationManager, x: int, y: int):
+        # the renderer scales the 64px frame itself; in software use the cached scaled frame
+        scale = self.CHARACTER_SCALE
+        frame = anim.current_frame(1.0 if canvas.accelerated else scale)
+        if frame:
+            canvas.blit(frame, (x, y), scale=scale if canvas.accelerated else 1.0)
+
+    def draw_canvas(self, canvas: render_backend.Canvas):
+        """Draw the intro scene through a render backend canvas.
+
+        Photos are scaled, rotated and faded by canvas.blit(), so with the
+        SDL2 renderer the montage costs no CPU transforms at all.
+        """
+        # Blue gradient background (dark to light), generated once per size
+        width, height = canvas.get_size()
+        canvas.blit(backgrounds.gradient((width, height), self.GRADIENT_STOPS), (0, 0))
         
         # Draw text
         y_offset = 100
         for i, line in enumerate(self.story_lines):
             if i > self.current_line_index:
                 break
-                
-            # Use title font for first line, regular font for others
-            if i == 0:
-                font = self.font_title
-                color = (255, 220, 150)  # Golden color for title
-            else:
-                font = self.font_text
-                color = (255, 255, 255)
-            
-            # Fade in effect for current line
-            if i == self.current_line_index:
-                alpha = min(255, int((self.line_timer / 0.5) * 255))
-                color = (color[0], color[1], color[2])
             
             if line:  # Skip empty lines for rendering but count them
-                text_surface = font.render(line, True, color)
+                text_surface = self._line_surface(i)
                 text_rect = text_surface.get_rect(center=(width // 2, y_offset))
-                surface.blit(text_surface, text_rect)
+                canvas.blit(text_surface, text_rect.topleft)
             
             y_offset += 60 if i == 0 else 50
         
         # Draw characters (unless montage is active)
         if not self.montage_active:
             if self.shani_anim and self.shani_x > -100:
-                self.shani_anim.draw(surface, int(self.shani_x), int(self.shani_y), scale=2.5)
+                self._draw_character(canvas, self.shani_anim, int(self.shani_x), int(self.shani_y))
             
             if self.maria_anim and self.maria_x > -100:
-                self.maria_anim.draw(surface, int(self.maria_x), int(self.maria_y), scale=2.5)
+                self._draw_character(canvas, self.maria_anim, int(self.maria_x), int(self.maria_y))
         
         # Draw photo montage
         if self.montage_active:
             # Debug: Draw a large red rectangle to show montage is active
-            debug_rect = pygame.Rect(10, 10, 200, 50)
-            pygame.draw.rect(surface, (255, 0, 0), debug_rect)
-            debug_font = pygame.font.Font(None, 24)
-            debug_text = debug_font.render(f"MONTAGE: {len(self.photos)} photos", True, (255, 255, 255))
-            surface.blit(debug_text, (15, 20))
+            canvas.fill((255, 0, 0), pygame.Rect(10, 10, 200, 50))
             
             for i, (photo, data) in enumerate(zip(self.photos, self.photo_data)):
-                # Apply rotation and scale
-                scaled_photo = pygame.transform.rotozoom(photo, data['rotation'], data['scale'])
-                photo_rect = scaled_photo.get_rect(center=(int(data['x']), int(data['y'])))
-                
-                # Add subtle shadow
-                shadow = pygame.Surface(scaled_photo.get_size(), pygame.SRCALPHA)
-                shadow.fill((0, 0, 0, 50))
-                shadow_rect = shadow.get_rect(center=(int(data['x'] + 5), int(data['y'] + 5)))
-                surface.blit(shadow, shadow_rect)
-                
-                # Draw photo
-                surface.blit(scaled_photo, photo_rect)
+                center = (int(data['x']), int(data['y']))
+                # Add subtle shadow behind the rotated photo's bounds
+                shadow_size = render_backend.transformed_size(photo.get_size(), data['scale'],
+                                                              self.photo_rotations.quantize(data['rotation']))
+                shadow_rect = pygame.Rect((0, 0), shadow_size)
+                shadow_rect.center = (center[0] + 5, center[1] + 5)
+                canvas.fill((0, 0, 0, 50), shadow_rect)
                 
+                # Draw photo, rotated and scaled (cached per degree on the Surface backend)
+                canvas.blit(photo, center, scale=data['scale'], angle=data['rotation'], center=True,
+                            cache=self.photo_rotations, key=i, spin=data['rotation_speed'])
+            
+            # Debug text on top, in one software layer
+            debug_surface = canvas.surface()
+            debug_font = self.debug_font
+            debug_text = debug_font.render(f"MONTAGE: {len(self.photos)} photos", True, (255, 255, 255))
+            debug_surface.blit(debug_text, (15, 20))
+            for i, data in enumerate(self.photo_data[:len(self.photos)]):
                 # Debug: show position
                 pos_text = debug_font.render(f"Photo {i}: ({int(data['x'])}, {int(data['y'])})", True, (255, 255, 0))
-                surface.blit(pos_text, (10, 70 + i * 20))
+                debug_surface.blit(pos_text, (10, 70 + i * 20))
         
         # Draw "Press SPACE to continue" hint
         if self.current_line_index >= len(self.story_lines) - 1:
-            hint_font = pygame.font.Font(None, 32)
-            hint_text = hint_font.render("Press SPACE to continue", True, (200, 200, 200))
-            hint_rect = hint_text.get_rect(center=(width // 2, height - 50))
+            if self.hint_surface is None:
+                self.hint_surface = pygame.font.Font(None, 32).render("Press SPACE to continue", True, (200, 200, 200))
+            hint_rect = self.hint_surface.get_rect(center=(width // 2, height - 50))
             # Pulse effect
             alpha = int(128 + 127 * abs(pygame.time.get_ticks() % 2000 - 1000) / 1000)
-            hint_text.set_alpha(alpha)
-            surface.blit(hint_text, hint_rect)
+            canvas.blit(self.hint_surface, hint_rect.topleft, alpha=alpha)
         
         # Fade out effect at the end
         if self.fade_timer > 0:
             fade_alpha = min(255, int((self.fade_timer / self.fade_duration) * 255))
-            fade_surface = pygame.Surface((width, height))
-            fade_surface.fill((0, 0, 0))
-            fade_surface.set_alpha(fade_alpha)
-            surface.blit(fade_surface, (0, 0))
+            canvas.fill((0, 0, 0, fade_alpha))
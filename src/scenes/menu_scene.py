@@ -1,6 +1,8 @@
+import math
 import pygame
 import importlib
 from ..core.scene import Scene
+from ..core import render_backend
 
 
 class MenuScene(Scene):
@@ -40,7 +42,7 @@ class MenuScene(Scene):
                     self._start_fade(idx)
         elif event.type == pygame.MOUSEBUTTONDOWN:
             mx, my = event.pos
-            w, h = pygame.display.get_surface().get_size()
+            w, h = render_backend.screen_size()
             start_y = 120
             for i, opt in enumerate(self.options):
                 rect = pygame.Rect(120, start_y + i * 56, w - 240, 48)
@@ -72,6 +74,10 @@ class MenuScene(Scene):
                 if self.next_scene_idx is not None:
                     self._goto(self.next_scene_idx)
 
+    def idle_time(self) -> float:
+        # the menu only changes when an item is picked
+        return 0.0 if self.fade_out else math.inf
+
     def draw(self, surface: pygame.Surface):
         surface.fill((18, 22, 30))
         w, h = surface.get_size()
@@ -88,7 +94,4 @@ class MenuScene(Scene):
         
         # Draw fade out overlay
         if self.fade_out and self.fade_alpha > 0:
-            fade_surface = pygame.Surface(surface.get_size())
-            fade_surface.fill((0, 0, 0))
-            fade_surface.set_alpha(int(self.fade_alpha))
-            surface.blit(fade_surface, (0, 0))
+            self.fade(surface, self.fade_alpha)
@@ -59,6 +59,12 @@ class TransitionScene(Scene):
             if self.manager and self.next_scene_class:
                 self.manager.go_to(self.next_scene_class(self.manager))
 
+    def idle_time(self) -> float:
+        # still typing or fading in; otherwise nothing moves until the fade out starts
+        if self.char_index < len(self.message) or self.fade_in_alpha > 0:
+            return 0.0
+        return max(0.0, self.duration - self.fade_out_duration - self.timer)
+
     def draw(self, surface: pygame.Surface):
         surface.fill((20, 20, 30))
         w, h = surface.get_size()
@@ -76,14 +82,8 @@ class TransitionScene(Scene):
         
         # Draw fade in overlay
         if self.fade_in_alpha > 0:
-            fade_surface = pygame.Surface(surface.get_size())
-            fade_surface.fill((0, 0, 0))
-            fade_surface.set_alpha(int(self.fade_in_alpha))
-            surface.blit(fade_surface, (0, 0))
+            self.fade(surface, self.fade_in_alpha)
         
         # Draw fade out overlay
         if self.fade_out_alpha > 0:
-            fade_surface = pygame.Surface(surface.get_size())
-            fade_surface.fill((0, 0, 0))
-            fade_surface.set_alpha(int(self.fade_out_alpha))
-            surface.blit(fade_surface, (0, 0))
+            self.fade(surface, self.fade_out_alpha)
@@ -9,6 +9,7 @@ from .tilemap import (
 )
 from .car_sprites import load_car_sprites
 from .lpc_demo import Animation, AnimationManager, IDLE_SPEED, WALK_SPEED, SIT_SPEED
+from .navigation import NavGrid, Navigator, Walker
 
 __all__ = [
     'load_dinner_tilemap',
@@ -22,4 +23,7 @@ __all__ = [
     'IDLE_SPEED',
     'WALK_SPEED',
     'SIT_SPEED',
+    'NavGrid',
+    'Navigator',
+    'Walker',
 ]
@@ -103,7 +103,7 @@ def detect_columns_rows_by_alpha(surface, expected_cols=4, min_nontransparent_pi
 
 
 def trim_surface_alpha(surface):
-    """Return a new Surface trimmed to bounding box of non-transparent pixels."""
+    """Return a subsurface view trimmed to bounding box of non-transparent pixels."""
     w, h = surface.get_size()
     # try fast surfarray method
     try:
@@ -119,7 +119,7 @@ def trim_surface_alpha(surface):
             return surface  # nothing non-transparent
         x0, x1 = x_ranges[0]
         y0, y1 = y_ranges[0]
-        return surface.subsurface(pygame.Rect(x0, y0, x1 - x0, y1 - y0)).copy()
+        return surface.subsurface(pygame.Rect(x0, y0, x1 - x0, y1 - y0))
     except Exception:
         # Fallback: manual pixel scan
         left, right, top, bottom = w, 0, h, 0
@@ -134,7 +134,7 @@ def trim_surface_alpha(surface):
                     bottom = max(bottom, y)
         if not found:
             return surface
-        return surface.subsurface(pygame.Rect(left, top, right - left + 1, bottom - top + 1)).copy()
+        return surface.subsurface(pygame.Rect(left, top, right - left + 1, bottom - top + 1))
 
 
 def load_car_sprites(path, expected_cols=4, directions=None, split_first_col=False):
@@ -142,15 +142,19 @@ def load_car_sprites(path, expected_cols=4, directions=None, split_first_col=Fal
     Load image and slice into sprites using alpha-detection.
     
     Args:
-        path (str): Path to the sprite sheet image
+        path (str): Path to the sprite sheet image, or an already loaded Surface
         expected_cols (int): Number of columns (directions per car). Default is 4.
         directions (list): List of direction names. If None, uses ["left", "right", "front", "back"]
         split_first_col (bool): If True, split the first detected column into 2 separate sprites (left/right)
         
     Returns:
-        dict: Dictionary mapping row_index -> {direction: surface}
+        dict: Dictionary mapping row_index -> {direction: surface}. The surfaces
+        are subsurface views of the sheet (scale or copy them before drawing on them).
     """
-    sheet = pygame.image.load(path).convert_alpha()
+    if isinstance(path, pygame.Surface):
+        sheet = path
+    else:
+        sheet = pygame.image.load(path).convert_alpha()
     x_ranges, y_ranges = detect_columns_rows_by_alpha(sheet, expected_cols=expected_cols)
 
     if not x_ranges or not y_ranges:
@@ -175,7 +179,7 @@ def load_car_sprites(path, expected_cols=4, directions=None, split_first_col=Fal
         sprites[row_idx] = {}
         for col_idx, (x0, x1) in enumerate(x_ranges):
             rect = pygame.Rect(x0, y0, x1 - x0, y1 - y0)
-            sub = sheet.subsurface(rect).copy()
+            sub = sheet.subsurface(rect)
 
             # Trim transparent border inside that rect (so each sprite is tightly cropped)
             trimmed = trim_surface_alpha(sub)
@@ -185,7 +189,7 @@ def load_car_sprites(path, expected_cols=4, directions=None, split_first_col=Fal
             if dir_name in ["left", "right"]:
                 current_h = trimmed.get_height()
                 if current_h > 33:
-                    cropped = trimmed.subsurface(pygame.Rect(0, 0, trimmed.get_width(), 33)).copy()
+                    cropped = trimmed.subsurface(pygame.Rect(0, 0, trimmed.get_width(), 33))
                     trimmed = cropped
             
             sprites[row_idx][dir_name] = trimmed
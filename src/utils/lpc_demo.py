@@ -1,7 +1,14 @@
 import pygame
 import sys
 import os
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
+
+try:
+    from ..core.animation_sets import AnimationSet
+except ImportError:
+    # run as a script (python src/utils/lpc_demo.py): import through the project root
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    from src.core.animation_sets import AnimationSet
 
 # --- CONSTANTS ---
 FRAME_WIDTH = 64
@@ -24,12 +31,21 @@ WINDOW_H = 600
 
 # --- SPRITESHEET HELPER ---
 class SpriteSheet:
-    def __init__(self, path: str):
+    """Sprite sheet kept in display format.
+
+    With views=True (the default) image_at returns subsurfaces sharing the
+    sheet's pixels; pass views=False to get independent copies that can be
+    drawn onto.
+    """
+    def __init__(self, path: str, views: bool = True):
         self.path = path
+        self.views = views
         self.sheet = pygame.image.load(path).convert_alpha()
 
     def image_at(self, rect: Tuple[int,int,int,int]) -> pygame.Surface:
         x,y,w,h = rect
+        if self.views and self.sheet.get_rect().contains(pygame.Rect(x,y,w,h)):
+            return self.sheet.subsurface((x,y,w,h))
         surf = pygame.Surface((w,h), pygame.SRCALPHA, 32)
         surf.blit(self.sheet, (0,0), (x,y,w,h))
         return surf
@@ -43,8 +59,13 @@ class SpriteSheet:
 
 # --- ANIMATION ---
 class Animation:
-    def __init__(self, frames: List[pygame.Surface], speed_ms: int = 100, loop: bool = True):
-        self.frames = frames
+    def __init__(self, frames: List[pygame.Surface], speed_ms: int = 100, loop: bool = True,
+                 anim_set: AnimationSet = None):
+        # frames, per-frame visibility and scaled variants, shared with other
+        # animations when built on an animation_sets set
+        self.set = anim_set if anim_set is not None else AnimationSet(frames)
+        self.frames = self.set.frames
+        self.visible = self.set.visible
         self.speed = speed_ms
         self.loop = loop
         self.time = 0
@@ -54,20 +75,15 @@ class Animation:
         # last visible frame seen while the animation is playing
         self.last_visible_index = None
 
-        try:
-            for i in range(len(frames)-1, -1, -1):
-                f = frames[i]
-                try:
-                    m = pygame.mask.from_surface(f)
-                    if m.count() > 0:
-                        self.visible_last_index = i
-                        break
-                except Exception:
-                    # fallback: assume frame visible
-                    self.visible_last_index = i
-                    break
-        except Exception:
-            self.visible_last_index = max(0, len(frames)-1)
+        for i in range(len(frames)-1, -1, -1):
+            if self.visible[i]:
+                self.visible_last_index = i
+                break
+
+    @classmethod
+    def from_set(cls, anim_set, speed_ms: int = 100, loop: bool = True) -> 'Animation':
+        """Build an Animation on a shared set (frames, visibility and scaled variants)."""
+        return cls(anim_set.frames, speed_ms=speed_ms, loop=loop, anim_set=anim_set)
 
     def reset(self):
         self.time = 0
@@ -78,8 +94,13 @@ class Animation:
         else:
             self.last_visible_index = None
 
+    @property
+    def held(self) -> bool:
+        """True once a non-looping animation sits on its final frame (update does nothing)."""
+        return len(self.frames) <= 1 or (not self.loop and self.index >= len(self.frames) - 1)
+
     def update(self, dt_ms: int):
-        if len(self.frames) <= 1:
+        if self.held:
             return
         self.time += dt_ms
         while self.time >= self.speed:
@@ -91,49 +112,47 @@ class Animation:
                 else:
                     self.index = len(self.frames) - 1
         # update last_visible_index as we progress
-        try:
-            f = self.frames[self.index]
-            m = pygame.mask.from_surface(f)
-            if m.count() > 0:
-                self.last_visible_index = self.index
-        except Exception:
-            # if mask fails, be conservative and set last_visible_index
+        if self.visible[self.index]:
             self.last_visible_index = self.index
 
-    def get_frame(self) -> pygame.Surface:
+    def frame_index(self) -> int:
+        """Index of the frame to show (None if there are no frames)."""
         if not self.frames:
             return None
         # Prefer the current index. If that frame is fully transparent, fall back
         # to the most recently seen visible frame (cached in last_visible_index),
         # then to visible_last_index, then scan backward as a final fallback.
-        frame = self.frames[self.index]
-        try:
-            m = pygame.mask.from_surface(frame)
-            if m.count() > 0:
-                return frame
-        except Exception:
-            return frame
+        if self.visible[self.index]:
+            return self.index
         # If we have a cached recently visible frame, use it
-        idx = getattr(self, 'last_visible_index', None)
+        idx = self.last_visible_index
         if idx is not None and 0 <= idx < len(self.frames):
-            return self.frames[idx]
+            return idx
 
         # fallback to scanning backwards for a visible frame
         for i in range(self.index - 1, -1, -1):
-            f = self.frames[i]
-            try:
-                m = pygame.mask.from_surface(f)
-                if m.count() > 0:
-                    return f
-            except Exception:
-                return f
+            if self.visible[i]:
+                return i
 
         # as a last resort, try visible_last_index if set
-        idx = getattr(self, 'visible_last_index', None)
+        idx = self.visible_last_index
         if idx is not None and 0 <= idx < len(self.frames):
-            return self.frames[idx]
+            return idx
+
+        return self.index
+
+    def get_frame(self) -> pygame.Surface:
+        idx = self.frame_index()
+        if idx is None:
+            return None
+        return self.frames[idx]
 
-        return frame
+    def get_scaled_frame(self, scale: float) -> pygame.Surface:
+        """Return the current frame scaled by scale, reusing cached variants."""
+        idx = self.frame_index()
+        if idx is None:
+            return None
+        return self.set.scaled_frame(idx, scale)
 
 # --- ANIMATION MANAGER ---
 class AnimationManager:
@@ -169,12 +188,7 @@ class AnimationManager:
         # verify that chosen idx is actually visible; if not, scan backwards
         chosen = None
         for i in range(idx, -1, -1):
-            try:
-                m = pygame.mask.from_surface(anim.frames[i])
-                if m.count() > 0:
-                    chosen = i
-                    break
-            except Exception:
+            if anim.visible[i]:
                 chosen = i
                 break
 
@@ -184,19 +198,30 @@ class AnimationManager:
         anim.index = chosen
         anim.time = 0
 
+    @property
+    def sleeping(self) -> bool:
+        """True while nothing would change on update (no animation, or one holding its last frame).
+
+        play() of another animation resets it and so wakes the manager.
+        """
+        anim = self.animations.get(self.current)
+        return anim is None or anim.held
+
     def update(self, dt_ms: int):
-        if self.current and self.current in self.animations:
-            self.animations[self.current].update(dt_ms)
+        anim = self.animations.get(self.current)
+        if anim is not None and not anim.held:
+            anim.update(dt_ms)
 
-    def draw(self, surface: pygame.Surface, x:int, y:int, scale:float=1.0):
+    def current_frame(self, scale: float = 1.0) -> Optional[pygame.Surface]:
+        """The frame to draw now, scaled (None if nothing is playing)."""
         if not self.current:
-            return
-        frame = self.animations[self.current].get_frame()
+            return None
+        # scaled frames are cached on the animation (shared through its set)
+        return self.animations[self.current].get_scaled_frame(scale)
+
+    def draw(self, surface: pygame.Surface, x:int, y:int, scale:float=1.0):
+        frame = self.current_frame(scale)
         if frame:
-            if scale != 1.0:
-                new_width = int(frame.get_width() * scale)
-                new_height = int(frame.get_height() * scale)
-                frame = pygame.transform.scale(frame, (new_width, new_height))
             surface.blit(frame, (x, y))
 
 # --- PLAYER ---
@@ -0,0 +1,387 @@
+"""Grid A* navigation for scripted character walks.
+
+ApartmentScene used to walk characters with hand-written substep state
+machines (left then down; up to y=350, right, then down), which break as
+soon as the layout or the cast changes. Here a scene bakes its collision
+rects into a walkability grid once and asks for walks:
+
+    grid = NavGrid(bounds, collision_rects, cell_size=16, footprint=(40, 0, 48, 128))
+    navigator = Navigator(grid)
+    shani = Walker(self.shani_pos, self.shani_anim)
+    navigator.walk_to(shani, (230, 624), speed=200, on_arrive=self._sit_down)
+    ...
+    navigator.update(dt)   # every frame
+
+Positions are the characters' draw positions (sprite top-left) in view
+coordinates; the footprint is the body rect relative to that position, so
+the grid marks where a character can *stand*, not where pixels are free.
+
+- A* runs 8-connected without cutting corners, with an octile heuristic
+- searches advance a limited number of node expansions at a time, within
+  a per-frame millisecond budget, so many walkers can path at once
+- found paths are cached per (start cell, goal cell) and string-pulled:
+  waypoints with a clear straight line between them are dropped
+- a walk whose goal is blocked ends at the nearest standable cell and then
+  steps straight onto the exact target (chairs sit inside furniture)
+"""
+
+import heapq
+import math
+import time
+import pygame
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+Cell = Tuple[int, int]
+Point = Tuple[float, float]
+
+DIAGONAL = math.sqrt(2)
+# (dx, dy, cost)
+NEIGHBOURS = ((1, 0, 1.0), (-1, 0, 1.0), (0, 1, 1.0), (0, -1, 1.0),
+              (1, 1, DIAGONAL), (1, -1, DIAGONAL), (-1, 1, DIAGONAL), (-1, -1, DIAGONAL))
+
+# paths kept by a Navigator
+PATH_CACHE_SIZE = 64
+# node expansions between budget checks
+EXPANSIONS_PER_STEP = 64
+# how far (in cells) to look for a standable cell near a blocked start/goal
+NEAREST_RADIUS = 12
+# a walker is on a waypoint when closer than this (pixels)
+ARRIVE_DISTANCE = 1.0
+
+
+class NavGrid:
+    """Where a character of one footprint can stand, baked from blocker rects."""
+
+    def __init__(self, bounds: pygame.Rect, blockers: Iterable[pygame.Rect], cell_size: int = 16,
+                 footprint: Tuple[int, int, int, int] = (0, 0, 1, 1)):
+        """
+        Args:
+            bounds: area the body has to stay inside (view coordinates)
+            blockers: collision rects (view coordinates)
+            cell_size: grid resolution in pixels
+            footprint: body rect relative to a position, (dx, dy, w, h)
+        """
+        self.bounds = pygame.Rect(bounds)
+        self.cell_size = cell_size
+        self.footprint = pygame.Rect(footprint)
+        # position of cell (0, 0): the body in the bounds' top-left corner
+        self.origin = (self.bounds.x - self.footprint.x, self.bounds.y - self.footprint.y)
+        self.cols = max(1, (self.bounds.width - self.footprint.width) // cell_size + 1)
+        self.rows = max(1, (self.bounds.height - self.footprint.height) // cell_size + 1)
+        self.blockers = [pygame.Rect(r) for r in blockers]
+        self.walkable = bytearray(self.cols * self.rows)
+        self.version = 0  # bumped whenever walkability changes (invalidates cached paths)
+        self._bake(0, 0, self.cols, self.rows)
+
+    def _body(self, col: int, row: int) -> pygame.Rect:
+        x, y = self.pos_of((col, row))
+        return self.footprint.move(int(x), int(y))
+
+    def _bake(self, col0: int, row0: int, col1: int, row1: int) -> None:
+        blockers = self.blockers
+        for row in range(max(0, row0), min(self.rows, row1)):
+            base = row * self.cols
+            for col in range(max(0, col0), min(self.cols, col1)):
+                self.walkable[base + col] = self._body(col, row).collidelist(blockers) == -1
+        self.version += 1
+
+    def add_blocker(self, rect: pygame.Rect) -> None:
+        """Block rect from now on (e.g. a prop placed mid-scene) and re-bake the cells it affects."""
+        rect = pygame.Rect(rect)
+        self.blockers.append(rect)
+        # positions whose body can touch rect
+        fp = self.footprint
+        c0, r0 = self.cell_of((rect.x - fp.right, rect.y - fp.bottom))
+        c1, r1 = self.cell_of((rect.right - fp.x, rect.bottom - fp.y))
+        self._bake(c0 - 1, r0 - 1, c1 + 2, r1 + 2)
+
+    # --- coordinates ---
+
+    def cell_of(self, pos: Point) -> Cell:
+        """Nearest cell to a position (clamped to the grid)."""
+        col = int(round((pos[0] - self.origin[0]) / self.cell_size))
+        row = int(round((pos[1] - self.origin[1]) / self.cell_size))
+        return min(max(col, 0), self.cols - 1), min(max(row, 0), self.rows - 1)
+
+    def pos_of(self, cell: Cell) -> Point:
+        return (self.origin[0] + cell[0] * self.cell_size,
+                self.origin[1] + cell[1] * self.cell_size)
+
+    def is_walkable(self, cell: Cell) -> bool:
+        col, row = cell
+        return 0 <= col < self.cols and 0 <= row < self.rows and bool(self.walkable[row * self.cols + col])
+
+    def nearest_walkable(self, cell: Cell, radius: int = NEAREST_RADIUS) -> Optional[Cell]:
+        """Closest standable cell to cell within radius rings (cell itself if it is)."""
+        if self.is_walkable(cell):
+            return cell
+        col, row = cell
+        for r in range(1, radius + 1):
+            ring = [(col + dx, row + dy) for dx in range(-r, r + 1) for dy in (-r, r)]
+            ring += [(col + dx, row + dy) for dx in (-r, r) for dy in range(-r + 1, r)]
+            found = [c for c in ring if self.is_walkable(c)]
+            if found:
+                return min(found, key=lambda c: (c[0] - col) ** 2 + (c[1] - row) ** 2)
+        return None
+
+    def line_clear(self, a: Cell, b: Cell) -> bool:
+        """True if every cell on the straight line from a to b is standable."""
+        (x0, y0), (x1, y1) = a, b
+        steps = max(abs(x1 - x0), abs(y1 - y0)) * 2
+        if steps == 0:
+            return self.is_walkable(a)
+        for i in range(steps + 1):
+            t = i / steps
+            # check both cells a half-step straddles so diagonals can't slip between blocks
+            fx, fy = x0 + (x1 - x0) * t, y0 + (y1 - y0) * t
+            for cell in {(math.floor(fx), math.floor(fy)), (math.ceil(fx), math.ceil(fy))}:
+                if not self.is_walkable(cell):
+                    return False
+        return True
+
+
+def _octile(a: Cell, b: Cell) -> float:
+    dx, dy = abs(a[0] - b[0]), abs(a[1] - b[1])
+    return max(dx, dy) + (DIAGONAL - 1) * min(dx, dy)
+
+
+class PathSearch:
+    """One A* query that can be advanced a few expansions at a time."""
+
+    def __init__(self, grid: NavGrid, start: Cell, goal: Cell):
+        self.grid = grid
+        self.start = start
+        self.goal = goal
+        self.done = False
+        self.path: Optional[List[Cell]] = None  # cells from start to goal, None if unreachable
+        self._open = [(_octile(start, goal), 0.0, start)]
+        self._g: Dict[Cell, float] = {start: 0.0}
+        self._came_from: Dict[Cell, Cell] = {}
+        self._closed = set()
+
+    def step(self, max_expansions: int = EXPANSIONS_PER_STEP) -> bool:
+        """Expand up to max_expansions nodes; returns True once the search is finished."""
+        grid, goal = self.grid, self.goal
+        open_heap, g_score, came_from, closed = self._open, self._g, self._came_from, self._closed
+        for _ in range(max_expansions):
+            if not open_heap:
+                self.done = True
+                return True
+            _, g, current = heapq.heappop(open_heap)
+            if current in closed:
+                continue
+            if current == goal:
+                self.path = self._reconstruct(current)
+                self.done = True
+                return True
+            closed.add(current)
+            cx, cy = current
+            for dx, dy, cost in NEIGHBOURS:
+                nxt = (cx + dx, cy + dy)
+                if nxt in closed or not grid.is_walkable(nxt):
+                    continue
+                # no corner cutting: both orthogonal neighbours must be free for a diagonal
+                if dx and dy and not (grid.is_walkable((cx + dx, cy)) and grid.is_walkable((cx, cy + dy))):
+                    continue
+                ng = g + cost
+                if ng < g_score.get(nxt, float('inf')):
+                    g_score[nxt] = ng
+                    came_from[nxt] = current
+                    heapq.heappush(open_heap, (ng + _octile(nxt, goal), ng, nxt))
+        return False
+
+    def _reconstruct(self, cell: Cell) -> List[Cell]:
+        path = [cell]
+        while cell in self._came_from:
+            cell = self._came_from[cell]
+            path.append(cell)
+        path.reverse()
+        return path
+
+
+def smooth_path(grid: NavGrid, cells: List[Cell]) -> List[Cell]:
+    """Drop waypoints that have a clear straight line past them (string pulling)."""
+    if len(cells) <= 2:
+        return list(cells)
+    smoothed = [cells[0]]
+    anchor = 0
+    while anchor < len(cells) - 1:
+        # furthest cell visible from the anchor
+        nxt = anchor + 1
+        for i in range(len(cells) - 1, anchor + 1, -1):
+            if grid.line_clear(cells[anchor], cells[i]):
+                nxt = i
+                break
+        smoothed.append(cells[nxt])
+        anchor = nxt
+    return smoothed
+
+
+class Walker:
+    """A character the Navigator moves: its position list, animations and facing.
+
+    pos is updated in place, so a scene can keep using the list it already
+    draws from (e.g. Walker(self.shani_pos, self.shani_anim)).
+    """
+
+    def __init__(self, pos: list, anim=None, facing: str = 'down'):
+        self.pos = pos
+        self.anim = anim
+        self.facing = facing
+
+    def play(self, name: str) -> None:
+        if self.anim is not None and name in self.anim.animations and self.anim.current != name:
+            self.anim.play(name)
+
+
+class _Walk:
+    __slots__ = ('target', 'speed', 'on_arrive', 'search', 'goal', 'waypoints')
+
+    def __init__(self, target: Point, speed: float, on_arrive):
+        self.target = target
+        self.speed = speed
+        self.on_arrive = on_arrive
+        self.search: Optional[PathSearch] = None
+        self.goal: Optional[Cell] = None
+        self.waypoints: Optional[List[Point]] = None
+
+
+class Navigator:
+    """Moves Walkers along A* paths on one NavGrid."""
+
+    def __init__(self, grid: NavGrid, budget_ms: float = 1.0, speed: float = 180.0):
+        """
+        Args:
+            grid: where walkers can stand
+            budget_ms: time per update() spent on path searches
+            speed: default walking speed in pixels per second
+        """
+        self.grid = grid
+        self.budget_ms = budget_ms
+        self.speed = speed
+        self._walks: 'OrderedDict[Walker, _Walk]' = OrderedDict()
+        self._cache: 'OrderedDict[tuple, List[Cell]]' = OrderedDict()
+        # stats
+        self.searches = 0
+        self.cache_hits = 0
+
+    def walk_to(self, walker: Walker, target: Point, speed: Optional[float] = None,
+                on_arrive: Optional[Callable[[Walker], None]] = None) -> None:
+        """Send walker to target (replacing any walk in progress).
+
+        The path is found during the following update()s; on_arrive(walker)
+        is called once the walker stands on target.
+        """
+        walk = _Walk((float(target[0]), float(target[1])), speed or self.speed, on_arrive)
+        start = self.grid.nearest_walkable(self.grid.cell_of(walker.pos))
+        walk.goal = self.grid.nearest_walkable(self.grid.cell_of(target))
+        if start is None or walk.goal is None:
+            # nowhere to path from or to: walk straight there
+            walk.waypoints = [walk.target]
+        else:
+            cached = self._cached(start, walk.goal)
+            if cached is not None:
+                walk.waypoints = self._waypoints(walker, cached, walk.target)
+            else:
+                walk.search = PathSearch(self.grid, start, walk.goal)
+        self._walks[walker] = walk
+        self._walks.move_to_end(walker)
+
+    def stop(self, walker: Walker) -> None:
+        self._walks.pop(walker, None)
+
+    def is_walking(self, walker: Walker) -> bool:
+        """True while walker has a walk (being planned or under way)."""
+        return walker in self._walks
+
+    def find_path(self, start: Point, target: Point) -> List[Point]:
+        """Waypoints from start to target, searched to completion right away."""
+        start_cell = self.grid.nearest_walkable(self.grid.cell_of(start))
+        goal = self.grid.nearest_walkable(self.grid.cell_of(target))
+        if start_cell is None or goal is None:
+            return [tuple(target)]
+        cells = self._cached(start_cell, goal)
+        if cells is None:
+            search = PathSearch(self.grid, start_cell, goal)
+            while not search.step():
+                pass
+            cells = self._store(search)
+        return [self.grid.pos_of(c) for c in cells[1:]] + [tuple(target)]
+
+    # --- internals ---
+
+    def _cached(self, start: Cell, goal: Cell) -> Optional[List[Cell]]:
+        key = (start, goal, self.grid.version)
+        cells = self._cache.get(key)
+        if cells is not None:
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+        return cells
+
+    def _store(self, search: PathSearch) -> List[Cell]:
+        self.searches += 1
+        # unreachable: go straight for the goal rather than standing still
+        cells = smooth_path(self.grid, search.path) if search.path else [search.start, search.goal]
+        self._cache[(search.start, search.goal, self.grid.version)] = cells
+        while len(self._cache) > PATH_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return cells
+
+    def _waypoints(self, walker: Walker, cells: List[Cell], target: Point) -> List[Point]:
+        # the first cell is where the walker already (about) stands
+        return [self.grid.pos_of(c) for c in cells[1:]] + [target]
+
+    def _plan(self) -> None:
+        """Advance pending searches, oldest first, until the frame's budget is spent."""
+        deadline = time.perf_counter() + self.budget_ms / 1000.0
+        for walker, walk in self._walks.items():
+            if walk.search is None:
+                continue
+            while not walk.search.step():
+                if time.perf_counter() >= deadline:
+                    return
+            walk.waypoints = self._waypoints(walker, self._store(walk.search), walk.target)
+            walk.search = None
+            if time.perf_counter() >= deadline:
+                return
+
+    def update(self, dt: float) -> None:
+        """Plan pending paths within budget, then move every walker along its path."""
+        if not self._walks:
+            return
+        self._plan()
+        arrived = []
+        for walker, walk in self._walks.items():
+            if walk.waypoints is None:
+                continue
+            if self._advance(walker, walk, walk.speed * dt):
+                arrived.append((walker, walk))
+        for walker, walk in arrived:
+            if self._walks.get(walker) is walk:
+                del self._walks[walker]
+            walker.play(f'idle_{walker.facing}')
+            if walk.on_arrive is not None:
+                walk.on_arrive(walker)
+
+    def _advance(self, walker: Walker, walk: _Walk, distance: float) -> bool:
+        """Move walker up to distance along its waypoints; True once it reaches the end."""
+        pos = walker.pos
+        while walk.waypoints:
+            tx, ty = walk.waypoints[0]
+            dx, dy = tx - pos[0], ty - pos[1]
+            remaining = math.hypot(dx, dy)
+            if remaining <= ARRIVE_DISTANCE or remaining <= distance:
+                pos[0], pos[1] = tx, ty
+                distance -= remaining
+                walk.waypoints.pop(0)
+                continue
+            if abs(dx) > abs(dy):
+                walker.facing = 'left' if dx < 0 else 'right'
+            else:
+                walker.facing = 'up' if dy < 0 else 'down'
+            walker.play(f'walk_{walker.facing}')
+            pos[0] += dx / remaining * distance
+            pos[1] += dy / remaining * distance
+            return False
+        return True
@@ -2,6 +2,7 @@ import pygame
 import json
 import re
 import os
+from ..core import assets, profiler
 
 # Need pygame for Rect in load_collision_map
 if not pygame.get_init():
@@ -23,7 +24,7 @@ class TileMap:
         tile_id = 1  # Start from 1 since 0 = empty tile
         for path in tileset_paths:
             if os.path.exists(path):
-                tileset = pygame.image.load(path).convert_alpha()
+                tileset = assets.get(path)
                 self.tilesets.append(tileset)
                 
                 # Extract tiles from this tileset
@@ -59,6 +60,7 @@ class TileMap:
         
         return layer_data
     
+    @profiler.traced('tilemap.draw_layer', 'tilemap')
     def draw_layer(self, surface, layer_data, scale=1.0):
         """Draw a tile layer onto a surface.
         
@@ -150,6 +152,7 @@ def load_collision_map(js_file_path, tile_size=16, scale=1.0):
                     surface.blit(tile_surf, (x, y))
 
 
+@profiler.traced(cat='tilemap')
 def load_dinner_tilemap(dinner_folder_path):
     """Helper function to load the dinner scene tilemap.
     
@@ -188,6 +191,7 @@ def load_dinner_tilemap(dinner_folder_path):
     return layers
 
 
+@profiler.traced(cat='tilemap')
 def load_apartment_tilemap(apartment_folder_path):
     """Helper function to load the apartment scene tilemap from TMJ file.
     